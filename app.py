@@ -1,6 +1,14 @@
+import hashlib
+import json
 import logging
 import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
 
 KST = timezone(timedelta(hours=9))
 
@@ -9,65 +17,300 @@ def today_kst() -> date:
     """KST 기준 오늘 날짜 반환."""
     return datetime.now(KST).date()
 
-import holidays
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MISSED
 from apscheduler.schedulers.background import BackgroundScheduler
 from dotenv import load_dotenv
-from flask import Flask, Response, render_template, send_file, request
+from flask import Flask, Response, g, make_response, render_template, request
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.routing import BaseConverter
 
+import business_calendar
 import cache
 import crawler
+import leader
+import log_setup
+import metrics
 import notifier
 import og_image
+import page_cache
+import poller
+import prerender
+import singleflight
 
 load_dotenv()
 
-# 로깅 설정
-LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(f"{LOG_DIR}/app.log", encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
-)
+# 로깅 설정 (큐 + 백그라운드 리스너, logs/app.log 회전 — log_setup 참고)
+log_setup.configure()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
-KR_HOLIDAYS = holidays.KR()
 
+class CafeteriaConverter(BaseConverter):
+    """설정된 식당 slug(crawler.CAFETERIAS)만 매칭 — 그 외 첫 경로 조각은 404."""
 
-def _is_holiday(d: date) -> bool:
-    return d.weekday() >= 5 or d in KR_HOLIDAYS
+    regex = "(?:" + "|".join(map(re.escape, crawler.CAFETERIAS)) + ")"
 
 
-def _get_menu(target_date: date) -> list[str] | str | None:
-    """메뉴 반환. '휴무' 문자열이면 휴무, None이면 오류/미게시."""
-    date_str = target_date.isoformat()
-    cached = cache.get_menu_cache(date_str)
-    if cached is not None:
-        return cached
+app.url_map.converters["cafeteria"] = CafeteriaConverter
+# 기본 식당은 접두사 없는 경로로 제공 (/<기본 식당>/... 요청은 접두사 없는 경로로 리다이렉트)
+DEFAULT_ROUTE = {"cafeteria": crawler.DEFAULT_CAFETERIA}
+
+# 지연 예산(초). 0보다 크면 stale-while-revalidate 모드:
+# 캐시 미스 시 백그라운드 크롤링을 예산만큼만 기다리고, stale 캐시는 즉시 서빙 후 비동기 갱신
+LATENCY_BUDGET = float(os.getenv("REQUEST_LATENCY_BUDGET", "0"))
+REFRESH_WORKERS = int(os.getenv("REFRESH_WORKERS", "2"))
+
+# 예약 작업(게시물 폴러) 실행 여부. 벤치마크·개발 중 업스트림 요청을 막으려면 false
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+
+# HTTP 캐시 정책 (Cache-Control max-age, 초)
+HTTP_MAX_AGE = int(os.getenv("HTTP_MAX_AGE", "300"))                    # 오늘·이후 날짜, 주간 식단
+HTTP_MAX_AGE_PAST = int(os.getenv("HTTP_MAX_AGE_PAST", "604800"))       # 지난 날짜 (내용이 바뀌지 않음)
+HTTP_MAX_AGE_UNAVAILABLE = int(os.getenv("HTTP_MAX_AGE_UNAVAILABLE", "60"))  # 메뉴 미게시·오류
+
+# OG 이미지를 제공하는 날짜 범위 (오늘 기준 일수). 범위 밖은 렌더링·저장 없이 404
+OG_DATE_MAX_PAST_DAYS = int(os.getenv("OG_DATE_MAX_PAST_DAYS", "365"))
+OG_DATE_MAX_FUTURE_DAYS = int(os.getenv("OG_DATE_MAX_FUTURE_DAYS", "14"))
+# OG 이미지 저장소 GC 시각 (매일, KST)
+OG_GC_HOUR = int(os.getenv("OG_GC_HOUR", "4"))
+
+# JSON API: 캐시에 없는 날짜를 요청 중에 크롤링하는 범위(오늘 기준 ±일수), 범위 조회 최대 일수
+API_CRAWL_WINDOW_DAYS = int(os.getenv("API_CRAWL_WINDOW_DAYS", "7"))
+API_MAX_RANGE_DAYS = int(os.getenv("API_MAX_RANGE_DAYS", "366"))
+
+# /metrics 접근 토큰 (Authorization: Bearer <토큰>). 비우면 누구나 조회 가능
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+# 요청별 프로파일링: X-Profile 헤더가 이 값과 같으면 응답에 Server-Timing 헤더로 구간별 시간을 붙임. 비우면 끔
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+
+_refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="refresh")
+_refreshing: dict[date, Future] = {}
+_refreshing_lock = threading.Lock()
+
+
+def _week_monday(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def _week_days(monday: date) -> list[date]:
+    return [monday + timedelta(days=i) for i in range(5)]
+
+
+def _cafeteria_key(d: date, cafeteria: str) -> str:
+    """식당별 메뉴·네거티브·OG 캐시 키."""
+    return cache.menu_key(d.isoformat(), crawler.cache_namespace(cafeteria))
 
-    if _is_holiday(target_date):
-        cache.save_menu_cache(date_str, "휴무")
-        return "휴무"
 
+def _crawl_week(ref_date: date) -> dict[str, dict[date, list[str]] | None] | None:
+    """모든 식당의 주간 게시물을 한 번 크롤링하여 캐시에 저장. {식당: 주간 메뉴 (상세 페이지 오류면 None)}.
+    목록 페이지 요청 실패 시 None.
+
+    같은 주에 대한 동시 요청은 single-flight로 합쳐 크롤링 1회만 수행 (식당 수와 무관하게 목록 요청 1회).
+    """
+    monday = _week_monday(ref_date)
+    return singleflight.do(
+        f"menu-{monday.isoformat()}",
+        lambda: _crawl_week_uncoalesced(ref_date),
+        recheck=lambda: _recheck_week(monday, ref_date),
+    )
+
+
+def _crawl_week_uncoalesced(ref_date: date) -> dict[str, dict[date, list[str]] | None] | None:
+    monday = _week_monday(ref_date)
+    days = [d for d in _week_days(monday) if not business_calendar.is_closed(d)]
     try:
-        menu = crawler.get_menu_for_date(target_date)
+        results = crawler.get_all_weekly_menus(ref_date)
     except Exception as e:
-        notifier.notify_error(e, f"크롤링 오류 ({date_str})")
+        notifier.notify_error(e, f"크롤링 오류 ({ref_date.isoformat()})")
+        for cafeteria in crawler.CAFETERIAS:
+            for d in days:
+                cache.save_negative_cache(_cafeteria_key(d, cafeteria), cache.CRAWL_ERROR)
         return None
 
-    if menu is None:
+    for cafeteria, weekly in results.items():
+        namespace = crawler.cache_namespace(cafeteria)
+        if weekly is None:
+            notifier.notify_error(
+                crawler.CrawlError("상세 페이지 요청 실패"),
+                f"크롤링 오류 ({crawler.CAFETERIAS[cafeteria]}, {ref_date.isoformat()})",
+            )
+            for d in days:
+                cache.save_negative_cache(_cafeteria_key(d, cafeteria), cache.CRAWL_ERROR)
+            continue
+
+        # 요청한 주의 날짜만 저장 (다른 주 게시물이나 다른 해로 해석된 헤더 날짜가 캐시에 남지 않도록)
+        weekly = results[cafeteria] = {d: menu for d, menu in weekly.items() if _week_monday(d) == monday}
+        # 저장된 해시와 비교해 바뀐 날짜만 다시 씀 (해당 날짜의 OG 이미지·페이지 캐시만 무효화)
+        changed = set(cache.save_weekly_menu_cache(weekly, namespace))
+        # 이번 크롤링에서도 메뉴가 없는 날짜는 '미게시'로 기록해 반복 크롤링 방지
+        for d in days:
+            if not weekly.get(d):
+                cache.save_negative_cache(_cafeteria_key(d, cafeteria), cache.NOT_POSTED)
+
+        # 새로 들어오거나 바뀐 메뉴의 OG 이미지를 백그라운드에서 미리 렌더링
+        title = crawler.CAFETERIAS[cafeteria]
+        prerender.schedule(_prerender_jobs(weekly, changed, cafeteria), namespace, title)
+    return results
+
+
+def _prerender_jobs(
+    weekly: dict[date, list[str]], changed: set[date], cafeteria: str
+) -> dict[date, list[str] | None]:
+    """사전 렌더링 대상: 메뉴가 바뀌었거나 OG 이미지가 없는 날짜, 그리고 같은 주의 휴무일."""
+    title = crawler.CAFETERIAS[cafeteria]
+    jobs: dict[date, list[str] | None] = {}
+    for monday in sorted({_week_monday(d) for d in weekly}):
+        for d in _week_days(monday):
+            key = _cafeteria_key(d, cafeteria)
+            if business_calendar.is_closed(d):
+                if not cache.has_og_cache(key, og_image.render_key(d, title=title)):
+                    jobs[d] = None
+            elif weekly.get(d) and (
+                d in changed or not cache.has_og_cache(key, og_image.render_key(d, weekly[d], title))
+            ):
+                jobs[d] = weekly[d]
+    return jobs
+
+
+def _recheck_week(monday: date, ref_date: date) -> dict[str, dict[date, list[str]]] | None:
+    """다른 프로세스의 크롤링 결과(식당별 메뉴 또는 네거티브 캐시) 확인. 한 식당이라도 결과가 없으면 None."""
+    results = {}
+    for cafeteria in crawler.CAFETERIAS:
+        weekly = cache.get_weekly_menu_cache(monday, crawler.cache_namespace(cafeteria))
+        if weekly:
+            results[cafeteria] = weekly
+        elif cache.get_negative_cache(_cafeteria_key(ref_date, cafeteria)) is not None:
+            results[cafeteria] = {}
+        else:
+            return None
+    return results
+
+
+def _refresh_week_async(ref_date: date) -> Future:
+    """주간 크롤링을 워커 풀에 제출. 같은 주에 진행 중인 작업이 있으면 그 Future 반환."""
+    monday = _week_monday(ref_date)
+    with _refreshing_lock:
+        future = _refreshing.get(monday)
+        if future is None:
+            future = _refresh_pool.submit(_refresh_week_job, ref_date, monday)
+            _refreshing[monday] = future
+    return future
+
+
+def _refresh_week_job(ref_date: date, monday: date) -> dict[str, dict[date, list[str]] | None] | None:
+    try:
+        return _crawl_week(ref_date)
+    finally:
+        with _refreshing_lock:
+            _refreshing.pop(monday, None)
+
+
+def _load_week(ref_date: date, cafeteria: str) -> dict[date, list[str]] | None:
+    """캐시 미스 시 주간 크롤링(모든 식당)하고 해당 식당 결과 반환. 지연 예산 모드면 백그라운드로 돌리고
+    예산만큼만 대기."""
+    if LATENCY_BUDGET <= 0:
+        results = _crawl_week(ref_date)
+    else:
+        future = _refresh_week_async(ref_date)
+        try:
+            results = future.result(timeout=LATENCY_BUDGET)
+        except FutureTimeoutError:
+            logger.info(f"지연 예산 초과 ({ref_date.isoformat()}) — 백그라운드 갱신 후 제공")
+            return None
+    return results.get(cafeteria) if results else None
+
+
+def _cached_menu(d: date, cafeteria: str) -> list[str] | str | None:
+    """캐시된 메뉴 반환. 지연 예산 모드에서 stale 항목이면 백그라운드 갱신 시작."""
+    entry = cache.get_menu_cache_entry(_cafeteria_key(d, cafeteria))
+    if entry is None:
+        return None
+    _revalidate_if_stale(d, entry, cafeteria)
+    return entry["menu"]
+
+
+def _revalidate_if_stale(d: date, entry: dict, cafeteria: str) -> None:
+    # 지난 주 게시물은 목록에서 사라지므로 이번 주 이후 날짜만 갱신
+    if (
+        LATENCY_BUDGET > 0
+        and cache.is_menu_cache_stale(entry)
+        and _week_monday(d) >= _week_monday(today_kst())
+        and cache.get_negative_cache(_cafeteria_key(d, cafeteria)) is None
+    ):
+        _refresh_week_async(d)
+
+
+def _in_date_window(d: date) -> bool:
+    """요청 중 크롤링·OG 렌더링을 하는 날짜 범위 (오늘 -OG_DATE_MAX_PAST_DAYS ~ +OG_DATE_MAX_FUTURE_DAYS)."""
+    today = today_kst()
+    return today - timedelta(days=OG_DATE_MAX_PAST_DAYS) <= d <= today + timedelta(days=OG_DATE_MAX_FUTURE_DAYS)
+
+
+def _get_menu(target_date: date, cafeteria: str) -> list[str] | str | None:
+    """메뉴 반환. '휴무' 문자열이면 휴무, None이면 오류/미게시.
+
+    휴무일은 달력으로 판단하며 캐시를 읽거나 쓰지 않음.
+    캐시에 없는 날짜는 _in_date_window 안에서만 크롤링 (밖이면 네거티브 캐시도 쓰지 않고 None).
+    """
+    if business_calendar.is_closed(target_date):
+        return "휴무"
+
+    key = _cafeteria_key(target_date, cafeteria)
+    cached = _cached_menu(target_date, cafeteria)
+    if cached is not None:
+        return cached
+
+    # 최근에 미게시/오류로 확인된 날짜는 TTL 동안 재크롤링하지 않음
+    if cache.get_negative_cache(key) is not None:
+        return None
+
+    # 임의의 ?d= 날짜로 업스트림 요청·캐시 쓰기가 일어나지 않도록 범위 밖은 크롤링하지 않음
+    if not _in_date_window(target_date):
+        return None
+
+    weekly = _load_week(target_date, cafeteria)
+    if not weekly:
         return None
 
-    cache.save_menu_cache(date_str, menu)
-    return menu
+    return crawler.pick_menu(weekly, target_date)
+
+
+def _get_week_menus(days: list[date], cafeteria: str) -> dict[date, list[str] | str | None]:
+    """여러 날짜의 메뉴 반환. 캐시 미스가 있어도 크롤링은 최대 1회."""
+    result: dict[date, list[str] | str | None] = {}
+    weekly: dict[date, list[str]] | None = None
+
+    namespace = crawler.cache_namespace(cafeteria)
+    entries = cache.get_menu_cache_range(min(days), max(days), namespace) if days else {}
+    for d in days:
+        entry = entries.get(d)
+        if entry is not None:
+            _revalidate_if_stale(d, entry, cafeteria)
+            result[d] = entry["menu"]
+            continue
+        if cache.get_negative_cache(_cafeteria_key(d, cafeteria)) is not None:
+            result[d] = None
+            continue
+        if weekly is None:
+            weekly = _load_week(d, cafeteria) or {}
+        result[d] = weekly.get(d) or None
+
+    return result
+
+
+def _cafeteria_context(cafeteria: str) -> dict:
+    """템플릿 공통 context: 식당 이름, 경로 접두사, 식당 목록(2곳 이상이면 이동 링크 표시)."""
+    return dict(
+        cafeteria_name=crawler.CAFETERIAS[cafeteria],
+        prefix=_cafeteria_prefix(cafeteria),
+        cafeterias=[(name, _cafeteria_prefix(slug)) for slug, name in crawler.CAFETERIAS.items()],
+    )
+
+
+def _cafeteria_prefix(cafeteria: str) -> str:
+    return "" if cafeteria == crawler.DEFAULT_CAFETERIA else f"/{cafeteria}"
 
 
 def _get_base_url() -> str:
@@ -77,8 +320,118 @@ def _get_base_url() -> str:
     return base
 
 
-@app.route("/")
-def index():
+def _template_version() -> str:
+    """템플릿 내용 해시 — 배포로 템플릿이 바뀌면 ETag도 바뀌도록."""
+    digest = hashlib.sha1()
+    for path in sorted(Path(app.root_path, app.template_folder).glob("*.html")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+TEMPLATE_VERSION = _template_version()
+
+
+def _etag(*parts) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def _max_age(d: date, available: bool = True) -> int:
+    if not available:
+        return HTTP_MAX_AGE_UNAVAILABLE
+    if d < today_kst():
+        return HTTP_MAX_AGE_PAST
+    return HTTP_MAX_AGE
+
+
+def _is_not_modified(etag: str, last_modified: float | None) -> bool:
+    """조건부 요청 검사. If-None-Match가 있으면 그것만(약한 비교), 없으면 If-Modified-Since로 판단."""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return int(last_modified) <= request.if_modified_since.timestamp()
+    return False
+
+
+def _cacheable(
+    body_fn, etag: str, last_modified: float | None, max_age: int, weak: bool = False, **response_kwargs
+) -> Response:
+    """검증자와 Cache-Control을 붙인 응답. 변경 없으면 body_fn을 호출하지 않고 304."""
+    if _is_not_modified(etag, last_modified):
+        resp = Response(status=304)
+    else:
+        resp = make_response(body_fn())
+        for key, value in response_kwargs.items():
+            setattr(resp, key, value)
+    resp.set_etag(etag, weak=weak)
+    if last_modified is not None:
+        resp.last_modified = datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = max_age
+    return resp
+
+
+def _page_response(page: page_cache.Page) -> Response:
+    """페이지 캐시 응답. Accept-Encoding에 맞는 미리 압축된 변형을 그대로 전송.
+
+    압축 변형은 같은 내용의 다른 표현이므로 약한 ETag(W/"...")로 보냄.
+    """
+    encoding = page.negotiate(request.accept_encodings)
+    compressed = encoding != page_cache.IDENTITY
+    resp = _cacheable(lambda: page.bodies[encoding], page.etag, page.last_modified, page.max_age, weak=compressed)
+    if compressed and resp.status_code == 200:
+        resp.content_encoding = encoding
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+def _cached_page(key: str, deps: list[str], cafeteria: str) -> Response | None:
+    """페이지 캐시 적중 시 응답 (메뉴 조회·템플릿 렌더링·압축 생략). 미스면 None.
+
+    deps는 식당별 캐시 키, 페이지의 entries는 날짜(isoformat)별 항목.
+    """
+    page = page_cache.get(key, deps)
+    if page is None:
+        return None
+    for date_str, entry in page.entries.items():
+        d = date.fromisoformat(date_str)
+        if cache.is_menu_cache_stale(entry):
+            # 내용이 같은 재크롤링은 신선도만 갱신하므로 렌더링 당시 항목 대신 현재 항목으로 판단
+            entry = cache.get_menu_cache_entry(_cafeteria_key(d, cafeteria)) or entry
+        _revalidate_if_stale(d, entry, cafeteria)
+    return _page_response(page)
+
+
+def _render_page(
+    key: str,
+    snap: page_cache.Snapshot,
+    template: str,
+    context: dict,
+    last_modified: float | None,
+    max_age: int,
+    entries: dict[str, dict] | None,
+) -> Response:
+    """템플릿 응답. 출력은 (템플릿, context)로 결정되므로 그 해시를 ETag로 사용해 렌더링 전에 304 판단.
+
+    entries(렌더링에 쓴 메뉴 캐시 항목)가 있으면 결과를 페이지 캐시에 저장. 메뉴 미게시·오류 페이지는
+    다음 요청이 다시 크롤링 여부를 판단해야 하므로 entries=None으로 캐시하지 않음.
+    """
+    etag = _etag(template, TEMPLATE_VERSION, context)
+
+    def render() -> str:
+        with metrics.timed("template"):
+            return render_template(template, **context)
+
+    if entries is None or _is_not_modified(etag, last_modified):
+        return _cacheable(render, etag, last_modified, max_age)
+    page = page_cache.build(render(), etag, last_modified, max_age, entries)
+    page_cache.put(key, page, snap)
+    return _page_response(page)
+
+
+@app.route("/", defaults=DEFAULT_ROUTE)
+@app.route("/<cafeteria:cafeteria>/")
+def index(cafeteria: str):
     d_param = request.args.get("d")
     if d_param:
         try:
@@ -88,105 +441,407 @@ def index():
     else:
         today = today_kst()
     date_str = today.isoformat()
+    is_holiday = business_calendar.is_closed(today)
+
+    cache_key = _cafeteria_key(today, cafeteria)
+
+    # 렌더링 결과는 대상 날짜의 메뉴 항목에만 의존 (공휴일·주말은 의존 없음)
+    deps = [] if is_holiday else [cache_key]
+    key = f"index|{cafeteria}|{date_str}|{today_kst().isoformat()}|{_get_base_url()}"
+    cached = _cached_page(key, deps, cafeteria)
+    if cached is not None:
+        return cached
+    snap = page_cache.snapshot(deps)
     date_display = _format_date_ko(today)
 
-    if _is_holiday(today):
-        cache.save_menu_cache(date_str, "휴무")
-        return render_template(
-            "index.html",
+    if is_holiday:
+        context = dict(
             is_holiday=True,
+            holiday_reason=business_calendar.closure_reason(today),
             date_str=date_str,
             date_display=date_display,
             menu_items=[],
             base_url=_get_base_url(),
+            **_cafeteria_context(cafeteria),
         )
+        return _render_page(key, snap, "index.html", context, None, _max_age(today), {})
 
-    menu = _get_menu(today)
+    menu = _get_menu(today, cafeteria)
 
     if menu is None:
-        return render_template(
-            "index.html",
+        context = dict(
             is_holiday=False,
             is_not_available=True,
             date_str=date_str,
             date_display=date_display,
             menu_items=[],
             base_url=_get_base_url(),
+            **_cafeteria_context(cafeteria),
         )
+        return _render_page(key, snap, "index.html", context, None, _max_age(today, available=False), None)
+
+    entry = cache.get_menu_cache_entry(cache_key)
+    entries = {date_str: entry} if entry else None
+    last_modified = entry.get("fetched_at") if entry else None
 
     if menu == "휴무":
-        return render_template(
-            "index.html",
+        context = dict(
             is_holiday=True,
             date_str=date_str,
             date_display=date_display,
             menu_items=[],
             base_url=_get_base_url(),
+            **_cafeteria_context(cafeteria),
         )
+        return _render_page(key, snap, "index.html", context, None, _max_age(today), entries)
 
     menu_preview = ", ".join(menu[:3]) + (f" 외 {len(menu) - 3}가지" if len(menu) > 3 else "")
-    return render_template(
-        "index.html",
+    context = dict(
         is_holiday=False,
         date_str=date_str,
         date_display=date_display,
         menu_items=menu,
         menu_preview=menu_preview,
         base_url=_get_base_url(),
+        **_cafeteria_context(cafeteria),
     )
+    return _render_page(key, snap, "index.html", context, last_modified, _max_age(today), entries)
 
 
-@app.route("/weekly")
-def weekly():
+@app.route("/weekly", defaults=DEFAULT_ROUTE)
+@app.route("/<cafeteria:cafeteria>/weekly")
+def weekly(cafeteria: str):
     today = today_kst()
     # 이번 주 월요일 기준
-    monday = today - timedelta(days=today.weekday())
+    monday = _week_monday(today)
+
+    days = _week_days(monday)
+    workdays = [d for d in days if not business_calendar.is_closed(d)]
+    deps = [_cafeteria_key(d, cafeteria) for d in workdays]
+    key = f"weekly|{cafeteria}|{today.isoformat()}|{_get_base_url()}"
+    cached = _cached_page(key, deps, cafeteria)
+    if cached is not None:
+        return cached
+    snap = page_cache.snapshot(deps)
+
+    menus = _get_week_menus(workdays, cafeteria)
 
     week_data = {}
-    for i in range(5):
-        d = monday + timedelta(days=i)
+    for i, d in enumerate(days):
         date_str = d.isoformat()
         day_name = ["월", "화", "수", "목", "금"][i]
 
-        if _is_holiday(d):
+        if business_calendar.is_closed(d):
             week_data[day_name] = {"date": date_str, "menu": None, "is_holiday": True}
             continue
 
-        menu = _get_menu(d)
+        menu = menus.get(d)
         week_data[day_name] = {
             "date": date_str,
             "menu": menu if isinstance(menu, list) else None,
             "is_holiday": menu == "휴무",
         }
 
-    return render_template(
-        "weekly.html",
+    context = dict(
         week_data=week_data,
         today=today.isoformat(),
         base_url=_get_base_url(),
+        **_cafeteria_context(cafeteria),
     )
+    available = all(info["menu"] or info["is_holiday"] for info in week_data.values())
+    stored = cache.get_menu_cache_range(monday, days[-1], crawler.cache_namespace(cafeteria))
+    fetched = [e["fetched_at"] for e in stored.values() if e.get("fetched_at")]
+    entries = {d.isoformat(): stored[d] for d in workdays if d in stored}
+    return _render_page(
+        key,
+        snap,
+        "weekly.html",
+        context,
+        max(fetched) if fetched else None,
+        HTTP_MAX_AGE if available else HTTP_MAX_AGE_UNAVAILABLE,
+        entries if available and len(entries) == len(workdays) else None,
+    )
+
 
+def _png_response(body_fn, etag: str, modified_at: float | None, max_age: int) -> Response:
+    """OG 이미지 응답. ETag는 렌더링 입력(blob key)에서 만들므로 같은 그림이면 PNG 인코딩 프로필이
+    달라도 같은 값 — 바이트가 다를 수 있어 약한 ETag로 보냄. 변경 없으면 body_fn(로드·렌더링)을 호출하지 않음."""
+    return _cacheable(body_fn, etag, modified_at, max_age, weak=True, mimetype="image/png")
 
-@app.route("/og-image/<date_str>.png")
-def og_image_endpoint(date_str: str):
-    cached_path = cache.get_og_cache_path(date_str)
-    if cached_path:
-        return send_file(str(cached_path), mimetype="image/png")
 
+@app.route("/og-image/<date_str>.png", defaults=DEFAULT_ROUTE)
+@app.route("/<cafeteria:cafeteria>/og-image/<date_str>.png")
+def og_image_endpoint(date_str: str, cafeteria: str):
     try:
         target_date = date.fromisoformat(date_str)
     except ValueError:
         return Response("Invalid date", status=400)
+    # 임의 날짜 요청으로 크롤링·렌더링·저장이 일어나지 않도록 제공 범위 밖은 거부
+    if not _in_date_window(target_date):
+        return Response("Date out of range", status=404)
+
+    menu = _get_menu(target_date, cafeteria)
+    is_rest = menu is None or menu == "휴무"
+    # 메뉴를 아직 못 가져온 경우(미게시·오류·지연 예산 초과)는 임시 이미지이므로 캐시하지 않음
+    available = menu is not None
+
+    # 블롭 key는 렌더링 입력(식당 이름 포함)의 해시이므로 메뉴가 바뀌면 이전 이미지는 적중하지 않음
+    title = crawler.CAFETERIAS[cafeteria]
+    cache_key = _cafeteria_key(target_date, cafeteria)
+    blob_key = og_image.render_key(target_date, None if is_rest else menu, title)
+    etag = blob_key[:20]
+    max_age = _max_age(target_date, available)
+
+    def load() -> tuple[bytes, float | None]:
+        return _og_png(target_date, menu, is_rest, title, cache_key, blob_key, available)
+
+    # ETag는 PNG 없이 정해지므로, If-None-Match 재검증은 이미지를 읽거나 렌더링하기 전에 판단
+    if request.if_none_match:
+        return _png_response(lambda: load()[0], etag, None, max_age)
+
+    png_bytes, modified_at = load()
+    return _png_response(lambda: png_bytes, etag, modified_at, max_age)
+
+
+def _og_png(
+    target_date: date,
+    menu: list[str] | str | None,
+    is_rest: bool,
+    title: str,
+    cache_key: str,
+    blob_key: str,
+    available: bool,
+) -> tuple[bytes, float | None]:
+    """(PNG, 저장 시각). 캐시에 없으면 렌더링 — 같은 렌더링 입력의 동시 요청은 1회로 합침."""
+    if available:
+        cached = cache.get_og_cache_entry(cache_key, blob_key)
+        if cached is not None:
+            return cached
+
+    png_bytes = singleflight.do(
+        f"og-{blob_key}",
+        lambda: _render_og_image(target_date, menu, is_rest, title, cache_key, blob_key if available else None),
+        recheck=lambda: cache.get_og_cache(cache_key, blob_key) if available else None,
+    )
+    return png_bytes, None
+
+
+def _render_og_image(
+    target_date: date,
+    menu: list[str] | str | None,
+    is_rest: bool,
+    title: str,
+    cache_key: str,
+    blob_key: str | None,
+) -> bytes:
+    """OG 이미지 렌더링. blob_key가 있으면 캐시에 저장하며, 같은 블롭이 이미 있으면 렌더링 없이 연결."""
+    if blob_key is not None:
+        png_bytes = cache.link_og_cache(cache_key, blob_key)
+        if png_bytes is not None:
+            return png_bytes
+
+    if is_rest:
+        png_bytes = og_image.generate_rest_image(target_date, title=title)
+    else:
+        png_bytes = og_image.generate_menu_image(target_date, menu, title=title)
+
+    if blob_key is not None:
+        cache.save_og_cache(cache_key, blob_key, png_bytes)
+    return png_bytes
+
+
+# JSON API 메뉴 상태
+API_OK = "ok"                      # 메뉴 있음
+API_HOLIDAY = "holiday"            # 주말·공휴일·학교 휴무일 (business_calendar)
+API_CLOSED = "closed"              # 평일이지만 게시물에 휴무로 기재
+API_NOT_POSTED = cache.NOT_POSTED  # 게시물 미게시 (네거티브 캐시)
+API_ERROR = cache.CRAWL_ERROR      # 최근 크롤링 오류 (네거티브 캐시)
+API_NOT_CACHED = "not_cached"      # 캐시에 없고 크롤링 범위 밖 (또는 지연 예산 초과)
+
+
+def _api_record(d: date, entry: dict | None, negative: dict | None) -> dict:
+    """날짜 하나의 API 응답 레코드. 휴무일은 페이지와 같이 달력이 우선 (게시물에 메뉴가 있어도)."""
+    if business_calendar.is_closed(d):
+        status = API_HOLIDAY
+    elif entry is not None and isinstance(entry["menu"], list):
+        status = API_OK
+    elif entry is not None:
+        status = API_CLOSED
+    elif negative is not None:
+        status = negative["status"]
+    else:
+        status = API_NOT_CACHED
+    fetched_at = entry.get("fetched_at") if entry else None
+    return {
+        "date": d.isoformat(),
+        "status": status,
+        "items": entry["menu"] if status == API_OK else [],
+        "fetched_at": datetime.fromtimestamp(fetched_at, KST).isoformat(timespec="seconds") if fetched_at else None,
+        "hash": entry["hash"] if entry else None,
+    }
+
+
+def _api_records(start: date, end: date, cafeteria: str) -> tuple[list[dict], float | None]:
+    """기간 내 API 레코드와 최신 수집 시각. 메뉴·네거티브 캐시는 기간 전체를 한 번에 읽음.
+
+    캐시에 없는 평일은 오늘 ±API_CRAWL_WINDOW_DAYS 안에서만 크롤링하며, 주당 최대 1회.
+    """
+    namespace = crawler.cache_namespace(cafeteria)
+    entries = cache.get_menu_cache_range(start, end, namespace)
+    negatives = cache.get_negative_cache_range(start, end, namespace)
+    today = today_kst()
+    window = (today - timedelta(days=API_CRAWL_WINDOW_DAYS), today + timedelta(days=API_CRAWL_WINDOW_DAYS))
+    crawled: set[date] = set()
+
+    records = []
+    for d in (start + timedelta(days=i) for i in range((end - start).days + 1)):
+        entry = entries.get(d)
+        monday = _week_monday(d)
+        if entry is not None:
+            _revalidate_if_stale(d, entry, cafeteria)
+        elif (
+            not business_calendar.is_closed(d)
+            and d not in negatives
+            and window[0] <= d <= window[1]
+            and monday not in crawled
+        ):
+            crawled.add(monday)
+            _load_week(d, cafeteria)
+            week_start, week_end = max(start, monday), min(end, monday + timedelta(days=6))
+            entries.update(cache.get_menu_cache_range(week_start, week_end, namespace))
+            negatives.update(cache.get_negative_cache_range(week_start, week_end, namespace))
+            entry = entries.get(d)
+        records.append(_api_record(d, entry, negatives.get(d)))
+
+    fetched = [e["fetched_at"] for e in entries.values() if e.get("fetched_at")]
+    return records, max(fetched) if fetched else None
+
+
+def _api_max_age(records: list[dict], end: date) -> int:
+    if any(r["status"] not in (API_OK, API_HOLIDAY, API_CLOSED) for r in records):
+        return HTTP_MAX_AGE_UNAVAILABLE
+    return _max_age(end)
+
+
+def _api_error(message: str, status: int = 400) -> Response:
+    return Response(
+        json.dumps({"error": message}, ensure_ascii=False), status=status, mimetype="application/json"
+    )
 
-    menu = _get_menu(target_date)
 
-    if menu is None or menu == "휴무" or _is_holiday(target_date):
-        png_bytes = og_image.generate_rest_image(target_date)
-    else:
-        png_bytes = og_image.generate_menu_image(target_date, menu)
+def _parse_api_date(value: str | None, name: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{name}' 값은 YYYY-MM-DD 형식이어야 합니다") from None
+
+
+@app.route("/api/menu/<date_str>", defaults=DEFAULT_ROUTE)
+@app.route("/<cafeteria:cafeteria>/api/menu/<date_str>")
+def api_menu(date_str: str, cafeteria: str):
+    """날짜 하나의 메뉴 (JSON 객체)."""
+    try:
+        target_date = _parse_api_date(date_str, "date")
+    except ValueError as e:
+        return _api_error(str(e))
+
+    records, last_modified = _api_records(target_date, target_date, cafeteria)
+    record = records[0]
+    body = json.dumps(record, ensure_ascii=False)
+    return _cacheable(
+        lambda: body,
+        _etag("api", cafeteria, record),
+        last_modified,
+        _api_max_age(records, target_date),
+        mimetype="application/json",
+    )
+
+
+@app.route("/api/menu", defaults=DEFAULT_ROUTE)
+@app.route("/<cafeteria:cafeteria>/api/menu")
+def api_menu_range(cafeteria: str):
+    """기간(from~to, 양끝 포함)의 메뉴를 날짜당 한 줄 NDJSON으로 스트리밍."""
+    try:
+        start = _parse_api_date(request.args.get("from"), "from")
+        end = _parse_api_date(request.args.get("to", request.args.get("from")), "to")
+    except ValueError as e:
+        return _api_error(str(e))
+    if end < start:
+        return _api_error("'to' 값은 'from' 값보다 이전일 수 없습니다")
+    if (end - start).days + 1 > API_MAX_RANGE_DAYS:
+        return _api_error(f"조회 기간은 최대 {API_MAX_RANGE_DAYS}일입니다")
+
+    records, last_modified = _api_records(start, end, cafeteria)
+
+    # ETag는 레코드(수집 시각·해시 포함)로 계산 — 304면 직렬화하지 않음
+    def lines():
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    return _cacheable(
+        lines,
+        _etag("api-range", cafeteria, records),
+        last_modified,
+        _api_max_age(records, end),
+        mimetype="application/x-ndjson",
+    )
+
 
-    cache.save_og_cache(date_str, png_bytes)
-    return Response(png_bytes, mimetype="image/png")
+# 프록시가 넘긴 요청 ID는 이 형식일 때만 그대로 씀 (로그 주입 방지)
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+@app.before_request
+def _start_timing():
+    g.request_started = time.perf_counter()
+    request_id = request.headers.get("X-Request-ID", "")
+    g.request_id = request_id if _REQUEST_ID.match(request_id) else uuid.uuid4().hex[:16]
+    g.log_token = log_setup.start_request(g.request_id)
+    if PROFILE_TOKEN and request.headers.get("X-Profile") == PROFILE_TOKEN:
+        g.profile_token = metrics.profile()
+
+
+@app.after_request
+def _record_timing(resp: Response) -> Response:
+    elapsed = time.perf_counter() - g.request_started
+    metrics.HTTP_REQUEST_DURATION.observe(elapsed, endpoint=request.endpoint or "unmatched", status=resp.status_code)
+    resp.headers["X-Request-ID"] = g.request_id
+    if log_setup.LOG_ACCESS:
+        log_setup.access_logger.info(
+            f"{request.method} {request.full_path.rstrip('?')} {resp.status_code} {elapsed * 1000:.1f}ms",
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status": resp.status_code,
+                "duration_ms": round(elapsed * 1000, 1),
+            },
+        )
+    token = g.pop("profile_token", None)
+    if token is not None:
+        resp.headers["Server-Timing"] = metrics.server_timing(metrics.end_profile(token), elapsed)
+    return resp
+
+
+@app.teardown_request
+def _end_profile(exc):
+    # 예외로 after_request를 건너뛴 경우에도 프로파일·로그 컨텍스트를 닫음 (스레드 재사용 시 새지 않도록)
+    token = g.pop("profile_token", None)
+    if token is not None:
+        metrics.end_profile(token)
+    log_token = g.pop("log_token", None)
+    if log_token is not None:
+        log_setup.end_request(log_token)
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Prometheus 텍스트 형식 지표 (모든 워커 합산)."""
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        return Response("Unauthorized", status=401)
+    resp = Response(metrics.render(), mimetype="text/plain")
+    resp.headers["Content-Type"] = "text/plain; version=0.0.4; charset=utf-8"
+    resp.cache_control.no_store = True
+    return resp
 
 
 def _format_date_ko(d: date) -> str:
@@ -194,56 +849,66 @@ def _format_date_ko(d: date) -> str:
     return f"{d.year}년 {d.month}월 {d.day}일 ({weekdays[d.weekday()]})"
 
 
-def _scheduled_cache_refresh():
-    """매일 오전 10:50 오늘의 메뉴를 미리 크롤링해서 캐시에 저장."""
-    today = today_kst()
-    date_str = today.isoformat()
+_scheduler: BackgroundScheduler | None = None
 
-    if _is_holiday(today):
-        logger.info(f"[스케줄러] {date_str} 휴무 — 크롤링 스킵")
-        return
 
-    # 이미 캐시 있으면 스킵
-    if cache.get_menu_cache(date_str) is not None:
-        logger.info(f"[스케줄러] {date_str} 캐시 이미 존재 — 스킵")
-        return
+def _gc_og_cache():
+    # 이번 주 이후 이미지는 공유 미리보기로 계속 요청되므로 예산 축출 대상에서 제외
+    cache.gc_og_cache(keep_from=_week_monday(today_kst()))
 
-    logger.info(f"[스케줄러] {date_str} 메뉴 크롤링 시작")
-    try:
-        menu = crawler.get_menu_for_date(today)
-        if menu:
-            cache.save_menu_cache(date_str, menu)
-            # OG 이미지도 미리 생성
-            png_bytes = og_image.generate_menu_image(today, menu)
-            cache.save_og_cache(date_str, png_bytes)
-            logger.info(f"[스케줄러] {date_str} 캐시 완료 ({len(menu)}개 메뉴)")
-        else:
-            logger.warning(f"[스케줄러] {date_str} 메뉴 없음 (미게시 또는 오류)")
-    except Exception as e:
-        notifier.notify_error(e, f"스케줄러 크롤링 오류 ({date_str})")
+
+def _on_job_event(event) -> None:
+    if event.code == EVENT_JOB_MISSED:
+        outcome = "missed"
+    else:
+        outcome = "error" if event.exception else "ok"
+    metrics.SCHEDULER_JOBS.inc(job=event.job_id, outcome=outcome)
 
 
 def _start_scheduler():
+    global _scheduler
     scheduler = BackgroundScheduler(timezone="Asia/Seoul")
-    scheduler.add_job(
-        _scheduled_cache_refresh,
-        trigger="cron",
-        hour=10,
-        minute=50,
-        id="daily_menu_refresh",
-    )
+    scheduler.add_listener(_on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
     scheduler.start()
-    logger.info("[스케줄러] 시작 — 매일 오전 10:50 자동 갱신")
+    # 게시 시간대에 이번 주 게시물을 폴링해 수집 (요청 시 크롤링은 폴러가 놓친 경우의 대비책)
+    poller.start(scheduler, crawl_week=_crawl_week)
+    # OG 이미지 저장소 정리 (디스크 예산 초과 시 지난 날짜부터 축출, 고아 블롭 삭제, 압축)
+    scheduler.add_job(_gc_og_cache, trigger="cron", hour=OG_GC_HOUR, minute=0, id="og_gc", replace_existing=True)
+    _scheduler = scheduler
+    logger.info(
+        f"[스케줄러] 시작 — 평일 {poller.POLL_WINDOW_START:%H:%M}~{poller.POLL_WINDOW_END:%H:%M} 게시물 폴링"
+    )
     return scheduler
 
 
+_runtime_started = False
+_runtime_lock = threading.Lock()
+
+
+def create_app() -> Flask:
+    """WSGI 앱 팩토리. 운영 서버는 워커마다 이 함수로 앱을 로드합니다 (gunicorn "app:create_app()").
+
+    프로세스당 한 번 폰트를 확인하고, cache/ 볼륨의 리더 잠금을 잡은 프로세스에서만 스케줄러를 시작.
+    """
+    global _runtime_started
+    with _runtime_lock:
+        if not _runtime_started:
+            _runtime_started = True
+            og_image.check_fonts()
+            if SCHEDULER_ENABLED:
+                leader.run_when_leader(_start_scheduler)
+    return app
+
+
 if __name__ == "__main__":
+    # 개발 서버 (운영은 gunicorn — gunicorn.conf.py 참고)
     host = os.getenv("FLASK_HOST", "0.0.0.0")
     port = int(os.getenv("FLASK_PORT", "5005"))
     debug = os.getenv("FLASK_DEBUG", "false").lower() == "true"
 
-    scheduler = _start_scheduler()
+    create_app()
     try:
         app.run(host=host, port=port, debug=debug, use_reloader=False)
     finally:
-        scheduler.shutdown()
+        if _scheduler is not None:
+            _scheduler.shutdown()
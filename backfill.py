@@ -0,0 +1,204 @@
+"""지난 주간 게시물 백필.
+
+평소 크롤링은 목록 1페이지의 첫 게시물(이번 주)만 보므로, 지난 날짜는 캐시에 없으면 "메뉴 정보 없음"이 됩니다.
+백필은 게시판 목록을 페이지 단위로 거슬러 올라가며 CAFETERIAS의 모든 식당 게시물을 찾아
+상세 페이지를 병렬(BACKFILL_CONCURRENCY)로 가져와 파싱하고 식당별 메뉴 캐시에 저장합니다.
+
+- 요청 속도: 목록·상세 요청을 합쳐 초당 BACKFILL_RATE회 이하 (스레드 간 공유)
+- 연도: 헤더에는 연도가 없으므로 게시물 작성일을 기준으로 가장 가까운 연도로 해석 (연말·연초 주 포함)
+- 같은 식당·날짜를 다룬 게시물이 여럿이면(정정 게시 등) 작성일이 가장 늦은 게시물의 메뉴를 씀
+- 체크포인트: 끝난 페이지·게시물을 크롤러 상태 저장소에 남겨, 중단 후 다시 실행하면 이어서 진행.
+  전체를 한 번 마친 뒤 다시 실행하면 이미 처리한 게시물만 있는 페이지에서 멈춤 (새 게시물만 추가)
+
+    uv run python scripts/backfill.py [--since 2025-03-01] [--max-pages N] [--restart]
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+
+import cache
+import crawler
+
+BACKFILL_CONCURRENCY = int(os.getenv("BACKFILL_CONCURRENCY", "4"))
+BACKFILL_RATE = float(os.getenv("BACKFILL_RATE", "2"))
+
+STATE_KEY = "backfill"
+# 게시물은 보통 해당 주 직전에 올라오므로, since보다 이만큼 먼저 작성된 게시물까지 확인
+POSTED_LEAD = timedelta(days=14)
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """스레드 간 공유 요청 간격 제한. rate: 초당 최대 요청 수 (0 이하면 제한 없음)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _new_checkpoint() -> dict:
+    return {
+        "target": crawler.TARGET_URL,
+        "cafeterias": crawler.CAFETERIAS,
+        "next_page": 1,
+        "finished": False,
+        "done": {},      # {게시물 URL: 저장한 날짜 수}
+        "failed": {},    # {게시물 URL: [작성일, 식당]} — 다음 실행에서 먼저 재시도
+        "claimed": {},   # {캐시 키(식당/날짜): 그 메뉴를 쓴 게시물의 작성일}
+    }
+
+
+def load_checkpoint() -> dict | None:
+    """현재 대상(TARGET_URL, 식당 구성)의 체크포인트. 없으면 None."""
+    state = cache.get_crawl_state(STATE_KEY)
+    if not state or state.get("target") != crawler.TARGET_URL or state.get("cafeterias") != crawler.CAFETERIAS:
+        return None
+    return state
+
+
+def _fetch_post(session, limiter: RateLimiter, post: crawler.BoardPost) -> dict[date, list[str]]:
+    """워커 스레드에서 실행. 상세 페이지를 가져와 파싱 (작성일 기준으로 연도 해석).
+
+    앱의 크롤링과 같은 경로(재시도, 조건부 요청, 파싱 결과 재사용)를 씀. 요청 실패 시 CrawlError.
+    """
+    limiter.wait()
+    return crawler.parse_weekly_table(post.url, session, post.posted or date.today())
+
+
+def _store(state: dict, post: crawler.BoardPost, weekly: dict[date, list[str]]) -> int:
+    """파싱 결과 중 더 늦게 작성된 게시물이 이미 쓴 날짜를 빼고 저장. 저장 대상 날짜 수 반환."""
+    posted = post.posted.isoformat() if post.posted else ""
+    namespace = crawler.cache_namespace(post.cafeteria)
+    claimed = state["claimed"]
+    selected = {}
+    for d, menu in weekly.items():
+        key = cache.menu_key(d.isoformat(), namespace)
+        if menu and claimed.get(key, "") <= posted:
+            selected[d] = menu
+            claimed[key] = posted
+    if selected:
+        cache.save_weekly_menu_cache(selected, namespace)
+    return len(selected)
+
+
+def run(
+    since: date | None = None,
+    max_pages: int | None = None,
+    concurrency: int = BACKFILL_CONCURRENCY,
+    rate: float = BACKFILL_RATE,
+    restart: bool = False,
+) -> dict[str, int]:
+    """백필 실행. 체크포인트가 있으면 이어서 진행.
+
+    since: 이 날짜 이전 주의 게시물이 나오면 더 거슬러 올라가지 않음
+    max_pages: 이번 실행에서 가져올 목록 페이지 수 상한
+
+    Raises:
+        crawler.CrawlError: 목록 페이지 요청 실패 (그때까지의 진행은 체크포인트에 남음).
+    """
+    state = None if restart else load_checkpoint()
+    if state is None:
+        state = _new_checkpoint()
+    # 한 번 끝까지 마친 뒤의 실행은 새 게시물만 추가 (1페이지부터 이미 처리한 게시물이 나올 때까지)
+    catch_up = state["finished"]
+    if catch_up:
+        state["next_page"] = 1
+
+    session = crawler.get_session()
+    limiter = RateLimiter(rate)
+    summary = {"pages": 0, "posts": 0, "days": 0, "failed": 0}
+    cutoff = since - POSTED_LEAD if since else None
+
+    # 페이지 순서대로 완료 처리해야 체크포인트(next_page)가 정확하므로 페이지별 Future 묶음을 큐로 관리
+    inflight: deque[tuple[int, list[tuple[crawler.BoardPost, Future]]]] = deque()
+
+    def drain(limit: int) -> None:
+        while len(inflight) > limit:
+            page, jobs = inflight.popleft()
+            for post, future in jobs:
+                try:
+                    weekly = future.result()
+                except Exception as e:
+                    logger.warning(f"[백필] 게시물 실패 {post.url}: {e}")
+                    state["failed"][post.url] = [post.posted.isoformat() if post.posted else None, post.cafeteria]
+                    summary["failed"] += 1
+                    continue
+                days = _store(state, post, weekly)
+                state["done"][post.url] = days
+                state["failed"].pop(post.url, None)
+                summary["posts"] += 1
+                summary["days"] += days
+                logger.info(f"[백필] {post.title} ({post.posted}) — {days}일 저장")
+            if page is not None:
+                state["next_page"] = page + 1
+            cache.save_crawl_state(STATE_KEY, state)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="backfill") as pool:
+        def submit(posts: list[crawler.BoardPost]) -> list[tuple[crawler.BoardPost, Future]]:
+            return [(post, pool.submit(_fetch_post, session, limiter, post)) for post in posts]
+
+        # 지난 실행에서 실패한 게시물 먼저 재시도
+        retry = [
+            crawler.BoardPost(url, "(재시도)", date.fromisoformat(posted) if posted else None, cafeteria)
+            for url, (posted, cafeteria) in state["failed"].items()
+            if cafeteria in crawler.CAFETERIAS
+        ]
+        if retry:
+            inflight.append((None, submit(retry)))
+
+        page = state["next_page"]
+        complete = False
+        try:
+            while max_pages is None or summary["pages"] < max_pages:
+                limiter.wait()
+                try:
+                    html = crawler.fetch_page(session, crawler.list_page_url(page))
+                except crawler.CrawlError:
+                    raise crawler.CrawlError(f"목록 페이지 요청 실패: {page}페이지")
+                summary["pages"] += 1
+
+                posts = crawler.find_posts(html)
+                pending = [p for p in posts if p.url not in state["done"]]
+                if cutoff is not None:
+                    pending = [p for p in pending if p.posted is None or p.posted >= cutoff]
+                inflight.append((page, submit(pending)))
+                # 앞선 페이지가 끝났으면 체크포인트 갱신 (동시에 진행하는 페이지 수 제한)
+                drain(limit=max(1, concurrency))
+
+                has_next = any(n > page for n in crawler.find_page_numbers(html))
+                reached_since = cutoff is not None and posts and all(
+                    p.posted is not None and p.posted < cutoff for p in posts
+                )
+                caught_up = catch_up and posts and not pending
+                if not has_next or caught_up:
+                    complete = True
+                    break
+                if reached_since:
+                    # 더 오래된 페이지는 since 없이 다시 실행하면 다음 페이지부터 이어서 진행
+                    break
+                page += 1
+        finally:
+            drain(limit=0)
+
+    if complete:
+        state["finished"] = True
+        state["next_page"] = 1
+    cache.save_crawl_state(STATE_KEY, state)
+    logger.info(f"[백필] {'완료' if complete else '중단 (다시 실행하면 이어서 진행)'}: {summary}")
+    summary["complete"] = int(complete)
+    return summary
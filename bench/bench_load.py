@@ -0,0 +1,264 @@
+"""점심시간 공유 폭주 부하 테스트 (스텁 게시판 기반).
+
+카카오톡 공유 직후처럼 여러 클라이언트가 동시에 `/`, `/weekly`, `/og-image/<date>.png`를 요청하는 상황을
+재현합니다. 모든 워커가 동시에 출발해(배리어) 총 --requests건을 --concurrency개 연결로 나눠 보내고,
+라우트별 지연 분포(p50/p90/p99/max)·처리량·오류율과 그동안 스텁 게시판이 받은 업스트림 요청 수
+(N건당 목록·상세 요청)를 보고합니다. 크롤링 합치기(single-flight)나 캐시가 깨지면 업스트림 요청 수가 늘어납니다.
+
+- 대상: inprocess(Flask 테스트 클라이언트, 같은 프로세스의 스레드) | dev(python app.py) | gunicorn
+- 캐시 상태: cold(빈 캐시에서 폭주 시작) | warm(각 경로를 한 번씩 미리 요청해 캐시를 채운 뒤 측정)
+- 요청 비율: --mix index=5,weekly=2,og=3 (가중치)
+
+    uv run python bench/bench_load.py [--target inprocess|dev|gunicorn] [--concurrency 32] [--requests 1000]
+        [--warmth cold|warm] [--mix index=5,weekly=2,og=3] [--latency 0.2] [--failure-rate 0]
+        [--per 1000] [--output load.json]
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import stub_site  # noqa: E402
+from bench_serving import free_port, start_server  # noqa: E402
+from bench_suite import this_monday  # noqa: E402
+
+HEADERS = {"Accept-Encoding": "gzip"}
+
+
+def parse_mix(raw: str) -> dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def route_paths(day: date) -> dict[str, str]:
+    return {
+        "index": f"/?d={day.isoformat()}",
+        "weekly": "/weekly",
+        "og": f"/og-image/{day.isoformat()}.png",
+    }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def inprocess_sender(app) -> Callable[[], Callable[[str], int]]:
+    """워커마다 테스트 클라이언트를 하나씩 만드는 팩토리. 요청 함수는 상태 코드를 반환."""
+    def make() -> Callable[[str], int]:
+        client = app.test_client()
+
+        def send(path: str) -> int:
+            resp = client.get(path, headers=HEADERS)
+            resp.get_data()
+            return resp.status_code
+        return send
+    return make
+
+
+def http_sender(port: int) -> Callable[[], Callable[[str], int]]:
+    """워커마다 keep-alive 연결을 하나씩 쓰는 팩토리. 연결 오류는 0을 반환."""
+    def make() -> Callable[[str], int]:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+
+        def send(path: str) -> int:
+            nonlocal conn
+            try:
+                conn.request("GET", path, headers=HEADERS)
+                resp = conn.getresponse()
+                resp.read()
+                return resp.status
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                return 0
+        return send
+    return make
+
+
+def run_burst(make_sender, plan: list[tuple[str, str]], concurrency: int) -> tuple[dict, float]:
+    """plan[(라우트, 경로)]을 concurrency개 워커가 동시에 출발해 나눠 보냄. ({라우트: [(초, 상태)]}, 경과 초)."""
+    samples: dict[str, list[tuple[float, int]]] = defaultdict(list)
+    lock = threading.Lock()
+    cursor = iter(range(len(plan)))
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker():
+        send = make_sender()
+        local: list[tuple[str, float, int]] = []
+        barrier.wait()
+        while True:
+            with lock:
+                i = next(cursor, None)
+            if i is None:
+                break
+            route, path = plan[i]
+            start = time.perf_counter()
+            status = send(path)
+            local.append((route, time.perf_counter() - start, status))
+        with lock:
+            for route, elapsed, status in local:
+                samples[route].append((elapsed, status))
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples: dict[str, list[tuple[float, int]]], elapsed: float, hits: Counter, per: int) -> dict:
+    total = sum(len(v) for v in samples.values())
+    routes = {}
+    for route in sorted(samples):
+        latencies = sorted(e for e, _ in samples[route])
+        statuses = Counter(s for _, s in samples[route])
+        errors = sum(n for s, n in statuses.items() if s == 0 or s >= 500)
+        routes[route] = {
+            "requests": len(latencies),
+            "p50_ms": round(percentile(latencies, 0.5) * 1000, 2),
+            "p90_ms": round(percentile(latencies, 0.9) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+            "statuses": {str(s): n for s, n in sorted(statuses.items())},
+        }
+    upstream = {kind: hits.get(kind, 0) for kind in ("list", "post", "failed")}
+    return {
+        "requests": total,
+        "duration_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "routes": routes,
+        "upstream": upstream,
+        f"upstream_per_{per}": {k: round(v * per / total, 2) if total else 0.0 for k, v in upstream.items()},
+    }
+
+
+def print_report(report: dict, per: int) -> None:
+    print(f"{'라우트':<8} {'요청':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} {'오류율':>7}")
+    for route, r in report["routes"].items():
+        print(
+            f"{route:<8} {r['requests']:>6} {r['p50_ms']:>7.1f}ms {r['p90_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms"
+            f" {r['max_ms']:>7.1f}ms {r['error_rate']:>7.2%}"
+        )
+    up = report["upstream"]
+    per_n = report[f"upstream_per_{per}"]
+    print(f"전체 {report['requests']}건, {report['duration_s']:.2f}초, {report['rps']:.0f} 요청/초")
+    print(
+        f"업스트림 요청: 목록 {up['list']}, 상세 {up['post']}, 실패(503) {up['failed']}"
+        f" — {per}건당 목록 {per_n['list']}, 상세 {per_n['post']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["inprocess", "dev", "gunicorn"], default="inprocess", help="부하 대상")
+    parser.add_argument("--workers", type=int, default=0, help="gunicorn 워커 수 (0이면 gunicorn.conf.py 기본값)")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 연결(워커 스레드) 수")
+    parser.add_argument("--requests", type=int, default=1000, help="총 요청 수")
+    parser.add_argument("--warmth", choices=["cold", "warm"], default="cold", help="시작 시 캐시 상태")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("index=5,weekly=2,og=3"), help="라우트별 가중치")
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="/?d=, OG 이미지 날짜 (기본: 이번 주 월요일)")
+    parser.add_argument("--latency", type=float, default=0.2, help="스텁 게시판 응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="스텁 게시판 503 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="요청 순서·장애 주입 난수 시드")
+    parser.add_argument("--per", type=int, default=1000, help="업스트림 요청 수를 이 요청 수당으로 환산")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+    output = args.output.resolve() if args.output else None
+
+    paths = route_paths(args.date or this_monday())
+    unknown = set(args.mix) - set(paths)
+    if unknown:
+        parser.error(f"알 수 없는 라우트: {', '.join(sorted(unknown))} (가능: {', '.join(paths)})")
+    rng = random.Random(args.seed)
+    routes = rng.choices(list(args.mix), weights=list(args.mix.values()), k=args.requests)
+    plan = [(route, paths[route]) for route in routes]
+
+    stub, target_url = stub_site.serve(
+        weeks=4, latest=this_monday(), latency=args.latency, failure_rate=args.failure_rate, seed=args.seed
+    )
+    env = {"TARGET_URL": target_url, "SCHEDULER_ENABLED": "false", "BASE_URL": "http://bench"}
+    proc = None
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        os.symlink(ROOT / "static", workdir / "static")  # 폰트(static/fonts)는 저장소 것을 그대로 사용
+        cwd = os.getcwd()
+        prerender = None
+        try:
+            if args.target == "inprocess":
+                # 모듈 설정이 import 시점에 환경 변수에서 읽히므로 먼저 지정
+                os.environ.update(env)
+                os.chdir(workdir)
+                import app as app_module
+                import prerender
+
+                logging.disable(logging.CRITICAL)
+                make_sender = inprocess_sender(app_module.create_app())
+            else:
+                port = free_port()
+                proc = start_server(args.target, workdir, port, args.workers, env)
+                make_sender = http_sender(port)
+
+            if args.warmth == "warm":
+                send = make_sender()
+                for path in paths.values():
+                    send(path)
+            stub.faults.reset()
+
+            samples, elapsed = run_burst(make_sender, plan, args.concurrency)
+            report = summarize(samples, elapsed, stub.faults.hits, args.per)
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait(timeout=30)
+            if prerender is not None:
+                # 임시 디렉터리를 지우기 전에 사전 렌더링 스레드·프로세스 풀을 정리
+                prerender.shutdown()
+            os.chdir(cwd)
+    stub.shutdown()
+
+    report["config"] = {
+        "target": args.target,
+        "concurrency": args.concurrency,
+        "warmth": args.warmth,
+        "mix": args.mix,
+        "latency": args.latency,
+        "failure_rate": args.failure_rate,
+        "seed": args.seed,
+        "cpu_count": os.cpu_count(),
+    }
+    print(
+        f"{args.target}, 동시 {args.concurrency}, {args.warmth}, 스텁 지연 {args.latency * 1000:.0f}ms"
+        f", 장애율 {args.failure_rate:.0%}"
+    )
+    print_report(report, args.per)
+    if output:
+        output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"결과: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""OG 이미지 렌더링/인코딩 벤치마크.
+
+최적화 전 파이프라인(행마다 draw.line 그라데이션 + 매번 헤더 그리기 + PNG optimize=True)과
+현재 og_image의 인코딩 프로필별 CPU 시간·출력 크기를 비교합니다.
+또한 무손실 프로필(fast)의 픽셀이 이전 렌더링과 같은지 확인합니다.
+
+    uv run python bench/bench_og.py [--number 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageDraw
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)  # 앱과 같은 기준으로 static/fonts 탐색
+
+import og_image  # noqa: E402
+from og_image import (  # noqa: E402
+    ACCENT_COLOR,
+    BG_COLOR_BOTTOM,
+    BG_COLOR_TOP,
+    IMG_HEIGHT,
+    IMG_WIDTH,
+    TEXT_DARK,
+    TEXT_LIGHT,
+    WHITE,
+)
+
+TARGET_DATE = date(2026, 3, 5)
+MENU = ["잡곡밥", "김치찌개", "고등어구이", "시금치나물", "배추김치", "요구르트"]
+
+
+def legacy_menu_image(target_date: date, menu_items: list[str], encode: bool = True):
+    """최적화 전 generate_menu_image."""
+    img = Image.new("RGB", (IMG_WIDTH, IMG_HEIGHT))
+    draw = ImageDraw.Draw(img)
+    for y in range(IMG_HEIGHT):
+        t = y / IMG_HEIGHT
+        r = int(BG_COLOR_TOP[0] * (1 - t) + BG_COLOR_BOTTOM[0] * t)
+        g = int(BG_COLOR_TOP[1] * (1 - t) + BG_COLOR_BOTTOM[1] * t)
+        b = int(BG_COLOR_TOP[2] * (1 - t) + BG_COLOR_BOTTOM[2] * t)
+        draw.line([(0, y), (IMG_WIDTH, y)], fill=(r, g, b))
+    draw.rectangle([(0, 0), (IMG_WIDTH, 80)], fill=ACCENT_COLOR)
+    font_item = og_image._load_font(36)
+    draw.text((50, 22), "🍱 운정교내식당", font=og_image._load_font(32), fill=WHITE)
+    draw.text((50, 110), og_image._format_date(target_date), font=og_image._load_font(52, bold=True), fill=TEXT_DARK)
+    draw.rectangle([(50, 185), (IMG_WIDTH - 50, 188)], fill=ACCENT_COLOR)
+    y = 210
+    for item in menu_items[:8]:
+        if y + 50 > IMG_HEIGHT - 40:
+            break
+        draw.text((70, y), f"• {item}", font=font_item, fill=TEXT_DARK)
+        y += 50
+    if len(menu_items) > 8:
+        draw.text((70, y), f"  외 {len(menu_items) - 8}가지", font=font_item, fill=TEXT_LIGHT)
+    if not encode:
+        return img
+    buf = BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def measure(fn, number: int) -> tuple[float, int]:
+    """(1회당 CPU 시간 초, 출력 바이트)."""
+    fn()  # 워밍업 (폰트·기본 캔버스 캐시)
+    start = time.process_time()
+    for _ in range(number):
+        out = fn()
+    return (time.process_time() - start) / number, len(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+    og_image.logger.disabled = True
+
+    legacy_pixels = legacy_menu_image(TARGET_DATE, MENU, encode=False)
+    fast_pixels = Image.open(BytesIO(og_image.generate_menu_image(TARGET_DATE, MENU, profile="fast"))).convert("RGB")
+    identical = ImageChops.difference(legacy_pixels, fast_pixels).getbbox() is None
+
+    base_time, base_size = measure(lambda: legacy_menu_image(TARGET_DATE, MENU), args.number)
+    print(f"{'파이프라인':<28} {'CPU/장':>10} {'크기':>10}")
+    print(f"{'이전 (line 그라데이션+optimize)':<28} {base_time * 1000:>8.1f}ms {base_size:>9}B")
+    for profile in og_image.PNG_PROFILES:
+        t, size = measure(lambda: og_image.generate_menu_image(TARGET_DATE, MENU, profile=profile), args.number)
+        print(
+            f"{'현재 ' + profile:<28} {t * 1000:>8.1f}ms {size:>9}B"
+            f"  (CPU x{base_time / t:.1f}, 크기 {size / base_size:.0%})"
+        )
+    t, size = measure(lambda: og_image.generate_rest_image(TARGET_DATE), args.number)
+    print(f"{'현재 휴무 이미지 (기본)':<28} {t * 1000:>8.1f}ms {size:>9}B")
+    print("픽셀 동일 (fast 프로필 vs 이전):", "OK" if identical else "DIFF")
+    sys.exit(0 if identical else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""HTML 파싱 패리티 검사 + 마이크로 벤치마크.
+
+저장된 목록/상세 페이지(bench/fixtures/)에 대해
+- 기준 구현(전체 트리 + html.parser, 최적화 전 알고리즘)과 crawler의 결과가 같은지 확인하고
+- 사용 가능한 파서별로 파싱 시간을 측정합니다.
+
+    uv run python bench/bench_parse.py [--number 50]
+
+결과가 다르면 종료 코드 1.
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import date
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import crawler  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+REF_YEAR = 2026
+
+
+def reference_post_urls(html: str) -> dict[str, str]:
+    """최적화 전 get_weekly_post_url의 파싱 부분 (식당마다 첫 게시물)."""
+    soup = BeautifulSoup(html, "html.parser")
+    found = {}
+    for slug, keyword in crawler.CAFETERIAS.items():
+        for a in soup.find_all("a", href=True):
+            if keyword in a.get_text(strip=True):
+                href = a["href"]
+                found[slug] = href if href.startswith("http") else crawler.BASE_DOMAIN + href
+                break
+    return found
+
+
+def reference_weekly(html: str, ref_year: int) -> dict[date, list[str]]:
+    """최적화 전 parse_weekly_table의 파싱 부분."""
+    soup = BeautifulSoup(html, "html.parser")
+    container = soup.find(class_="artclView") or soup
+    result: dict[date, list[str]] = {}
+    for table in container.find_all("table"):
+        rows = table.find_all("tr")
+        if len(rows) < 2:
+            continue
+        date_indices: dict[date, int] = {}
+        header_row_idx = 0
+        for r_idx, row in enumerate(rows[:3]):
+            indices: dict[date, int] = {}
+            for i, cell in enumerate(row.find_all(["th", "td"])):
+                text = cell.get_text(strip=True)
+                if crawler._DAY_PATTERN.search(text):
+                    d = crawler._parse_header_date(text, ref_year)
+                    if d:
+                        indices[d] = i
+            if len(indices) >= 3:
+                date_indices = indices
+                header_row_idx = r_idx
+                break
+        if not date_indices:
+            continue
+        for d in date_indices:
+            result[d] = []
+        for row in rows[header_row_idx + 1:]:
+            cells = row.find_all(["td", "th"])
+            for d, idx in date_indices.items():
+                if idx < len(cells):
+                    text = cells[idx].get_text(separator="\n", strip=True)
+                    result[d].extend(
+                        line.strip() for line in text.splitlines() if crawler._is_menu_item(line.strip())
+                    )
+        if result:
+            break
+    return result
+
+
+def available_parsers() -> list[str]:
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=50, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    list_html = (FIXTURES / "list.html").read_text(encoding="utf-8")
+    post_html = (FIXTURES / "post.html").read_text(encoding="utf-8")
+    crawler.logger.disabled = True
+
+    expected_urls = reference_post_urls(list_html)
+    expected_weekly = reference_weekly(post_html, REF_YEAR)
+    if not expected_urls or not expected_weekly:
+        print("기준 구현이 fixture에서 결과를 얻지 못했습니다.")
+        sys.exit(1)
+
+    ok = True
+    rows = []
+    ref_list = timeit.timeit(lambda: reference_post_urls(list_html), number=args.number) / args.number
+    ref_post = timeit.timeit(lambda: reference_weekly(post_html, REF_YEAR), number=args.number) / args.number
+    rows.append(("기준 (html.parser, 전체 트리)", ref_list, ref_post))
+
+    original_parser = crawler.HTML_PARSER
+    for name in available_parsers():
+        crawler.HTML_PARSER = name
+        same_urls = crawler.find_post_urls(list_html) == expected_urls
+        same_weekly = crawler.parse_weekly_html(post_html, REF_YEAR) == expected_weekly
+        if not (same_urls and same_weekly):
+            print(f"[불일치] {name}: 결과가 기준 구현과 다릅니다.")
+            ok = False
+        t_list = timeit.timeit(lambda: crawler.find_post_urls(list_html), number=args.number) / args.number
+        t_post = timeit.timeit(lambda: crawler.parse_weekly_html(post_html, REF_YEAR), number=args.number) / args.number
+        rows.append((f"crawler ({name}, 부분 트리)", t_list, t_post))
+    crawler.HTML_PARSER = original_parser
+
+    print(f"{'구현':<32} {'목록 페이지':>12} {'상세 페이지':>12}")
+    for label, t_list, t_post in rows:
+        print(
+            f"{label:<32} {t_list * 1000:>8.2f}ms (x{ref_list / t_list:.1f})"
+            f" {t_post * 1000:>8.2f}ms (x{ref_post / t_post:.1f})"
+        )
+    print("패리티:", "OK" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""서빙 모드 처리량 비교: 개발 서버(python app.py) vs gunicorn(app:create_app()).
+
+임시 디렉터리에 이번 주 메뉴·OG 이미지 캐시를 채워 둔 뒤 각 모드로 서버를 띄우고,
+keep-alive 연결 여러 개로 `/`, `/weekly`, `/og-image/<date>.png`를 번갈아 요청해
+초당 처리량과 지연 시간을 측정합니다. 업스트림 크롤링은 일어나지 않습니다(모든 요청이 캐시 적중).
+
+    uv run python bench/bench_serving.py [--duration 10] [--concurrency 16] [--workers 0]
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+KST = timezone(timedelta(hours=9))
+MENU = ["잡곡밥", "김치찌개", "고등어구이", "시금치나물", "배추김치", "요구르트"]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def seed_cache(workdir: Path) -> list[str]:
+    """이번 주 평일 메뉴와 OG 이미지를 workdir/cache에 저장하고 요청 경로 목록 반환."""
+    code = f"""
+import sys
+sys.path.insert(0, {str(ROOT)!r})
+from datetime import date, timedelta
+import cache, og_image
+monday = date.fromisoformat({_this_monday().isoformat()!r})
+for i in range(5):
+    d = monday + timedelta(days=i)
+    cache.save_menu_cache(d.isoformat(), {MENU!r})
+    cache.save_og_cache(d.isoformat(), og_image.render_key(d, {MENU!r}), og_image.generate_menu_image(d, {MENU!r}))
+"""
+    subprocess.run([sys.executable, "-c", code], cwd=workdir, check=True, capture_output=True)
+    day = _this_monday().isoformat()
+    return [f"/?d={day}", "/weekly", f"/og-image/{day}.png"]
+
+
+def _this_monday() -> date:
+    today = datetime.now(KST).date()
+    return today - timedelta(days=today.weekday())
+
+
+def start_server(
+    mode: str, workdir: Path, port: int, workers: int, extra_env: dict[str, str] | None = None
+) -> subprocess.Popen:
+    """workdir을 작업 디렉터리(cache/ 위치)로 서버 시작. 정적 파일이 응답할 때까지 대기 (크롤링 없음)."""
+    env = dict(
+        os.environ, FLASK_HOST="127.0.0.1", FLASK_PORT=str(port), BASE_URL="http://bench", SCHEDULER_ENABLED="false"
+    )
+    env.update(extra_env or {})
+    if mode == "dev":
+        cmd = [sys.executable, str(ROOT / "app.py")]
+    else:
+        if workers:
+            env["WEB_CONCURRENCY"] = str(workers)
+        cmd = [
+            sys.executable, "-m", "gunicorn",
+            "-c", str(ROOT / "gunicorn.conf.py"),
+            "--pythonpath", str(ROOT),
+            "app:create_app()",
+        ]
+    proc = subprocess.Popen(cmd, cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/static/style.css")
+            conn.getresponse().read()
+            return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"{mode} 서버가 시작되지 않았습니다.")
+
+
+def load(port: int, paths: list[str], duration: float, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def worker(offset: int):
+        nonlocal errors
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        local: list[float] = []
+        local_errors = 0
+        i = offset
+        while time.monotonic() < stop_at:
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path, headers={"Accept-Encoding": "gzip"})
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                continue
+            local.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "requests": n,
+        "rps": n / duration,
+        "p50": latencies[n // 2] if n else 0.0,
+        "p99": latencies[min(n - 1, int(n * 0.99))] if n else 0.0,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10, help="모드별 측정 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 연결 수")
+    parser.add_argument("--workers", type=int, default=0, help="gunicorn 워커 수 (0이면 gunicorn.conf.py 기본값)")
+    args = parser.parse_args()
+
+    print(f"CPU {os.cpu_count()}개, 동시 연결 {args.concurrency}, 모드별 {args.duration:.0f}초")
+    print(f"{'모드':<12} {'요청/초':>10} {'p50':>10} {'p99':>10} {'오류':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        paths = seed_cache(workdir)
+        for mode in ("dev", "gunicorn"):
+            port = free_port()
+            proc = start_server(mode, workdir, port, args.workers)
+            try:
+                load(port, paths, min(2.0, args.duration), args.concurrency)  # 워밍업 (페이지 캐시)
+                r = load(port, paths, args.duration, args.concurrency)
+            finally:
+                proc.terminate()
+                proc.wait(timeout=30)
+            print(
+                f"{mode:<12} {r['rps']:>10.0f} {r['p50'] * 1000:>8.1f}ms {r['p99'] * 1000:>8.1f}ms {r['errors']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""전체 벤치마크 스위트 (스텁 게시판 기반, 결과 JSON + 회귀 검사).
+
+bench/stub_site.py의 로컬 게시판(녹화된 목록·상세 HTML)을 대상으로 앱을 같은 프로세스에서 띄우고
+다음 항목의 요청 1회당 시간(p50/p95/평균)을 측정합니다.
+
+- parse.*: 목록·상세 페이지 파싱 (fixture, 네트워크 없음)
+- crawl.*: parse_weekly_table(요청+파싱), get_menu_for_date 전체 경로 (cold: 크롤러 상태 없음,
+  warm: 알려진 게시물 조건부 재확인)
+- og.*: generate_menu_image / generate_rest_image (기본 인코딩 프로필)
+- cache.*: 메뉴·OG 캐시 쓰기, 메모리 계층 적중·저장소 읽기, 주간 범위 읽기
+- route.<엔드포인트>.cold|warm: Flask 라우트 (cold: 모든 캐시·크롤러 상태를 비운 뒤 1회,
+  warm: 직전 요청으로 캐시가 찬 상태). Flask 테스트 클라이언트로 호출하므로 소켓 비용은 제외
+
+임시 디렉터리를 작업 디렉터리로 쓰므로 저장소의 cache/는 건드리지 않습니다.
+결과는 --output JSON에 쓰고, --baseline으로 이전 결과를 넘기면 p50이 --threshold 비율 이상
+느려진 항목을 보고하고 종료 코드 1로 끝납니다.
+
+    uv run python bench/bench_suite.py [--number 20] [--cold-number 5] [--latency 0.05] [--failure-rate 0]
+        [--backend file|sqlite] [--only route.] [--output bench/results.json]
+        [--baseline bench/results-main.json] [--threshold 0.2]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import stub_site  # noqa: E402
+
+FIXTURES = Path(__file__).parent / "fixtures"
+KST = timezone(timedelta(hours=9))
+MENU = ["잡곡밥", "김치찌개", "고등어구이", "시금치나물", "배추김치", "요구르트"]
+# 이보다 짧은 항목은 타이머 잡음이 커서 회귀 판정에서 비율 대신 절대 차이도 함께 봄
+NOISE_FLOOR_MS = 0.05
+
+
+def this_monday() -> date:
+    today = datetime.now(KST).date()
+    return today - timedelta(days=today.weekday())
+
+
+def measure(fn: Callable[[], object], number: int, setup: Callable[[], None] | None = None) -> dict:
+    """fn 1회당 시간 통계(ms). setup은 매 회 fn 전에 실행(측정 제외). 첫 회는 워밍업으로 버림.
+
+    fn이 False를 반환하면 오류로 셈 (라우트 5xx 등).
+    """
+    samples = []
+    errors = 0
+    for i in range(number + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        ok = fn()
+        elapsed = time.perf_counter() - start
+        if i == 0:
+            continue
+        samples.append(elapsed * 1000)
+        if ok is False:
+            errors += 1
+    samples.sort()
+    n = len(samples)
+    return {
+        "n": n,
+        "p50_ms": round(samples[n // 2], 4),
+        "p95_ms": round(samples[min(n - 1, int(n * 0.95))], 4),
+        "mean_ms": round(sum(samples) / n, 4),
+        "min_ms": round(samples[0], 4),
+        "errors": errors,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_suite(args, target_url: str) -> dict[str, dict]:
+    # 모듈 설정이 import 시점에 환경 변수에서 읽히므로 스텁 URL 등을 먼저 지정
+    os.environ.update(
+        TARGET_URL=target_url,
+        CACHE_BACKEND=args.backend,
+        SCHEDULER_ENABLED="false",
+        BASE_URL="http://bench",
+        METRICS_DIR="",
+    )
+    import app as app_module
+    import business_calendar
+    import cache
+    import crawler
+    import og_image
+    import page_cache
+    import prerender
+
+    logging.disable(logging.CRITICAL)
+    app_module.create_app()
+    client = app_module.app.test_client()
+
+    monday = this_monday()
+    workday = next((d for d in app_module._week_days(monday) if not business_calendar.is_closed(d)), monday)
+    friday = monday + timedelta(days=4)
+    day = workday.isoformat()
+    list_html = (FIXTURES / "list.html").read_text(encoding="utf-8")
+    post_html = (FIXTURES / "post.html").read_text(encoding="utf-8")
+    session = crawler.get_session()
+
+    def reset_state() -> None:
+        """모든 캐시 계층(저장소·메모리·페이지)과 크롤러 조건부 요청 상태를 비움."""
+        prerender._dispatcher.submit(lambda: None).result()  # 진행 중인 사전 렌더링이 끝날 때까지 대기
+        shutil.rmtree(cache.CACHE_ROOT, ignore_errors=True)
+        cache._store = None
+        cache._menu_memory.clear()
+        cache._og_memory.clear()
+        page_cache.clear()
+
+    def post_url() -> str:
+        return crawler.get_weekly_post_urls(session)[crawler.DEFAULT_CAFETERIA]
+
+    results: dict[str, dict] = {}
+
+    def case(name: str, fn: Callable[[], object], setup: Callable[[], None] | None = None, cold: bool = False):
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            return
+        results[name] = measure(fn, args.cold_number if cold else args.number, setup)
+        r = results[name]
+        errors = f"  오류 {r['errors']}" if r["errors"] else ""
+        print(f"{name:<34} p50 {r['p50_ms']:>9.2f}ms  p95 {r['p95_ms']:>9.2f}ms  (n={r['n']}){errors}", flush=True)
+
+    # 파싱 (fixture)
+    case("parse.list_page", lambda: crawler.find_post_urls(list_html))
+    case("parse.post_page", lambda: crawler.parse_weekly_html(post_html, workday))
+
+    # 크롤링 (스텁 게시판)
+    reset_state()
+    url = post_url()
+    case("crawl.parse_weekly_table", lambda: bool(crawler.parse_weekly_table(url, session, workday)), reset_state,
+         cold=True)
+    case("crawl.get_menu_for_date.cold", lambda: crawler.get_menu_for_date(workday) is not None, reset_state,
+         cold=True)
+    case("crawl.get_menu_for_date.warm", lambda: crawler.get_menu_for_date(workday) is not None)
+
+    # OG 이미지
+    case("og.menu_image", lambda: og_image.generate_menu_image(workday, MENU))
+    case("og.rest_image", lambda: og_image.generate_rest_image(workday))
+
+    # 캐시 읽기·쓰기
+    reset_state()
+    menus = [MENU, MENU[::-1]]
+    writes = iter(range(10**9))
+    case("cache.menu.write", lambda: cache.save_menu_cache(day, menus[next(writes) % 2]))
+    case("cache.menu.read.memory", lambda: cache.get_menu_cache_entry(day) is not None)
+    case("cache.menu.read.store", lambda: cache.get_menu_cache_entry(day) is not None, cache._menu_memory.clear)
+    cache.save_weekly_menu_cache({monday + timedelta(days=i): MENU for i in range(5)})
+    case("cache.menu.read_week.memory", lambda: len(cache.get_menu_cache_range(monday, friday)) == 5)
+    case("cache.menu.read_week.store", lambda: len(cache.get_menu_cache_range(monday, friday)) == 5,
+         cache._menu_memory.clear)
+    png = og_image.generate_menu_image(workday, MENU)
+    blob_keys = (hashlib.sha256(str(i).encode()).hexdigest() for i in range(10**9))
+    case("cache.og.write", lambda: cache.save_og_cache(day, next(blob_keys), png))
+    blob_key = og_image.render_key(workday, MENU)
+    cache.save_og_cache(day, blob_key, png)
+    case("cache.og.read.memory", lambda: cache.get_og_cache(day, blob_key) is not None)
+    case("cache.og.read.store", lambda: cache.get_og_cache(day, blob_key) is not None, cache._og_memory.clear)
+
+    # 라우트
+    routes = {
+        "index": f"/?d={day}",
+        "weekly": "/weekly",
+        "og_image": f"/og-image/{day}.png",
+        "api_menu": f"/api/menu/{day}",
+        "api_menu_range": f"/api/menu?from={monday.isoformat()}&to={friday.isoformat()}",
+    }
+
+    def get(path: str) -> Callable[[], bool]:
+        def request() -> bool:
+            resp = client.get(path, headers={"Accept-Encoding": "gzip"})
+            resp.get_data()
+            return resp.status_code < 500
+        return request
+
+    for name, path in routes.items():
+        case(f"route.{name}.cold", get(path), reset_state, cold=True)
+        case(f"route.{name}.warm", get(path))
+
+    reset_state()
+    # 임시 디렉터리를 지우기 전에 사전 렌더링 스레드·프로세스 풀을 정리
+    prerender.shutdown()
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """p50이 baseline 대비 threshold 비율 이상(그리고 NOISE_FLOOR_MS 이상) 느려진 항목."""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        cur, prev = r["p50_ms"], base["p50_ms"]
+        if cur > prev * (1 + threshold) and cur - prev > NOISE_FLOOR_MS:
+            regressions.append(f"{name}: {prev:.2f}ms → {cur:.2f}ms (x{cur / prev:.2f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20, help="측정 반복 횟수 (warm·로컬 항목)")
+    parser.add_argument("--cold-number", type=int, default=5, help="cold 항목 반복 횟수 (매 회 캐시를 비움)")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 게시판 응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="스텁 게시판 503 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="장애 주입 난수 시드")
+    parser.add_argument("--backend", choices=["file", "sqlite"], default="file", help="캐시 저장소 백엔드")
+    parser.add_argument("--only", action="append", default=[], help="이 접두사로 시작하는 항목만 (여러 번 지정 가능)")
+    parser.add_argument("--output", type=Path, default=ROOT / "bench" / "results.json", help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 볼 p50 증가 비율")
+    args = parser.parse_args()
+    output = args.output.resolve()
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+
+    stub, target_url = stub_site.serve(weeks=4, latest=this_monday(), latency=args.latency,
+                                       failure_rate=args.failure_rate, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        # 폰트(static/fonts)는 저장소 것을 그대로 사용
+        os.symlink(ROOT / "static", Path(tmp) / "static")
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            results = run_suite(args, target_url)
+        finally:
+            os.chdir(cwd)
+    stub.shutdown()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(KST).isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "backend": args.backend,
+            "latency": args.latency,
+            "failure_rate": args.failure_rate,
+            "seed": args.seed,
+            "number": args.number,
+            "cold_number": args.cold_number,
+            "upstream_requests": dict(stub.faults.hits),
+        },
+        "results": results,
+    }
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"결과: {output}")
+
+    if baseline is None:
+        return
+    for key in ("backend", "latency", "failure_rate"):
+        if baseline["meta"].get(key) != report["meta"][key]:
+            print(f"[주의] 기준 결과와 {key}가 다릅니다: {baseline['meta'].get(key)} vs {report['meta'][key]}")
+    regressions = compare(results, baseline["results"], args.threshold)
+    print(f"기준 ({baseline['meta'].get('revision')}) 대비 p50 {args.threshold:.0%} 이상 느려진 항목: {len(regressions)}개")
+    for line in regressions:
+        print(f"  {line}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""학교 게시판 스텁 서버 (녹화된 HTML 기반).
+
+bench/fixtures/의 목록·상세 페이지를 틀로 삼아, 최근 N주치 주간식단 게시물이 페이지로 나뉜 게시판을
+로컬에서 흉내 냅니다. 백필·크롤러를 실제 사이트 대신 이 서버에 대고 실행할 수 있습니다.
+
+- 목록: /main_kor/11095/subview.do?page=N (페이지당 16건, 하단 페이지 링크는 10개 단위 + 다음 묶음)
+- 상세: /bbs/main_kor/2563/<id>/artclView.do (헤더 날짜·제목·작성일을 해당 주로 바꾼 상세 페이지)
+- 게시물 작성일은 해당 주 직전 금요일. 기본 52주라 연말·연초에 걸친 주가 포함됨
+- 지연·장애 주입: 모든 응답을 latency초 늦추고, failure_rate 비율의 요청에 503 응답 (seed로 재현 가능)
+
+    uv run python bench/stub_site.py [--weeks 52] [--latest 2026-03-02] [--port 8800] [--latency 0.1] [--failure-rate 0.05]
+    TARGET_URL=http://127.0.0.1:8800/main_kor/11095/subview.do uv run python scripts/backfill.py
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = Path(__file__).parent / "fixtures"
+LIST_PATH = "/main_kor/11095/subview.do"
+POST_PATH = re.compile(r"^/bbs/main_kor/2563/(\d+)/artclView\.do$")
+CAFETERIAS = ["수정캠퍼스 학생식당", "운정교내식당", "수정캠퍼스 교직원식당", "운정캠퍼스 카페테리아"]
+PAGE_SIZE = 16
+PAGING_BLOCK = 10
+WEEKDAY_KO = ["월", "화", "수", "목", "금"]
+
+# 상세 페이지 틀(post.html)의 3월 2일 주 헤더 셀 — 해당 주 날짜로 바꿔 씀
+_TEMPLATE_HEADERS = ["3월 2일 (월)", "3월 3일 (화)", "3월 4일(수)", "3월 5일 (목)", "3월 6일 (금)"]
+_TEMPLATE_TITLE = "운정교내식당 주간식단(3월 2일~3월 6일)"
+_TEMPLATE_POSTED = "2026.02.27"
+
+
+def _md(d: date) -> str:
+    return f"{d.month}월 {d.day}일"
+
+
+class Board:
+    """최근 weeks주의 게시물. latest: 가장 최근 게시물이 다루는 주의 월요일."""
+
+    def __init__(self, weeks: int, latest: date):
+        self.list_template = (FIXTURES / "list.html").read_text(encoding="utf-8")
+        self.post_template = (FIXTURES / "post.html").read_text(encoding="utf-8")
+        # 최신순 게시물: (id, 식당, 주 월요일)
+        self.posts: list[tuple[int, str, date]] = []
+        next_id = 400000 + weeks * len(CAFETERIAS)
+        for w in range(weeks):
+            monday = latest - timedelta(weeks=w)
+            for cafeteria in CAFETERIAS:
+                self.posts.append((next_id, cafeteria, monday))
+                next_id -= 1
+        self.by_id = {post_id: (cafeteria, monday) for post_id, cafeteria, monday in self.posts}
+        self.pages = (len(self.posts) + PAGE_SIZE - 1) // PAGE_SIZE
+
+    @staticmethod
+    def title(cafeteria: str, monday: date) -> str:
+        return f"{cafeteria} 주간식단({_md(monday)}~{_md(monday + timedelta(days=4))})"
+
+    @staticmethod
+    def posted(monday: date) -> date:
+        return monday - timedelta(days=3)
+
+    def list_page(self, page: int) -> str | None:
+        if not 1 <= page <= self.pages:
+            return None
+        rows = []
+        start = (page - 1) * PAGE_SIZE
+        for n, (post_id, cafeteria, monday) in enumerate(self.posts[start:start + PAGE_SIZE]):
+            num = len(self.posts) - start - n
+            rows.append(
+                f'<tr class="">\n<td class="_artclTdNum">{num}</td>\n'
+                f'<td class="_artclTdTitle"><a href="/bbs/main_kor/2563/{post_id}/artclView.do" class="artclLinkView">\n'
+                f"<strong>{self.title(cafeteria, monday)}</strong>\n</a></td>\n"
+                f'<td class="_artclTdWriter">생활협동조합</td>\n'
+                f'<td class="_artclTdRdate">{self.posted(monday):%Y.%m.%d}</td>\n'
+                f'<td class="_artclTdAtchFile"></td>\n<td class="_artclTdAccess">{100 + n}</td>\n</tr>'
+            )
+        block_start = (page - 1) // PAGING_BLOCK * PAGING_BLOCK + 1
+        block = range(block_start, min(block_start + PAGING_BLOCK, self.pages + 1))
+        links = "".join(f'<li><a href="?page={p}">{p}</a></li>' for p in block)
+        if block_start + PAGING_BLOCK <= self.pages:
+            links += f'<li><a href="?page={block_start + PAGING_BLOCK}">다음</a></li>'
+
+        html = re.sub(r"<tbody>.*?</tbody>", lambda _: "<tbody>\n" + "\n".join(rows) + "\n</tbody>",
+                      self.list_template, count=1, flags=re.S)
+        return re.sub(r'<div class="_paging"><ul>.*?</ul></div>', lambda _: f'<div class="_paging"><ul>{links}</ul></div>',
+                      html, count=1, flags=re.S)
+
+    def post_page(self, post_id: int) -> str | None:
+        if post_id not in self.by_id:
+            return None
+        cafeteria, monday = self.by_id[post_id]
+        html = self.post_template.replace(_TEMPLATE_TITLE, self.title(cafeteria, monday))
+        html = html.replace(_TEMPLATE_POSTED, f"{self.posted(monday):%Y.%m.%d}")
+        for i, header in enumerate(_TEMPLATE_HEADERS):
+            d = monday + timedelta(days=i)
+            html = html.replace(header, f"{_md(d)} ({WEEKDAY_KO[i]})")
+        return html
+
+
+class Faults:
+    """지연·장애 주입과 요청 집계. hits: {"list" | "post" | "failed" | "not_found": 횟수}."""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed: int | None = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.hits: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def record(self, kind: str) -> bool:
+        """요청 1건 집계. 장애를 주입할 요청이면 False."""
+        with self._lock:
+            failed = self.failure_rate > 0 and self._random.random() < self.failure_rate
+            self.hits["failed" if failed else kind] += 1
+        return not failed
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+
+
+def make_handler(board: Board, faults: Faults):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 쓰므로 keep-alive 연결에서 Nagle + 지연 ACK로 40ms씩 늘어나지 않도록
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            body = None
+            kind = "not_found"
+            if parts.path == LIST_PATH:
+                kind = "list"
+                page = parse_qs(parts.query).get("page", ["1"])[0]
+                body = board.list_page(int(page)) if page.isdigit() else None
+            elif (m := POST_PATH.match(parts.path)):
+                kind = "post"
+                body = board.post_page(int(m.group(1)))
+            if faults.latency > 0:
+                time.sleep(faults.latency)
+            if not faults.record(kind if body is not None else "not_found"):
+                self.send_error(503)
+                return
+            if body is None:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(
+    weeks: int = 52,
+    latest: date | None = None,
+    port: int = 0,
+    latency: float = 0.0,
+    failure_rate: float = 0.0,
+    seed: int | None = None,
+) -> tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드에서 스텁 서버 시작. (서버, 목록 페이지 URL = TARGET_URL) 반환.
+
+    server.faults(Faults)로 지연·장애율을 바꾸거나 요청 수를 읽을 수 있음.
+    """
+    if latest is None:
+        today = date.today()
+        latest = today - timedelta(days=today.weekday())
+    faults = Faults(latency, failure_rate, seed)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(Board(weeks, latest), faults))
+    server.faults = faults
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-site", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}{LIST_PATH}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weeks", type=int, default=52, help="게시물 주 수")
+    parser.add_argument("--latest", type=date.fromisoformat, default=None, help="가장 최근 주의 월요일 (기본: 이번 주)")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="503으로 응답할 요청 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None, help="장애 주입 난수 시드")
+    args = parser.parse_args()
+
+    server, url = serve(args.weeks, args.latest, args.port, args.latency, args.failure_rate, args.seed)
+    print(f"스텁 게시판: {url} (게시물 {args.weeks * len(CAFETERIAS)}건)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""식당 영업일 달력.
+
+주말·공휴일(holidays.KR)과 학교 휴무일·방학(CLOSURES_FILE)을 연도별로 한 번 계산해 두고,
+날짜 조회는 dict 조회 한 번으로 끝냅니다. 달력은 최근에 조회한 CALENDAR_CACHE_YEARS개 연도만 보관합니다. 라우트·예약 작업·폴러가 모두 이 달력을 씁니다.
+휴무 여부는 요청마다 이 달력으로 판단하며 메뉴 캐시에 저장하지 않습니다.
+
+CLOSURES_FILE (JSON, 없으면 주말·공휴일만):
+    {
+      "closures": [{"date": "2026-05-15", "name": "개교기념일"}],
+      "periods": [{"start": "2026-07-20", "end": "2026-08-28", "name": "여름방학"}]
+    }
+
+파일은 프로세스마다 처음 조회할 때 한 번 읽으므로, 바꾼 뒤에는 서버를 다시 시작해야 합니다.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import holidays
+
+CLOSURES_FILE = Path(os.getenv("CLOSURES_FILE", "closures.json"))
+
+WEEKEND = "주말"
+# 보관할 연도 달력 수 (임의의 ?d= 날짜로 조회한 연도가 메모리에 계속 쌓이지 않도록 LRU로 제한)
+CALENDAR_CACHE_YEARS = 8
+
+logger = logging.getLogger(__name__)
+
+_closures: dict[date, str] | None = None
+_lock = threading.Lock()
+
+
+def _parse_closures(data: dict) -> dict[date, str]:
+    closures: dict[date, str] = {}
+    for item in data.get("periods", []):
+        start, end = date.fromisoformat(item["start"]), date.fromisoformat(item["end"])
+        for i in range((end - start).days + 1):
+            closures[start + timedelta(days=i)] = item.get("name") or "휴무"
+    # 개별 휴무일은 기간보다 우선 (방학 중 행사 등 이름 구분)
+    for item in data.get("closures", []):
+        closures[date.fromisoformat(item["date"])] = item.get("name") or "휴무"
+    return closures
+
+
+def _load_closures() -> dict[date, str]:
+    if not CLOSURES_FILE.exists():
+        return {}
+    try:
+        closures = _parse_closures(json.loads(CLOSURES_FILE.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"휴무일 파일 읽기 실패 ({CLOSURES_FILE}): {e} — 주말·공휴일만 사용")
+        return {}
+    logger.info(f"휴무일 파일: {CLOSURES_FILE} ({len(closures)}일)")
+    return closures
+
+
+def _build_year(year: int, closures: dict[date, str]) -> dict[date, str]:
+    """그해의 {휴무 날짜: 사유}. 우선순위: 학교 휴무일 > 공휴일 > 주말."""
+    days: dict[date, str] = {}
+    first, last = date(year, 1, 1), date(year, 12, 31)
+    # 첫 토요일부터 한 주씩 (date.max가 있는 9999년에서도 그해 밖으로 넘어가지 않도록 일수로 계산)
+    for offset in range((5 - first.weekday()) % 7, (last - first).days + 1, 7):
+        saturday = first + timedelta(days=offset)
+        days[saturday] = WEEKEND
+        if saturday < last:
+            days[saturday + timedelta(days=1)] = WEEKEND
+    days.update(holidays.KR(years=year))
+    days.update((d, name) for d, name in closures.items() if d.year == year)
+    return days
+
+
+@functools.lru_cache(maxsize=CALENDAR_CACHE_YEARS)
+def _year(year: int) -> dict[date, str]:
+    global _closures
+    with _lock:
+        if _closures is None:
+            _closures = _load_closures()
+    return _build_year(year, _closures)
+
+
+def closure_reason(d: date) -> str | None:
+    """휴무 사유(주말, 공휴일 이름, 학교 휴무일 이름). 영업일이면 None."""
+    return _year(d.year).get(d)
+
+
+def is_closed(d: date) -> bool:
+    """주말·공휴일·학교 휴무일이면 True."""
+    return d in _year(d.year)
@@ -1,56 +1,601 @@
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Callable
 
-MENU_CACHE_DIR = Path("cache/menu")
-OG_CACHE_DIR = Path("cache/og")
+import metrics
+from cache_store import FileStore, SQLiteStore
+from metrics import CACHE_LOOKUPS
+
+CACHE_ROOT = Path("cache")
+MENU_CACHE_DIR = CACHE_ROOT / "menu"
+OG_CACHE_DIR = CACHE_ROOT / "og"
+NEGATIVE_CACHE_DIR = CACHE_ROOT / "negative"
+
+# 저장소 백엔드: file(날짜별 파일) | sqlite(단일 DB 파일)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "file").lower()
+CACHE_DB_PATH = Path(os.getenv("CACHE_DB_PATH", str(CACHE_ROOT / "cache.db")))
+
+# 네거티브 캐시 상태
+NOT_POSTED = "not_posted"  # 게시물 미게시 (지난 주 게시물 등)
+CRAWL_ERROR = "error"      # 사이트 요청 실패
+
+# 네거티브 캐시 TTL(초): 연속 미스마다 2배씩 늘어나며 최대값에서 멈춤
+NEGATIVE_TTL = {
+    NOT_POSTED: int(os.getenv("NEGATIVE_CACHE_TTL", "300")),
+    CRAWL_ERROR: int(os.getenv("CRAWL_ERROR_CACHE_TTL", "60")),
+}
+NEGATIVE_TTL_MAX = int(os.getenv("NEGATIVE_CACHE_MAX_TTL", "1800"))
+
+# 메뉴 캐시 신선도(초): 지나면 stale — 계속 서빙하되 백그라운드 갱신 대상
+MENU_CACHE_TTL = int(os.getenv("MENU_CACHE_TTL", "7200"))
+
+# 인메모리 계층: TTL 동안은 저장소 I/O 없이 응답, 이후 저장소 버전 비교로 재검증
+MEMORY_CACHE_TTL = float(os.getenv("MEMORY_CACHE_TTL", "30"))
+MEMORY_CACHE_MAX_ITEMS = int(os.getenv("MEMORY_CACHE_MAX_ITEMS", "256"))
+OG_MEMORY_CACHE_MAX_BYTES = int(os.getenv("OG_MEMORY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# OG 이미지 저장소 디스크 예산(바이트): GC가 가장 오래 안 쓰인 날짜부터 인덱스를 지워 이 아래로 맞춤
+OG_CACHE_MAX_BYTES = int(os.getenv("OG_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 인덱스에서 빠진 블롭을 지우기 전 유예(초) — 저장 직후 인덱스 연결 전인 블롭 보호
+OG_BLOB_GRACE = int(os.getenv("OG_BLOB_GRACE", "3600"))
+# OG 이미지 접근 시각 기록 간격(초): 적중마다 쓰지 않고 날짜별로 이 간격에 한 번만 저장소에 기록
+OG_TOUCH_INTERVAL = 600
 
 logger = logging.getLogger(__name__)
 
 
-def _ensure_dirs():
-    MENU_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    OG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+class MemoryTier:
+    """저장소 앞단의 LRU + TTL 메모리 계층.
+
+    - 같은 프로세스의 쓰기는 write-through로 즉시 반영
+    - 다른 프로세스의 쓰기는 TTL 경과 후 저장소 버전(mtime/updated_at) 비교로 감지
+    """
+
+    def __init__(self, name: str, max_items: int, max_bytes: int | None = None):
+        self.name = name
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: OrderedDict[str, tuple[object, int, object, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, version: Callable[[], object] | None = None):
+        """메모리 값 반환. 없거나 저장소 값이 바뀌었으면 None(미스).
+
+        version이 없으면 TTL 안의 항목만 적중으로 봄 (재검증 없음).
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                value, size, stored_version, checked_at = item
+                if time.monotonic() - checked_at < MEMORY_CACHE_TTL:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return value
+        if item is not None and version is not None:
+            try:
+                current = version()
+            except Exception:
+                current = None
+            with self._lock:
+                if current is not None and current == stored_version and key in self._items:
+                    self._items[key] = (value, size, stored_version, time.monotonic())
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.invalidate(key)
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value, version, size: int = 0) -> None:
+        if version is None:
+            self.invalidate(key)
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._items[key] = (value, size, version, time.monotonic())
+            self._bytes += size
+            while len(self._items) > self.max_items or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _, _) = self._items.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "items": len(self._items),
+                "bytes": self._bytes,
+            }
+
+    def samples(self) -> list[tuple[str, str, str, dict, float]]:
+        """/metrics용 통계 (metrics.add_collector)."""
+        stats = self.stats()
+        labels = {"tier": self.name}
+        return [
+            ("memory_cache_hits_total", "메모리 계층 적중", "counter", labels, stats["hits"]),
+            ("memory_cache_misses_total", "메모리 계층 미스", "counter", labels, stats["misses"]),
+            ("memory_cache_evictions_total", "메모리 계층 축출", "counter", labels, stats["evictions"]),
+            ("memory_cache_items", "메모리 계층 항목 수", "gauge", labels, stats["items"]),
+            ("memory_cache_bytes", "메모리 계층 바이트", "gauge", labels, stats["bytes"]),
+        ]
+
+
+_menu_memory = MemoryTier("menu", MEMORY_CACHE_MAX_ITEMS)
+_og_memory = MemoryTier("og", MEMORY_CACHE_MAX_ITEMS, OG_MEMORY_CACHE_MAX_BYTES)
+
+metrics.add_collector(lambda: _menu_memory.samples() + _og_memory.samples())
+
+_menu_write_listeners: list[Callable[[str], None]] = []
+
+_store: FileStore | SQLiteStore | None = None
+_store_lock = threading.Lock()
+
+
+def _make_store(backend: str) -> FileStore | SQLiteStore:
+    if backend == "sqlite":
+        return SQLiteStore(CACHE_DB_PATH)
+    if backend != "file":
+        logger.warning(f"알 수 없는 CACHE_BACKEND '{backend}' — file 사용")
+    return FileStore(CACHE_ROOT, legacy_ttl=MENU_CACHE_TTL)
+
+
+def get_store() -> FileStore | SQLiteStore:
+    """현재 저장소 백엔드 (최초 사용 시 생성)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = _make_store(CACHE_BACKEND)
+                logger.info(f"캐시 백엔드: {CACHE_BACKEND}")
+    return _store
+
+
+def add_menu_write_listener(fn: Callable[[str], None]) -> Callable[[str], None]:
+    """메뉴 항목 저장 시 fn(date_str) 호출 등록 (파생 캐시 무효화용). 데코레이터로도 사용."""
+    _menu_write_listeners.append(fn)
+    return fn
+
+
+def memory_stats() -> dict:
+    """메모리 계층 적중/미스/축출 카운터."""
+    return {"menu": _menu_memory.stats(), "og": _og_memory.stats()}
+
+
+def menu_key(date_str: str, cafeteria: str | None = None) -> str:
+    """식당별 캐시 키. date_str을 받는 함수(메뉴·네거티브·OG 캐시)는 모두 이 키를 그대로 받음.
+
+    cafeteria가 None이면(기본 식당) 날짜 그대로 — 단일 식당 시절의 캐시를 이어서 씀.
+    """
+    return f"{cafeteria}/{date_str}" if cafeteria else date_str
+
+
+def _key_date(key: str) -> date:
+    return date.fromisoformat(key.rpartition("/")[2])
+
+
+def content_hash(menu: list[str] | str) -> str:
+    """메뉴 내용 해시 (재크롤링 변경 감지, ETag에 사용)."""
+    raw = json.dumps(menu, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _with_hash(entry: dict) -> dict:
+    """해시가 없는 이전 형식 항목에 해시를 채움."""
+    if "hash" not in entry:
+        entry["hash"] = content_hash(entry["menu"])
+    return entry
 
 
 def get_menu_cache(date_str: str) -> list[str] | str | None:
     """캐시에서 메뉴 반환. 휴무이면 '휴무' 문자열, 없으면 None."""
-    _ensure_dirs()
-    path = MENU_CACHE_DIR / f"{date_str}.json"
-    if not path.exists():
-        return None
+    entry = get_menu_cache_entry(date_str)
+    return entry["menu"] if entry is not None else None
+
+
+def get_menu_cache_entry(date_str: str) -> dict | None:
+    """메타데이터 포함 캐시 항목 반환. 없으면 None.
+
+    항목 형식: {"menu": [...] | "휴무", "hash": 내용 해시, "fetched_at": ts, "expires_at": ts | None}
+    fetched_at은 내용이 마지막으로 바뀐 시각, expires_at이 None이면 만료 없음(휴무 등).
+    """
+    store = get_store()
+    entry = _menu_memory.get(date_str, lambda: store.menu_version(date_str))
+    if entry is not None:
+        CACHE_LOOKUPS.inc(cache="menu", result="memory")
+        return entry
+
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data
+        item = store.get_menu(date_str)
     except Exception as e:
         logger.warning(f"메뉴 캐시 읽기 실패 ({date_str}): {e}")
         return None
+    CACHE_LOOKUPS.inc(cache="menu", result="miss" if item is None else "store")
+    if item is None:
+        return None
+
+    entry, version = item
+    _with_hash(entry)
+    _menu_memory.put(date_str, entry, version)
+    return entry
+
+
+def get_menu_cache_range(start: date, end: date, cafeteria: str | None = None) -> dict[date, dict]:
+    """기간 내 캐시 항목을 한 번에 반환 (SQLite는 단일 쿼리)."""
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    result: dict[date, dict] = {}
+    for d in days:
+        entry = _menu_memory.get(menu_key(d.isoformat(), cafeteria))
+        if entry is None:
+            break
+        result[d] = entry
+    else:
+        return result
+
+    try:
+        rows = get_store().get_menus(menu_key(start.isoformat(), cafeteria), menu_key(end.isoformat(), cafeteria))
+    except Exception as e:
+        logger.warning(f"메뉴 캐시 범위 읽기 실패 ({start} ~ {end}): {e}")
+        return {}
+
+    result = {}
+    for key, (entry, version) in rows.items():
+        _with_hash(entry)
+        _menu_memory.put(key, entry, version)
+        result[_key_date(key)] = entry
+    return result
+
+
+def is_menu_cache_stale(entry: dict) -> bool:
+    """캐시 항목이 신선도 TTL을 지났는지 여부."""
+    expires_at = entry.get("expires_at")
+    return expires_at is not None and expires_at <= time.time()
 
 
 def save_menu_cache(date_str: str, menu: list[str] | str) -> None:
-    """메뉴 캐시 저장. 휴무이면 '휴무' 문자열 저장."""
-    _ensure_dirs()
-    path = MENU_CACHE_DIR / f"{date_str}.json"
+    """메뉴 캐시 저장. 휴무이면 '휴무' 문자열 저장(만료 없음)."""
+    store = get_store()
+    now = time.time()
+    entry = {
+        "menu": menu,
+        "hash": content_hash(menu),
+        "fetched_at": now,
+        "expires_at": None if menu == "휴무" else now + MENU_CACHE_TTL,
+    }
     try:
-        path.write_text(json.dumps(menu, ensure_ascii=False), encoding="utf-8")
-        logger.info(f"메뉴 캐시 저장: {date_str}")
+        version = store.put_menu(date_str, entry)
+        store.delete_meta(date_str)
+        _menu_memory.put(date_str, entry, version)
+        logger.debug(f"메뉴 캐시 저장: {date_str}")
     except Exception as e:
+        _menu_memory.invalidate(date_str)
         logger.warning(f"메뉴 캐시 저장 실패 ({date_str}): {e}")
+    for listener in _menu_write_listeners:
+        listener(date_str)
+
+
+def delete_menu_cache(date_str: str) -> None:
+    """메뉴 캐시 항목 삭제 (정정된 게시물에서 메뉴가 빠진 날짜). 파생 캐시(페이지)도 무효화."""
+    try:
+        get_store().delete_menu(date_str)
+        logger.info(f"메뉴 캐시 삭제: {date_str}")
+    except Exception as e:
+        logger.warning(f"메뉴 캐시 삭제 실패 ({date_str}): {e}")
+    _menu_memory.invalidate(date_str)
+    for listener in _menu_write_listeners:
+        listener(date_str)
+
+
+def touch_menu_cache(date_str: str, entry: dict) -> None:
+    """내용이 같은 항목의 신선도(expires_at)만 갱신. 파생 캐시(페이지·OG)는 무효화하지 않음."""
+    if entry.get("expires_at") is None:
+        return
+    touched = dict(entry, expires_at=time.time() + MENU_CACHE_TTL)
+    try:
+        version = get_store().put_menu(date_str, touched)
+        _menu_memory.put(date_str, touched, version)
+    except Exception as e:
+        _menu_memory.invalidate(date_str)
+        logger.warning(f"메뉴 캐시 갱신 실패 ({date_str}): {e}")
+
+
+def save_weekly_menu_cache(weekly: dict[date, list[str]], cafeteria: str | None = None) -> dict[date, str | None]:
+    """주간 파싱 결과를 저장된 해시와 비교해 바뀐 날짜만 다시 씀.
+
+    내용이 같은 날짜는 신선도만 갱신하고, 바뀐 날짜는 OG 이미지 인덱스를 지움 (블롭은 GC가 정리).
+    빈 메뉴(미기재)는 저장하지 않으며, 저장된 메뉴가 있던 날짜가 비어 돌아오면(정정 게시물에서 삭제)
+    메뉴 항목과 OG 이미지 인덱스를 지우고 바뀐 날짜로 보고함. 게시물에 없는 날짜는 건드리지 않음.
+    반환: {바뀐 날짜: 이전 해시 (처음 저장이면 None)}
+    """
+    if not weekly:
+        return {}
+    stored = get_menu_cache_range(min(weekly), max(weekly), cafeteria)
+    changed: dict[date, str | None] = {}
+    for d in sorted(weekly):
+        menu = weekly[d]
+        key = menu_key(d.isoformat(), cafeteria)
+        old = stored.get(d)
+        if not menu:
+            if old is not None:
+                changed[d] = old["hash"]
+                delete_menu_cache(key)
+                delete_og_cache(key)
+                logger.info(f"메뉴 삭제 감지: {key}")
+            continue
+        if old is not None and old["hash"] == content_hash(menu):
+            touch_menu_cache(key, old)
+            continue
+        changed[d] = old["hash"] if old is not None else None
+        save_menu_cache(key, menu)
+        if old is not None:
+            delete_og_cache(key)
+            logger.info(f"메뉴 변경 감지: {key}")
+    return changed
+
+
+def get_weekly_menu_cache(monday: date, cafeteria: str | None = None) -> dict[date, list[str]]:
+    """해당 주(월~금)의 캐시된 메뉴 목록 반환. 휴무/미캐시 날짜는 제외."""
+    entries = get_menu_cache_range(monday, monday + timedelta(days=4), cafeteria)
+    return {d: e["menu"] for d, e in entries.items() if isinstance(e["menu"], list)}
 
 
-def get_og_cache_path(date_str: str) -> Path | None:
-    """OG 이미지 캐시 파일 경로 반환. 없으면 None."""
-    _ensure_dirs()
-    path = OG_CACHE_DIR / f"{date_str}.png"
-    return path if path.exists() else None
+def get_negative_cache(date_str: str) -> dict | None:
+    """유효한(만료 전) 네거티브 캐시 항목 반환. 없거나 만료되었으면 None.
+
+    항목 형식: {"status": NOT_POSTED | CRAWL_ERROR, "checked_at": ts, "misses": n, "retry_at": ts}
+    """
+    entry = _read_negative_entry(date_str)
+    if entry is None or entry.get("retry_at", 0) <= time.time():
+        return None
+    return entry
+
+
+def get_negative_cache_range(start: date, end: date, cafeteria: str | None = None) -> dict[date, dict]:
+    """기간 내 유효한 네거티브 캐시 항목을 한 번에 반환 (SQLite는 단일 쿼리)."""
+    try:
+        rows = get_store().get_metas(menu_key(start.isoformat(), cafeteria), menu_key(end.isoformat(), cafeteria))
+    except Exception as e:
+        logger.warning(f"네거티브 캐시 범위 읽기 실패 ({start} ~ {end}): {e}")
+        return {}
+    now = time.time()
+    return {_key_date(key): entry for key, entry in rows.items() if entry.get("retry_at", 0) > now}
+
+
+def save_negative_cache(date_str: str, status: str) -> None:
+    """'T 시점 기준 메뉴 없음' 기록. 같은 상태가 반복되면 TTL을 지수적으로 늘림."""
+    prev = _read_negative_entry(date_str)
+    misses = prev["misses"] + 1 if prev and prev.get("status") == status else 1
+    ttl = min(NEGATIVE_TTL[status] * 2 ** (misses - 1), NEGATIVE_TTL_MAX)
+    now = time.time()
+    entry = {"status": status, "checked_at": now, "misses": misses, "retry_at": now + ttl}
+    try:
+        get_store().put_meta(date_str, entry)
+        logger.debug(f"네거티브 캐시 저장: {date_str} ({status}, {misses}회, {ttl}초)")
+    except Exception as e:
+        logger.warning(f"네거티브 캐시 저장 실패 ({date_str}): {e}")
+
+
+def _read_negative_entry(date_str: str) -> dict | None:
+    try:
+        return get_store().get_meta(date_str)
+    except Exception as e:
+        logger.warning(f"네거티브 캐시 읽기 실패 ({date_str}): {e}")
+        return None
+
+
+def get_crawl_state(key: str) -> dict | None:
+    """크롤러 상태(URL별 HTTP 검증자, 파싱 결과 등) 반환. 없으면 None."""
+    try:
+        return get_store().get_state(key)
+    except Exception as e:
+        logger.warning(f"크롤러 상태 읽기 실패 ({key}): {e}")
+        return None
 
 
-def save_og_cache(date_str: str, image_bytes: bytes) -> None:
-    """OG 이미지 캐시 저장."""
-    _ensure_dirs()
-    path = OG_CACHE_DIR / f"{date_str}.png"
+def save_crawl_state(key: str, state: dict) -> None:
+    """크롤러 상태 저장."""
     try:
-        path.write_bytes(image_bytes)
-        logger.info(f"OG 이미지 캐시 저장: {date_str}")
+        get_store().put_state(key, state)
     except Exception as e:
+        logger.warning(f"크롤러 상태 저장 실패 ({key}): {e}")
+
+
+def get_og_cache(date_str: str, blob_key: str) -> bytes | None:
+    """OG 이미지 캐시 바이트 반환(메모리 계층 우선). 없으면 None."""
+    entry = get_og_cache_entry(date_str, blob_key)
+    return entry[0] if entry is not None else None
+
+
+def get_og_cache_entry(date_str: str, blob_key: str) -> tuple[bytes, float] | None:
+    """OG 이미지 캐시 (바이트, 저장 시각 epoch 초) 반환. 없으면 None.
+
+    blob_key는 렌더링 입력 해시(og_image.render_key)이므로, 날짜 인덱스가 다른 블롭을 가리키면
+    (메뉴 변경 등) 조회되지 않음.
+    """
+    store = get_store()
+    key = f"{date_str}.{blob_key}"
+    entry = _og_memory.get(key, lambda: store.og_version(date_str, blob_key))
+    if entry is not None:
+        CACHE_LOOKUPS.inc(cache="og", result="memory")
+        _touch_og(date_str)
+        return entry
+
+    try:
+        item = store.get_og(date_str, blob_key)
+    except Exception as e:
+        logger.warning(f"OG 이미지 캐시 읽기 실패 ({date_str}): {e}")
+        return None
+    CACHE_LOOKUPS.inc(cache="og", result="miss" if item is None else "store")
+    if item is None:
+        return None
+
+    image_bytes, version = item
+    entry = (image_bytes, version / 1e9)
+    _og_memory.put(key, entry, version, size=len(image_bytes))
+    _touch_og(date_str)
+    return entry
+
+
+_og_touched: dict[str, float] = {}
+_og_touch_lock = threading.Lock()
+
+
+def _touch_og(date_str: str) -> None:
+    """OG 이미지 적중 시 접근 시각 기록 (GC의 LRU 축출 기준). 날짜별로 OG_TOUCH_INTERVAL에 한 번만 씀."""
+    now = time.time()
+    with _og_touch_lock:
+        if now - _og_touched.get(date_str, 0.0) < OG_TOUCH_INTERVAL:
+            return
+        _og_touched[date_str] = now
+    try:
+        get_store().touch_og(date_str, now)
+    except Exception as e:
+        logger.warning(f"OG 이미지 접근 시각 기록 실패 ({date_str}): {e}")
+
+
+def has_og_cache(date_str: str, blob_key: str) -> bool:
+    """날짜 인덱스가 해당 블롭을 가리키는지 (이미지 바이트는 읽지 않음)."""
+    try:
+        return get_store().og_version(date_str, blob_key) is not None
+    except Exception as e:
+        logger.warning(f"OG 이미지 캐시 조회 실패 ({date_str}): {e}")
+        return False
+
+
+def save_og_cache(date_str: str, blob_key: str, image_bytes: bytes) -> None:
+    """OG 이미지 캐시 저장. 같은 blob_key의 블롭이 이미 있으면 인덱스만 갱신 (중복 저장 없음)."""
+    key = f"{date_str}.{blob_key}"
+    try:
+        version = get_store().put_og(date_str, blob_key, image_bytes)
+        modified_at = version / 1e9 if version is not None else time.time()
+        _og_memory.put(key, (image_bytes, modified_at), version, size=len(image_bytes))
+        logger.debug(f"OG 이미지 캐시 저장: {date_str} ({blob_key[:12]})")
+    except Exception as e:
+        _og_memory.invalidate(key)
         logger.warning(f"OG 이미지 캐시 저장 실패 ({date_str}): {e}")
+
+
+def link_og_cache(date_str: str, blob_key: str) -> bytes | None:
+    """같은 렌더링 입력의 블롭이 이미 있으면 날짜 인덱스만 연결하고 바이트 반환. 없으면 None (렌더링 필요)."""
+    store = get_store()
+    try:
+        image_bytes = store.get_og_blob(blob_key)
+        if image_bytes is None:
+            return None
+        version = store.put_og(date_str, blob_key)
+    except Exception as e:
+        logger.warning(f"OG 이미지 블롭 연결 실패 ({date_str}): {e}")
+        return None
+    if version is None:  # 그 사이 GC가 블롭을 지움
+        return None
+    _og_memory.put(f"{date_str}.{blob_key}", (image_bytes, version / 1e9), version, size=len(image_bytes))
+    logger.debug(f"OG 이미지 블롭 재사용: {date_str} ({blob_key[:12]})")
+    return image_bytes
+
+
+def delete_og_cache(date_str: str) -> None:
+    """날짜의 OG 이미지 인덱스 삭제 (메뉴 변경 시). 블롭은 다른 날짜가 쓰지 않으면 GC가 지움."""
+    try:
+        get_store().delete_og(date_str)
+    except Exception as e:
+        logger.warning(f"OG 이미지 캐시 삭제 실패 ({date_str}): {e}")
+
+
+def gc_og_cache(keep_from: date) -> dict[str, int]:
+    """OG 이미지 저장소 GC + 압축. 스케줄러에서 주기적으로 호출.
+
+    1. 블롭이 사라진 인덱스 항목 삭제
+    2. 디스크 예산(OG_CACHE_MAX_BYTES)을 넘으면 가장 오래 안 쓰인 날짜부터 인덱스 삭제 (LRU,
+       keep_from 이후 날짜는 유지, 식당 구분 없음). 접근 시각은 적중 시 _touch_og가 기록
+    3. 어느 날짜도 가리키지 않는 블롭 중 OG_BLOB_GRACE보다 오래된 것 삭제
+    4. 저장소별 압축 (이전 형식 정리, SQLite VACUUM)
+    """
+    store = get_store()
+    result = {"dangling": 0, "evicted": 0, "blobs": 0, "compacted": 0, "bytes": 0}
+    try:
+        access = store.og_access()
+        index = store.og_index()
+        blobs = store.og_blobs()
+
+        for date_str in [d for d, key in index.items() if key not in blobs]:
+            store.delete_og(date_str)
+            del index[date_str]
+            result["dangling"] += 1
+
+        evicted_keys = set()
+        total = sum(blobs[key][0] for key in set(index.values()))
+        if total > OG_CACHE_MAX_BYTES:
+            # 접근 시각이 같으면 지난 날짜부터
+            for date_str in sorted(index, key=lambda d: (access.get(d, 0.0), _key_date(d))):
+                if total <= OG_CACHE_MAX_BYTES:
+                    break
+                if _key_date(date_str) >= keep_from:
+                    continue
+                key = index.pop(date_str)
+                store.delete_og(date_str)
+                result["evicted"] += 1
+                if key not in index.values():
+                    evicted_keys.add(key)
+                    total -= blobs[key][0]
+
+        referenced = set(index.values())
+        cutoff = time.time() - OG_BLOB_GRACE
+        for key, (size, created_at) in blobs.items():
+            # 예산 초과로 축출한 블롭은 유예 없이 삭제
+            if key not in referenced and (created_at < cutoff or key in evicted_keys):
+                store.delete_og_blob(key)
+                result["blobs"] += 1
+            elif key in referenced:
+                result["bytes"] += size
+
+        result["compacted"] = store.compact_og()
+    except Exception as e:
+        logger.warning(f"OG 이미지 캐시 GC 실패: {e}")
+        return result
+
+    _og_memory.clear()
+    with _og_touch_lock:
+        _og_touched.clear()
+    logger.info(f"OG 이미지 캐시 GC: {result}")
+    return result
+
+
+def migrate_file_cache_to_sqlite() -> dict[str, int]:
+    """기존 cache/menu, cache/og, cache/negative 디렉터리를 SQLite DB로 일괄 이전."""
+    source = FileStore(CACHE_ROOT, legacy_ttl=MENU_CACHE_TTL)
+    target = SQLiteStore(CACHE_DB_PATH)
+    counts = target.import_from(source)
+    _menu_memory.clear()
+    _og_memory.clear()
+    logger.info(f"캐시 마이그레이션 완료 → {CACHE_DB_PATH}: {counts}")
+    return counts
@@ -0,0 +1,609 @@
+"""캐시 저장소 백엔드.
+
+cache.py(TTL·네거티브 캐시·메모리 계층 정책)가 사용하는 저수준 저장소.
+- FileStore: 날짜별 JSON 파일 + OG 이미지 블롭 디렉터리 (원자적 쓰기)
+- SQLiteStore: 단일 SQLite 파일 (WAL, 날짜 인덱스 테이블, 범위 조회)
+
+OG 이미지는 렌더링 입력 해시(blob key)로 저장하는 콘텐츠 주소 블롭과 날짜 → 블롭 인덱스로 나뉜다.
+같은 입력의 렌더링은 블롭 하나를 공유하고, 인덱스에서 빠진 블롭은 GC가 지운다.
+
+모든 조회는 (값, 버전) 튜플을 반환하며, 버전은 메모리 계층이 다른 프로세스의
+쓰기를 감지하는 데 사용한다 (파일: mtime, SQLite: updated_at).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename — 동시 읽기에서 반쯤 쓰인 파일이 보이지 않음."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _legacy_menu_entry(data, fetched_at: float, ttl: int) -> dict:
+    """이전 형식(메뉴만 저장)을 메타데이터 포함 항목으로 변환."""
+    return {
+        "menu": data,
+        "fetched_at": fetched_at,
+        "expires_at": None if data == "휴무" else fetched_at + ttl,
+    }
+
+
+def _split_key(key: str) -> tuple[str, str]:
+    """캐시 키 → (식당 접두사, 날짜). 기본 식당 키("2026-03-02")는 접두사가 빈 문자열."""
+    prefix, _, date_str = key.rpartition("/")
+    return prefix, date_str
+
+
+class FileStore:
+    """cache/menu/<date>.json, cache/negative/<date>.json,
+    cache/og/blobs/<key[:2]>/<key>.png (블롭), cache/og/index/<date>.json (날짜 → 블롭),
+    cache/og/access/<date> (빈 파일, mtime = 마지막 접근 시각)
+
+    식당별 키("<식당>/<date>")는 각 디렉터리 아래 식당 하위 디렉터리에 저장.
+    """
+
+    def __init__(self, root: Path, legacy_ttl: int):
+        self.menu_dir = root / "menu"
+        self.og_dir = root / "og"
+        self.og_blob_dir = self.og_dir / "blobs"
+        self.og_index_dir = self.og_dir / "index"
+        self.og_access_dir = self.og_dir / "access"
+        self.meta_dir = root / "negative"
+        self.state_dir = root / "state"
+        self.legacy_ttl = legacy_ttl
+
+    def _ensure_dirs(self):
+        self.menu_dir.mkdir(parents=True, exist_ok=True)
+        self.og_blob_dir.mkdir(parents=True, exist_ok=True)
+        self.og_index_dir.mkdir(parents=True, exist_ok=True)
+        self.meta_dir.mkdir(parents=True, exist_ok=True)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """식당별 키면 하위 디렉터리를 만든 뒤 원자적 쓰기."""
+        try:
+            _atomic_write(path, data)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, data)
+
+    @staticmethod
+    def _version(path: Path) -> int | None:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    # 메뉴
+    def get_menu(self, date_str: str) -> tuple[dict, int] | None:
+        path = self.menu_dir / f"{date_str}.json"
+        try:
+            raw = path.read_bytes()
+            version = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            data = _legacy_menu_entry(data, version / 1e9, self.legacy_ttl)
+        return data, version
+
+    @staticmethod
+    def _dates_in(directory: Path, start: str, end: str) -> list[str]:
+        """디렉터리 목록 1회로 기간 내 <date>.json 파일의 키만 추림 (없는 날짜는 열지 않음).
+
+        start·end는 같은 식당의 키여야 함 (식당 하위 디렉터리만 훑음).
+        """
+        prefix, start = _split_key(start)
+        end = _split_key(end)[1]
+        try:
+            names = [entry.name for entry in os.scandir(directory / prefix if prefix else directory)]
+        except FileNotFoundError:
+            return []
+        return sorted(
+            f"{prefix}/{name[:-5]}" if prefix else name[:-5] for name in names
+            if name.endswith(".json") and not name.startswith(".") and start <= name[:-5] <= end
+        )
+
+    @staticmethod
+    def keys(directory: Path) -> list[str]:
+        """디렉터리의 모든 <키>.json (식당 하위 디렉터리 포함). 마이그레이션용."""
+        if not directory.exists():
+            return []
+        return sorted(
+            path.relative_to(directory).with_suffix("").as_posix()
+            for path in directory.rglob("*.json") if not path.name.startswith(".")
+        )
+
+    def get_menus(self, start: str, end: str) -> dict[str, tuple[dict, int]]:
+        result = {}
+        for date_str in self._dates_in(self.menu_dir, start, end):
+            try:
+                item = self.get_menu(date_str)
+            except Exception as e:
+                logger.warning(f"메뉴 캐시 읽기 실패 ({date_str}): {e}")
+                item = None
+            if item is not None:
+                result[date_str] = item
+        return result
+
+    def menu_version(self, date_str: str) -> int | None:
+        return self._version(self.menu_dir / f"{date_str}.json")
+
+    def put_menu(self, date_str: str, entry: dict) -> int | None:
+        self._ensure_dirs()
+        path = self.menu_dir / f"{date_str}.json"
+        self._write(path, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        return self._version(path)
+
+    def delete_menu(self, date_str: str) -> None:
+        (self.menu_dir / f"{date_str}.json").unlink(missing_ok=True)
+
+    # OG 이미지 (콘텐츠 주소 블롭 + 날짜 인덱스)
+    def _blob_path(self, key: str) -> Path:
+        return self.og_blob_dir / key[:2] / f"{key}.png"
+
+    def _index_path(self, date_str: str) -> Path:
+        return self.og_index_dir / f"{date_str}.json"
+
+    def _index_blob(self, date_str: str) -> tuple[str, int] | None:
+        path = self._index_path(date_str)
+        try:
+            raw = path.read_bytes()
+            version = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return json.loads(raw)["blob"], version
+
+    def get_og(self, date_str: str, key: str) -> tuple[bytes, int] | None:
+        item = self._index_blob(date_str)
+        if item is None or item[0] != key:
+            return None
+        try:
+            return self._blob_path(key).read_bytes(), item[1]
+        except FileNotFoundError:
+            return None
+
+    def og_version(self, date_str: str, key: str) -> int | None:
+        item = self._index_blob(date_str)
+        return item[1] if item is not None and item[0] == key else None
+
+    def get_og_blob(self, key: str) -> bytes | None:
+        try:
+            return self._blob_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put_og(self, date_str: str, key: str, image_bytes: bytes | None = None) -> int | None:
+        """블롭(없을 때만) + 인덱스 저장. image_bytes가 None이면 기존 블롭에 연결만 하며, 블롭이 없으면 None."""
+        self._ensure_dirs()
+        blob = self._blob_path(key)
+        if not blob.exists():
+            if image_bytes is None:
+                return None
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(blob, image_bytes)
+        index = self._index_path(date_str)
+        self._write(index, json.dumps({"blob": key}).encode("utf-8"))
+        return self._version(index)
+
+    def delete_og(self, date_str: str) -> None:
+        self._index_path(date_str).unlink(missing_ok=True)
+        (self.og_access_dir / date_str).unlink(missing_ok=True)
+
+    def touch_og(self, date_str: str, at: float) -> None:
+        """날짜 인덱스의 접근 시각 기록 (인덱스 파일의 mtime = 버전은 바꾸지 않음)."""
+        if not self._index_path(date_str).exists():
+            return
+        path = self.og_access_dir / date_str
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        os.utime(path, (at, at))
+
+    def og_access(self) -> dict[str, float]:
+        """{날짜 키: 마지막 접근 시각 epoch 초}. 접근 기록이 없거나 더 오래됐으면 인덱스 저장 시각."""
+        result = {}
+        for path in self.og_index_dir.rglob("*.json") if self.og_index_dir.exists() else []:
+            if path.name.startswith("."):
+                continue
+            date_str = path.relative_to(self.og_index_dir).with_suffix("").as_posix()
+            try:
+                accessed = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            try:
+                accessed = max(accessed, (self.og_access_dir / date_str).stat().st_mtime)
+            except FileNotFoundError:
+                pass
+            result[date_str] = accessed
+        return result
+
+    def og_index(self) -> dict[str, str]:
+        """{날짜 키: 블롭 key} 전체 (식당별 키 포함)."""
+        result = {}
+        for path in self.og_index_dir.rglob("*.json") if self.og_index_dir.exists() else []:
+            if path.name.startswith("."):
+                continue
+            try:
+                result[path.relative_to(self.og_index_dir).with_suffix("").as_posix()] = json.loads(path.read_bytes())["blob"]
+            except (OSError, ValueError, KeyError):
+                continue
+        return result
+
+    def og_blobs(self) -> dict[str, tuple[int, float]]:
+        """{블롭 key: (바이트, 저장 시각 epoch 초)} 전체."""
+        result = {}
+        for path in self.og_blob_dir.glob("*/*.png") if self.og_blob_dir.exists() else []:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            result[path.stem] = (st.st_size, st.st_mtime)
+        return result
+
+    def delete_og_blob(self, key: str) -> None:
+        self._blob_path(key).unlink(missing_ok=True)
+
+    def compact_og(self) -> int:
+        """이전 형식(cache/og/*.png) 이미지와 빈 블롭 디렉터리 정리. 지운 파일 수 반환."""
+        removed = 0
+        for path in self.og_dir.glob("*.png") if self.og_dir.exists() else []:
+            path.unlink(missing_ok=True)
+            removed += 1
+        for shard in self.og_blob_dir.iterdir() if self.og_blob_dir.exists() else []:
+            try:
+                shard.rmdir()  # 비어 있을 때만 성공
+            except OSError:
+                pass
+        # 인덱스가 없는 접근 기록 (삭제와 기록이 겹친 경우)
+        for path in self.og_access_dir.rglob("*") if self.og_access_dir.exists() else []:
+            date_str = path.relative_to(self.og_access_dir).as_posix()
+            if path.is_file() and not self._index_path(date_str).exists():
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    # 크롤링 메타데이터 (네거티브 캐시)
+    def get_meta(self, date_str: str) -> dict | None:
+        path = self.meta_dir / f"{date_str}.json"
+        try:
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def get_metas(self, start: str, end: str) -> dict[str, dict]:
+        result = {}
+        for date_str in self._dates_in(self.meta_dir, start, end):
+            try:
+                entry = self.get_meta(date_str)
+            except (OSError, ValueError) as e:
+                logger.warning(f"네거티브 캐시 읽기 실패 ({date_str}): {e}")
+                entry = None
+            if entry is not None:
+                result[date_str] = entry
+        return result
+
+    def put_meta(self, date_str: str, entry: dict) -> None:
+        self._ensure_dirs()
+        self._write(self.meta_dir / f"{date_str}.json", json.dumps(entry).encode("utf-8"))
+
+    def delete_meta(self, date_str: str) -> None:
+        (self.meta_dir / f"{date_str}.json").unlink(missing_ok=True)
+
+    # 크롤러 상태 (HTTP 검증자 등, 임의 key)
+    def _state_path(self, key: str) -> Path:
+        return self.state_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def get_state(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._state_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def put_state(self, key: str, value: dict) -> None:
+        self._ensure_dirs()
+        _atomic_write(self._state_path(key), json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+# 해제된 페이지가 이만큼 쌓이면 compact_og에서 VACUUM (파일 크기 회수)
+SQLITE_VACUUM_MIN_FREE_BYTES = 4 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS menu (
+    date TEXT PRIMARY KEY,
+    menu TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL,
+    updated_at INTEGER NOT NULL,
+    hash TEXT
+);
+CREATE TABLE IF NOT EXISTS og_blob (
+    key TEXT PRIMARY KEY,
+    png BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS og_index (
+    date TEXT PRIMARY KEY,
+    blob TEXT NOT NULL,
+    updated_at INTEGER NOT NULL,
+    accessed_at REAL
+);
+CREATE TABLE IF NOT EXISTS crawl_meta (
+    date TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    misses INTEGER NOT NULL,
+    retry_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS crawl_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+"""
+
+# 이전 스키마 DB에 추가할 열 (테이블, 열, 타입)
+_ADDED_COLUMNS = [
+    ("menu", "hash", "TEXT"),
+    ("og_index", "accessed_at", "REAL"),
+]
+
+
+class SQLiteStore:
+    """단일 SQLite 파일 저장소. 스레드별 연결, WAL 모드, 원자적 upsert."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+        for table, column, kind in _ADDED_COLUMNS:
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {kind}")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _now_version() -> int:
+        return time.time_ns()
+
+    # 메뉴
+    @staticmethod
+    def _menu_row(row) -> tuple[dict, int]:
+        menu, fetched_at, expires_at, updated_at, menu_hash = row
+        entry = {"menu": json.loads(menu), "fetched_at": fetched_at, "expires_at": expires_at}
+        if menu_hash is not None:
+            entry["hash"] = menu_hash
+        return entry, updated_at
+
+    def get_menu(self, date_str: str) -> tuple[dict, int] | None:
+        row = self._conn().execute(
+            "SELECT menu, fetched_at, expires_at, updated_at, hash FROM menu WHERE date = ?", (date_str,)
+        ).fetchone()
+        return self._menu_row(row) if row else None
+
+    def get_menus(self, start: str, end: str) -> dict[str, tuple[dict, int]]:
+        rows = self._conn().execute(
+            "SELECT date, menu, fetched_at, expires_at, updated_at, hash FROM menu WHERE date BETWEEN ? AND ?",
+            (start, end),
+        ).fetchall()
+        return {row[0]: self._menu_row(row[1:]) for row in rows}
+
+    def menu_version(self, date_str: str) -> int | None:
+        row = self._conn().execute("SELECT updated_at FROM menu WHERE date = ?", (date_str,)).fetchone()
+        return row[0] if row else None
+
+    def put_menu(self, date_str: str, entry: dict) -> int:
+        version = self._now_version()
+        self._conn().execute(
+            "INSERT INTO menu (date, menu, fetched_at, expires_at, updated_at, hash) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(date) DO UPDATE SET menu = excluded.menu, fetched_at = excluded.fetched_at, "
+            "expires_at = excluded.expires_at, updated_at = excluded.updated_at, hash = excluded.hash",
+            (
+                date_str,
+                json.dumps(entry["menu"], ensure_ascii=False),
+                entry["fetched_at"],
+                entry.get("expires_at"),
+                version,
+                entry.get("hash"),
+            ),
+        )
+        return version
+
+    def delete_menu(self, date_str: str) -> None:
+        self._conn().execute("DELETE FROM menu WHERE date = ?", (date_str,))
+
+    # OG 이미지 (콘텐츠 주소 블롭 + 날짜 인덱스)
+    def get_og(self, date_str: str, key: str) -> tuple[bytes, int] | None:
+        row = self._conn().execute(
+            "SELECT b.png, i.updated_at FROM og_index i JOIN og_blob b ON b.key = i.blob "
+            "WHERE i.date = ? AND i.blob = ?",
+            (date_str, key),
+        ).fetchone()
+        return (bytes(row[0]), row[1]) if row else None
+
+    def og_version(self, date_str: str, key: str) -> int | None:
+        row = self._conn().execute(
+            "SELECT updated_at FROM og_index WHERE date = ? AND blob = ?", (date_str, key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_og_blob(self, key: str) -> bytes | None:
+        row = self._conn().execute("SELECT png FROM og_blob WHERE key = ?", (key,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put_og(self, date_str: str, key: str, image_bytes: bytes | None = None) -> int | None:
+        """블롭(없을 때만) + 인덱스 저장. image_bytes가 None이면 기존 블롭에 연결만 하며, 블롭이 없으면 None."""
+        conn = self._conn()
+        version = self._now_version()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if image_bytes is not None:
+                conn.execute(
+                    "INSERT OR IGNORE INTO og_blob (key, png, size, created_at) VALUES (?, ?, ?, ?)",
+                    (key, sqlite3.Binary(image_bytes), len(image_bytes), time.time()),
+                )
+            elif conn.execute("SELECT 1 FROM og_blob WHERE key = ?", (key,)).fetchone() is None:
+                conn.execute("ROLLBACK")
+                return None
+            conn.execute(
+                "INSERT INTO og_index (date, blob, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET blob = excluded.blob, updated_at = excluded.updated_at",
+                (date_str, key, version),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return version
+
+    def delete_og(self, date_str: str) -> None:
+        self._conn().execute("DELETE FROM og_index WHERE date = ?", (date_str,))
+
+    def touch_og(self, date_str: str, at: float) -> None:
+        """날짜 인덱스의 접근 시각 기록 (updated_at = 버전은 바꾸지 않음)."""
+        self._conn().execute("UPDATE og_index SET accessed_at = ? WHERE date = ?", (at, date_str))
+
+    def og_access(self) -> dict[str, float]:
+        """{날짜 키: 마지막 접근 시각 epoch 초}. 접근 기록이 없거나 더 오래됐으면 인덱스 저장 시각."""
+        rows = self._conn().execute(
+            "SELECT date, MAX(COALESCE(accessed_at, 0), updated_at / 1e9) FROM og_index"
+        ).fetchall()
+        return dict(rows)
+
+    def og_index(self) -> dict[str, str]:
+        return dict(self._conn().execute("SELECT date, blob FROM og_index").fetchall())
+
+    def og_blobs(self) -> dict[str, tuple[int, float]]:
+        rows = self._conn().execute("SELECT key, size, created_at FROM og_blob").fetchall()
+        return {key: (size, created_at) for key, size, created_at in rows}
+
+    def delete_og_blob(self, key: str) -> None:
+        self._conn().execute("DELETE FROM og_blob WHERE key = ?", (key,))
+
+    def compact_og(self) -> int:
+        """이전 형식(og_image 테이블) 정리 후, 빈 페이지가 많으면 VACUUM. 지운 행 수 반환."""
+        conn = self._conn()
+        removed = 0
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'og_image'").fetchone():
+            removed = conn.execute("SELECT COUNT(*) FROM og_image").fetchone()[0]
+            conn.execute("DROP TABLE og_image")
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        if free_pages * page_size >= SQLITE_VACUUM_MIN_FREE_BYTES:
+            conn.execute("VACUUM")
+            # WAL 모드에서는 체크포인트 후에야 DB 파일 크기가 줄어듦
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    # 크롤링 메타데이터 (네거티브 캐시)
+    def get_meta(self, date_str: str) -> dict | None:
+        row = self._conn().execute(
+            "SELECT status, checked_at, misses, retry_at FROM crawl_meta WHERE date = ?", (date_str,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, checked_at, misses, retry_at = row
+        return {"status": status, "checked_at": checked_at, "misses": misses, "retry_at": retry_at}
+
+    def get_metas(self, start: str, end: str) -> dict[str, dict]:
+        rows = self._conn().execute(
+            "SELECT date, status, checked_at, misses, retry_at FROM crawl_meta WHERE date BETWEEN ? AND ?",
+            (start, end),
+        ).fetchall()
+        return {
+            date_str: {"status": status, "checked_at": checked_at, "misses": misses, "retry_at": retry_at}
+            for date_str, status, checked_at, misses, retry_at in rows
+        }
+
+    def put_meta(self, date_str: str, entry: dict) -> None:
+        self._conn().execute(
+            "INSERT INTO crawl_meta (date, status, checked_at, misses, retry_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(date) DO UPDATE SET status = excluded.status, checked_at = excluded.checked_at, "
+            "misses = excluded.misses, retry_at = excluded.retry_at",
+            (date_str, entry["status"], entry["checked_at"], entry["misses"], entry["retry_at"]),
+        )
+
+    def delete_meta(self, date_str: str) -> None:
+        self._conn().execute("DELETE FROM crawl_meta WHERE date = ?", (date_str,))
+
+    # 크롤러 상태 (HTTP 검증자 등, 임의 key)
+    def get_state(self, key: str) -> dict | None:
+        row = self._conn().execute("SELECT value FROM crawl_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_state(self, key: str, value: dict) -> None:
+        self._conn().execute(
+            "INSERT INTO crawl_state (key, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (key, json.dumps(value, ensure_ascii=False), self._now_version()),
+        )
+
+    def _import_og(self, date_str: str, key: str, image_bytes: bytes) -> None:
+        """import_from 트랜잭션 안에서 쓰는 put_og (자체 트랜잭션 없음)."""
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR IGNORE INTO og_blob (key, png, size, created_at) VALUES (?, ?, ?, ?)",
+            (key, sqlite3.Binary(image_bytes), len(image_bytes), time.time()),
+        )
+        conn.execute(
+            "INSERT INTO og_index (date, blob, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(date) DO UPDATE SET blob = excluded.blob, updated_at = excluded.updated_at",
+            (date_str, key, self._now_version()),
+        )
+
+    def import_from(self, source: FileStore) -> dict[str, int]:
+        """기존 파일 캐시 디렉터리를 한 번에 가져옴 (단일 트랜잭션)."""
+        counts = {"menu": 0, "og": 0, "meta": 0}
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key in source.keys(source.menu_dir):
+                try:
+                    item = source.get_menu(key)
+                except Exception as e:
+                    logger.warning(f"마이그레이션 건너뜀 ({key}): {e}")
+                    continue
+                if item is not None:
+                    self.put_menu(key, item[0])
+                    counts["menu"] += 1
+            # 인덱스에 연결된 블롭만 가져옴 (이전 형식 이미지는 다시 렌더링됨)
+            for date_str, key in sorted(source.og_index().items()):
+                image_bytes = source.get_og_blob(key)
+                if image_bytes is not None:
+                    self._import_og(date_str, key, image_bytes)
+                    counts["og"] += 1
+            for key in source.keys(source.meta_dir):
+                entry = source.get_meta(key)
+                if entry is not None:
+                    self.put_meta(key, entry)
+                    counts["meta"] += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return counts
@@ -1,12 +1,23 @@
+import contextvars
+import hashlib
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
+from urllib.parse import parse_qs, urlencode, urljoin, urlsplit, urlunsplit
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+import cache
+import metrics
+from metrics import CRAWL_DURATION, CRAWL_FETCHES, CRAWL_RETRIES
 
 load_dotenv()
 
@@ -15,6 +26,12 @@ logger = logging.getLogger(__name__)
 TARGET_URL = os.getenv("TARGET_URL", "https://www.sungshin.ac.kr/main_kor/11095/subview.do")
 CAFETERIA_KEYWORD = os.getenv("CAFETERIA_KEYWORD", "운정교내식당")
 
+# 색인할 식당: "slug=게시물 제목 키워드"를 쉼표로 구분 (예: "unjeong=운정교내식당,sujeong=수정캠퍼스 학생식당").
+# 첫 항목이 기본 식당 — 접두사 없는 경로(/, /weekly ...)와 캐시 키를 씀. 비우면 CAFETERIA_KEYWORD 하나
+_SLUG_PATTERN = re.compile(r"[a-z][a-z0-9-]*")
+# 기존 경로와 겹치는 slug는 쓸 수 없음
+RESERVED_SLUGS = {"static", "api", "og-image", "weekly", "metrics"}
+
 WEEKDAY_MAP = {0: "월", 1: "화", 2: "수", 3: "목", 4: "금"}
 
 HEADERS = {
@@ -28,47 +45,271 @@ HEADERS = {
 
 BASE_DOMAIN = "https://www.sungshin.ac.kr"
 MAX_RETRIES = 3
+# 식당별 상세 페이지를 동시에 가져오는 스레드 수
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+
+
+def _parse_cafeterias(raw: str) -> dict[str, str]:
+    cafeterias = {}
+    for part in raw.split(","):
+        slug, sep, keyword = (s.strip() for s in part.partition("="))
+        if not part.strip():
+            continue
+        if not sep or not keyword or not _SLUG_PATTERN.fullmatch(slug) or slug in RESERVED_SLUGS:
+            logger.warning(f"CAFETERIAS 항목 무시: '{part.strip()}'")
+            continue
+        cafeterias[slug] = keyword
+    return cafeterias
+
+
+CAFETERIAS = _parse_cafeterias(os.getenv("CAFETERIAS", "")) or {"unjeong": CAFETERIA_KEYWORD}
+DEFAULT_CAFETERIA = next(iter(CAFETERIAS))
+
+
+def cache_namespace(cafeteria: str) -> str | None:
+    """식당의 캐시 키 접두사 (cache.menu_key). 기본 식당은 None — 단일 식당 시절의 캐시를 그대로 씀."""
+    return None if cafeteria == DEFAULT_CAFETERIA else cafeteria
+
+
+def _default_html_parser() -> str:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+# HTML 파서: lxml이 설치되어 있으면 사용 (html.parser보다 수 배 빠름)
+HTML_PARSER = os.getenv("HTML_PARSER") or _default_html_parser()
+
+# 필요한 부분 트리만 만들기: 목록 페이지는 <a href>, 상세 페이지는 본문(.artclView)
+_LINK_STRAINER = SoupStrainer("a", href=True)
+_ARTICLE_STRAINER = SoupStrainer(class_="artclView")
+# 백필용 목록 페이지 파싱: 게시물 행(작성일 포함)과 페이지 링크
+_ROW_STRAINER = SoupStrainer("tr")
+_PAGING_STRAINER = SoupStrainer(class_="_paging")
+
+
+class CrawlError(Exception):
+    """학교 사이트 요청 실패 (게시물 미게시와 구분)."""
 
 
 def _make_session() -> requests.Session:
     session = requests.Session()
     session.headers.update(HEADERS)
+    # 재시도는 _get에서 처리하므로 어댑터 재시도는 끔
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
-def _get(session: requests.Session, url: str) -> requests.Response | None:
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_post_pool: ThreadPoolExecutor | None = None
+
+
+def get_session() -> requests.Session:
+    """프로세스 전역 keep-alive 세션 (커넥션 풀 재사용)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _make_session()
+    return _session
+
+
+def _get_post_pool() -> ThreadPoolExecutor:
+    global _post_pool
+    if _post_pool is None:
+        with _session_lock:
+            if _post_pool is None:
+                _post_pool = ThreadPoolExecutor(max_workers=max(1, CRAWL_CONCURRENCY), thread_name_prefix="crawl")
+    return _post_pool
+
+
+def _get(session: requests.Session, url: str, headers: dict | None = None) -> requests.Response | None:
     for attempt in range(MAX_RETRIES):
         try:
-            resp = session.get(url, timeout=15)
+            resp = session.get(url, headers=headers, timeout=15)
             resp.raise_for_status()
             return resp
         except Exception as e:
             logger.warning(f"요청 실패 ({attempt + 1}/{MAX_RETRIES}) {url}: {e}")
             if attempt < MAX_RETRIES - 1:
+                CRAWL_RETRIES.inc()
                 time.sleep(1)
     return None
 
 
-def get_weekly_post_url(session: requests.Session) -> str | None:
-    """목록 페이지에서 운정교내식당 게시물 URL 추출."""
-    resp = _get(session, TARGET_URL)
+def fetch_page(session: requests.Session, url: str) -> str:
+    """재시도 포함 GET으로 본문 반환. 조건부 요청 없음 (백필 목록 페이지처럼 매번 본문이 필요한 경우).
+
+    Raises:
+        CrawlError: 요청 실패.
+    """
+    resp = _get(session, url)
+    if not resp:
+        raise CrawlError(f"요청 실패: {url}")
+    return resp.text
+
+
+def _fetch_if_changed(session: requests.Session, url: str, derived: str) -> tuple[str | None, dict]:
+    """검증자(ETag/Last-Modified, 본문 해시)를 이용한 조건부 GET.
+
+    derived는 이전 응답에서 얻은 결과(게시물 URL, 파싱 결과 등)를 저장하는 상태 key.
+    그 결과가 저장되어 있을 때만 조건부 요청을 보냄.
+
+    Returns:
+        (본문, 새 상태). 변경 없음(304 또는 본문 해시 동일)이면 (None, 이전 상태).
+
+    Raises:
+        CrawlError: 요청 실패.
+    """
+    state = cache.get_crawl_state(url) or {}
+    headers = {}
+    if derived in state:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    page = "list" if url == TARGET_URL else "post"
+    with metrics.timed(f"crawl_{page}", CRAWL_DURATION, stage=f"{page}_fetch"):
+        resp = _get(session, url, headers=headers)
     if not resp:
+        CRAWL_FETCHES.inc(page=page, result="error")
+        raise CrawlError(f"요청 실패: {url}")
+
+    if resp.status_code == 304:
+        CRAWL_FETCHES.inc(page=page, result="not_modified")
+        logger.debug(f"변경 없음 (304): {url}")
+        return None, state
+
+    digest = hashlib.sha256(resp.content).hexdigest()
+    new_state = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "hash": digest,
+    }
+    if derived in state and state.get("hash") == digest:
+        CRAWL_FETCHES.inc(page=page, result="not_modified")
+        logger.debug(f"변경 없음 (본문 해시 동일): {url}")
+        cache.save_crawl_state(url, {**state, **new_state})
+        return None, state
+
+    CRAWL_FETCHES.inc(page=page, result="changed")
+    return resp.text, new_state
+
+
+# 목록 페이지 파싱 결과({식당: 게시물 URL})를 저장하는 상태 key. 식당 구성이 바뀌면 새 key가 되어
+# 이전 결과로 조건부 요청하지 않음
+_POST_URLS_KEY = "post_urls." + hashlib.sha1(
+    repr(sorted(CAFETERIAS.items())).encode("utf-8")
+).hexdigest()[:8]
+
+
+def get_weekly_post_urls(session: requests.Session) -> dict[str, str]:
+    """목록 페이지 1회 요청으로 식당별 최신 게시물 URL 추출. 요청 실패 시 CrawlError."""
+    try:
+        html, state = _fetch_if_changed(session, TARGET_URL, derived=_POST_URLS_KEY)
+    except CrawlError:
         logger.error("목록 페이지 요청 실패")
-        return None
+        raise CrawlError("목록 페이지 요청 실패")
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    if html is None:
+        return state[_POST_URLS_KEY]
 
-    # 게시물 링크 탐색: 제목에 키워드 포함된 <a> 태그
+    with metrics.timed("parse", CRAWL_DURATION, stage="parse"):
+        post_urls = find_post_urls(html)
+    missing = [CAFETERIAS[slug] for slug in CAFETERIAS if slug not in post_urls]
+    if missing:
+        logger.warning(f"게시물을 찾을 수 없습니다: {', '.join(missing)}")
+    if post_urls:
+        cache.save_crawl_state(TARGET_URL, {**state, _POST_URLS_KEY: post_urls})
+    return post_urls
+
+
+def find_post_urls(html: str) -> dict[str, str]:
+    """목록 페이지 HTML 한 번 파싱으로 식당별 첫(최신) 게시물 URL 반환. 게시물이 없는 식당은 빠짐."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_LINK_STRAINER)
+    found: dict[str, str] = {}
     for a in soup.find_all("a", href=True):
         title = a.get_text(strip=True)
-        if CAFETERIA_KEYWORD in title:
-            href = a["href"]
-            if href.startswith("http"):
-                return href
-            return BASE_DOMAIN + href
+        for slug, keyword in CAFETERIAS.items():
+            if slug not in found and keyword in title:
+                found[slug] = _absolute_url(a["href"])
+        if len(found) == len(CAFETERIAS):
+            break
+    return found
+
+
+def _absolute_url(href: str) -> str:
+    """게시판 링크를 절대 URL로 (목록 페이지 기준 — TARGET_URL을 스텁 서버로 바꿔도 같은 호스트를 따라감)."""
+    return urljoin(TARGET_URL, href)
+
+
+@dataclass(frozen=True)
+class BoardPost:
+    """목록 페이지의 게시물 한 건. posted는 작성일 (헤더 날짜의 연도 판단 기준), cafeteria는 식당 slug."""
+
+    url: str
+    title: str
+    posted: date | None
+    cafeteria: str = DEFAULT_CAFETERIA
+
+
+_POSTED_PATTERN = re.compile(r"(\d{4})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})")
+_PAGE_PATTERN = re.compile(r"[?&]page=(\d+)")
+
+
+def _cafeteria_of(title: str) -> str | None:
+    return next((slug for slug, keyword in CAFETERIAS.items() if keyword in title), None)
+
+
+def find_posts(html: str) -> list[BoardPost]:
+    """목록 페이지 HTML에서 제목에 식당 키워드가 포함된 게시물 전체 (페이지 내 순서 = 최신순)."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_ROW_STRAINER)
+    posts = []
+    seen = set()
+    for row in soup.find_all("tr"):
+        for a in row.find_all("a", href=True):
+            title = a.get_text(strip=True)
+            cafeteria = _cafeteria_of(title)
+            if cafeteria is None:
+                continue
+            url = _absolute_url(a["href"])
+            if url in seen:
+                continue
+            seen.add(url)
+            m = _POSTED_PATTERN.search(row.get_text(" ", strip=True))
+            posted = None
+            if m:
+                try:
+                    posted = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+                except ValueError:
+                    pass
+            posts.append(BoardPost(url, title, posted, cafeteria))
+    return posts
+
+
+def find_page_numbers(html: str) -> list[int]:
+    """목록 페이지 하단 페이지 링크(?page=N)의 번호들."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_PAGING_STRAINER)
+    numbers = set()
+    for a in soup.find_all("a", href=True):
+        m = _PAGE_PATTERN.search(a["href"])
+        if m:
+            numbers.add(int(m.group(1)))
+    return sorted(numbers)
 
-    logger.warning(f"'{CAFETERIA_KEYWORD}' 게시물을 찾을 수 없습니다.")
-    return None
+
+def list_page_url(page: int) -> str:
+    """게시판 목록 N페이지 URL (TARGET_URL에 page 쿼리 추가)."""
+    parts = urlsplit(TARGET_URL)
+    query = parse_qs(parts.query)
+    query["page"] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
 
 
 _DATE_PATTERN = re.compile(r"(\d{1,2})월\s*(\d{1,2})일")
@@ -90,107 +331,244 @@ def _is_menu_item(text: str) -> bool:
     return True
 
 
-def _parse_header_date(text: str, ref_year: int) -> date | None:
-    """헤더 셀 텍스트에서 날짜 추출. 예: "2월 23일 (월)" → date(2026, 2, 23)"""
+def _reference_date(ref: date | int) -> date:
+    # 연도만 주어지면 그해 한가운데를 기준으로 삼아 모든 월이 같은 연도로 해석되게 함
+    return ref if isinstance(ref, date) else date(ref, 7, 1)
+
+
+def _parse_header_date(text: str, ref: date | int) -> date | None:
+    """헤더 셀 텍스트에서 날짜 추출. 예: "2월 23일 (월)" → date(2026, 2, 23)
+
+    헤더에는 연도가 없으므로 ref(기준 날짜 — 요청 날짜나 게시물 작성일)에 가장 가까운 연도를 고름.
+    기준이 날짜면 요일이 맞는 연도를 우선해, 기준이 게시물과 몇 달 떨어져 있어도 다른 해로 해석하지 않음.
+    연말·연초에 걸친 주(12월 29일 ~ 1월 2일)도 올바른 연도로 해석됨.
+    """
     m = _DATE_PATTERN.search(text)
     if not m:
         return None
     month, day = int(m.group(1)), int(m.group(2))
-    try:
-        return date(ref_year, month, day)
-    except ValueError:
+    anchor = _reference_date(ref)
+    candidates = []
+    for year in (anchor.year - 1, anchor.year, anchor.year + 1):
+        try:
+            candidates.append(date(year, month, day))
+        except ValueError:
+            continue
+    if not candidates:
         return None
+    weekday = _DAY_PATTERN.search(text)
+    if weekday and isinstance(ref, date):
+        matching = [d for d in candidates if WEEKDAY_MAP.get(d.weekday()) == weekday.group(1)]
+        candidates = matching or candidates
+    return min(candidates, key=lambda d: abs((d - anchor).days))
+
+
+def parse_weekly_table(post_url: str, session: requests.Session, ref: date | int) -> dict[date, list[str]]:
+    """상세 페이지를 가져와 날짜별 메뉴 파싱. 변경 없으면 이전 파싱 결과 재사용.
+
+    저장하는 파싱 결과는 연도 없는 헤더 날짜별 메뉴이고, 연도는 호출마다 ref 기준으로 다시 해석함
+    (먼저 크롤링한 요청의 기준 날짜가 이후 요청의 날짜를 정하지 않도록).
+
+    Returns:
+        {date(2026,2,23): [...], date(2026,2,24): [...], ...} 형태 dict. 파싱 실패 시 빈 dict.
+
+    Raises:
+        CrawlError: 상세 페이지 요청 실패.
+    """
+    try:
+        html, state = _fetch_if_changed(session, post_url, derived="days")
+    except CrawlError:
+        logger.error(f"상세 페이지 요청 실패: {post_url}")
+        raise CrawlError(f"상세 페이지 요청 실패: {post_url}")
+
+    if html is None:
+        return _resolve_days(state["days"], ref)
+
+    with metrics.timed("parse", CRAWL_DURATION, stage="parse"):
+        days = _parse_weekly_days(html)
+    if days:
+        cache.save_crawl_state(post_url, {**state, "days": days})
+    return _resolve_days(days, ref)
 
 
-def parse_weekly_table(post_url: str, session: requests.Session, ref_year: int) -> dict[date, list[str]]:
+def parse_weekly_html(html: str, ref: date | int) -> dict[date, list[str]]:
     """상세 페이지 HTML 테이블에서 날짜별 메뉴 파싱.
 
     헤더 셀 형식: "2월 23일 (월)", "2월 24일(화)" 등
     실제 날짜(date 객체)를 키로 반환하여 지난 주 게시물 오매칭 방지.
+    ref: 연도 판단 기준 날짜 (연도만 주면 모든 날짜를 그해로 해석).
 
     Returns:
         {date(2026,2,23): [...], date(2026,2,24): [...], ...} 형태 dict. 실패 시 빈 dict.
     """
-    resp = _get(session, post_url)
-    if not resp:
-        logger.error(f"상세 페이지 요청 실패: {post_url}")
-        return {}
+    return _resolve_days(_parse_weekly_days(html), ref)
+
+
+def _resolve_days(days: dict[str, list[str]], ref: date | int) -> dict[date, list[str]]:
+    """헤더 날짜별 메뉴를 ref 기준으로 연도를 붙여 날짜별 메뉴로."""
+    result: dict[date, list[str]] = {}
+    for header, items in days.items():
+        d = _parse_header_date(header, ref)
+        if d:
+            result[d] = items
+    return result
+
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_weekly_days(html: str) -> dict[str, list[str]]:
+    """상세 페이지 HTML 테이블에서 헤더 날짜별 메뉴 파싱 (연도 해석 전).
 
-    container = soup.find(class_="artclView") or soup
+    Returns:
+        {"2월 23일 (월)": [...], ...} 형태 dict (헤더 날짜는 공백을 정규화). 실패 시 빈 dict.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_ARTICLE_STRAINER)
+    container = soup.find(class_="artclView")
+    if container is None:
+        # 본문 영역이 없는 페이지 구조: 전체 트리에서 탐색
+        container = BeautifulSoup(html, HTML_PARSER)
     tables = container.find_all("table")
 
     if not tables:
         logger.warning("테이블을 찾을 수 없습니다.")
         return {}
 
-    result: dict[date, list[str]] = {}
+    result: dict[str, list[str]] = {}
 
     for table in tables:
         rows = table.find_all("tr")
         if len(rows) < 2:
             continue
 
-        # 헤더 행에서 날짜→컬럼 인덱스 매핑
-        date_indices: dict[date, int] = {}
+        # 헤더 행에서 헤더 날짜→컬럼 인덱스 매핑
+        header_indices: dict[str, int] = {}
         header_row_idx = 0
 
         for r_idx, row in enumerate(rows[:3]):
             cells = row.find_all(["th", "td"])
-            indices: dict[date, int] = {}
+            # 날짜 셀이 3개 이상일 수 없는 행은 셀 텍스트를 추출하지 않고 건너뜀
+            if len(cells) < 3 or not _DAY_PATTERN.search(row.get_text(strip=True)):
+                continue
+            indices: dict[str, int] = {}
             for i, cell in enumerate(cells):
-                text = cell.get_text(strip=True)
-                if _DAY_PATTERN.search(text):  # 요일 괄호 포함 셀만
-                    d = _parse_header_date(text, ref_year)
-                    if d:
-                        indices[d] = i
+                header = _header_day(cell.get_text(strip=True))
+                if header:
+                    indices[header] = i
             if len(indices) >= 3:
-                date_indices = indices
+                header_indices = indices
                 header_row_idx = r_idx
                 break
 
-        if not date_indices:
+        if not header_indices:
             continue
 
-        for d in date_indices:
-            result[d] = []
+        for header in header_indices:
+            result[header] = []
 
         for row in rows[header_row_idx + 1:]:
             cells = row.find_all(["td", "th"])
-            for d, idx in date_indices.items():
+            for header, idx in header_indices.items():
                 if idx < len(cells):
                     text = cells[idx].get_text(separator="\n", strip=True)
                     items = [line.strip() for line in text.splitlines() if _is_menu_item(line.strip())]
-                    result[d].extend(items)
+                    result[header].extend(items)
 
         if result:
             break
 
     if result:
-        logger.info(f"메뉴 파싱 성공: {sorted(result.keys())}")
+        logger.info(f"메뉴 파싱 성공: {list(result)}")
     else:
         logger.warning("날짜별 메뉴 파싱 실패")
 
     return result
 
 
-def get_menu_for_date(target_date: date) -> list[str] | None:
+def _header_day(text: str) -> str | None:
+    """요일 괄호가 있는 헤더 셀의 날짜를 "2월 23일 (월)" 형태로 정규화. 날짜 셀이 아니면 None."""
+    day = _DAY_PATTERN.search(text)  # 요일 괄호 포함 셀만
+    m = _DATE_PATTERN.search(text) if day else None
+    if not m or not 1 <= int(m.group(1)) <= 12 or not 1 <= int(m.group(2)) <= 31:
+        return None
+    return f"{int(m.group(1))}월 {int(m.group(2))}일 ({day.group(1)})"
+
+
+def get_all_weekly_menus(ref_date: date) -> dict[str, dict[date, list[str]] | None]:
+    """목록 페이지 1회 + 식당별 상세 페이지 병렬 크롤링으로 모든 식당의 주간 메뉴 반환.
+
+    이미 알고 있는 게시물이 모든 식당에 대해 ref_date의 주를 포함하면 목록 페이지는 건너뜀.
+
+    Returns:
+        {식당 slug: {날짜: 메뉴}}. 게시물이 없거나 파싱 실패면 빈 dict, 상세 페이지 요청 실패면 None.
+
+    Raises:
+        CrawlError: 목록 페이지 요청 실패.
+    """
+    session = get_session()
+    post_urls = _known_post_urls(ref_date)
+    if post_urls is None:
+        post_urls = get_weekly_post_urls(session)
+
+    results: dict[str, dict[date, list[str]] | None] = {slug: {} for slug in CAFETERIAS}
+    targets = {slug: url for slug, url in post_urls.items() if slug in CAFETERIAS}
+
+    def parse(slug: str) -> dict[date, list[str]] | None:
+        try:
+            return parse_weekly_table(targets[slug], session, ref=ref_date)
+        except CrawlError:
+            return None
+
+    if len(targets) > 1:
+        # 요청 프로파일(metrics.timed)이 워커 스레드에서도 이어지도록 컨텍스트를 복사해 실행
+        contexts = [contextvars.copy_context() for _ in targets]
+        results.update(zip(targets, _get_post_pool().map(lambda ctx, slug: ctx.run(parse, slug), contexts, targets)))
+    else:
+        # 식당이 하나면 스레드 없이 바로 파싱
+        results.update((slug, parse(slug)) for slug in targets)
+    return results
+
+
+def get_weekly_menus(ref_date: date, cafeteria: str | None = None) -> dict[date, list[str]]:
+    """한 식당(기본: DEFAULT_CAFETERIA)의 주간 전체(날짜별) 메뉴 반환.
+
+    게시물이 없거나 파싱 실패 시 빈 dict, 사이트 요청 실패 시 CrawlError.
+    """
+    cafeteria = cafeteria or DEFAULT_CAFETERIA
+    weekly = get_all_weekly_menus(ref_date).get(cafeteria, {})
+    if weekly is None:
+        raise CrawlError(f"상세 페이지 요청 실패 ({CAFETERIAS[cafeteria]})")
+    return weekly
+
+
+def _known_post_urls(ref_date: date) -> dict[str, str] | None:
+    """마지막으로 확인한 식당별 게시물이 모두 ref_date와 같은 주를 다루면 그 URL들 반환."""
+    post_urls = (cache.get_crawl_state(TARGET_URL) or {}).get(_POST_URLS_KEY)
+    if not post_urls or any(slug not in post_urls for slug in CAFETERIAS):
+        return None
+    week = ref_date.isocalendar()[:2]
+    for post_url in post_urls.values():
+        days = (cache.get_crawl_state(post_url) or {}).get("days") or {}
+        if not any(d.isocalendar()[:2] == week for d in _resolve_days(days, ref_date)):
+            return None
+    return post_urls
+
+
+def get_menu_for_date(target_date: date, cafeteria: str | None = None) -> list[str] | None:
     """주어진 날짜의 메뉴 반환. 날짜 불일치(지난 주 게시물 등)이면 None."""
     if target_date.weekday() >= 5:
-        logger.info(f"{target_date}: 주말")
+        logger.debug(f"{target_date}: 주말")
         return None
 
-    session = _make_session()
-    post_url = get_weekly_post_url(session)
-    if not post_url:
+    try:
+        weekly = get_weekly_menus(target_date, cafeteria)
+    except CrawlError:
         return None
-
-    logger.info(f"게시물 URL: {post_url}")
-    weekly = parse_weekly_table(post_url, session, ref_year=target_date.year)
     if not weekly:
         return None
 
+    return pick_menu(weekly, target_date)
+
+
+def pick_menu(weekly: dict[date, list[str]], target_date: date) -> list[str] | None:
+    """주간 파싱 결과에서 해당 날짜 메뉴 추출. 없거나 비어 있으면 None."""
     menu = weekly.get(target_date)
     if menu is None:
         logger.warning(
@@ -0,0 +1,30 @@
+"""gunicorn 운영 설정 (현재 디렉터리의 이 파일을 자동으로 읽음).
+
+    uv run gunicorn "app:create_app()"
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5005')}"
+
+# 워커 프로세스 수 (0이면 CPU 코어 수 × 2 + 1)
+workers = int(os.getenv("WEB_CONCURRENCY", "0")) or multiprocessing.cpu_count() * 2 + 1
+# 워커마다 OG 사전 렌더링 프로세스 풀이 생기므로, 앱(prerender)이 기본 풀 크기를 워커 수로 나눌 수 있게 전달
+os.environ["GUNICORN_WORKERS"] = str(workers)
+# 캐시 미스 시 크롤링은 I/O 대기이므로 워커마다 스레드 여러 개
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# 워커마다 create_app()을 호출하도록 fork 전에 앱을 로드하지 않음
+# (스케줄러 스레드와 리더 잠금이 fork로 복제되면 안 됨)
+preload_app = False
+
+# 크롤링 + OG 이미지 렌더링이 겹쳐도 워커가 죽지 않도록 여유 있게
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# 로그는 앱 logging 설정(logs/app.log + stderr)을 그대로 사용
+errorlog = "-"
+accesslog = None
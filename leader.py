@@ -0,0 +1,82 @@
+"""예약 작업 리더 선출.
+
+여러 워커 프로세스(gunicorn 등)가 같은 cache/ 볼륨을 쓸 때, 비차단 파일 잠금을 먼저 잡은 프로세스
+하나만 스케줄러를 실행합니다. 잠금은 프로세스가 살아 있는 동안 유지되며, 리더가 종료되면 OS가
+잠금을 풀어 주므로 남은 프로세스 중 하나가 다음 재시도 때 리더가 됩니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows: 단일 프로세스로 보고 항상 리더
+    fcntl = None
+
+LEADER_LOCK_PATH = Path(os.getenv("LEADER_LOCK_PATH", "cache/locks/scheduler.lock"))
+# 리더가 아닌 프로세스의 잠금 재시도 간격(초)
+LEADER_RETRY_INTERVAL = float(os.getenv("LEADER_RETRY_INTERVAL", "30"))
+
+logger = logging.getLogger(__name__)
+
+_lock_file = None
+_started = False
+_state_lock = threading.Lock()
+
+
+def try_acquire() -> bool:
+    """리더 잠금 획득 시도 (비차단). 이미 이 프로세스가 리더면 True."""
+    global _lock_file
+    if fcntl is None or _lock_file is not None:
+        return True
+
+    LEADER_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    f = open(LEADER_LOCK_PATH, "a+")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return False
+
+    # 디버깅용으로 현재 리더 PID 기록 (잠금 자체는 파일 내용과 무관)
+    f.seek(0)
+    f.truncate()
+    f.write(f"{os.getpid()}\n")
+    f.flush()
+    _lock_file = f
+    return True
+
+
+def is_leader() -> bool:
+    return fcntl is None or _lock_file is not None
+
+
+def run_when_leader(on_elected: Callable[[], None]) -> None:
+    """리더가 되면 on_elected()를 한 번 호출. 지금 잠금을 못 잡으면 백그라운드에서 주기적으로 재시도.
+
+    프로세스당 한 번만 유효 (이후 호출은 무시).
+    """
+    global _started
+    with _state_lock:
+        if _started:
+            return
+        _started = True
+
+    if try_acquire():
+        logger.info(f"[리더] pid {os.getpid()} 리더 선출 — 예약 작업 실행")
+        on_elected()
+        return
+
+    logger.info(f"[리더] pid {os.getpid()} 대기 — 다른 프로세스가 예약 작업 실행 중")
+
+    def wait_for_leadership():
+        while not try_acquire():
+            time.sleep(LEADER_RETRY_INTERVAL)
+        logger.info(f"[리더] pid {os.getpid()} 리더 승계 — 예약 작업 실행")
+        on_elected()
+
+    threading.Thread(target=wait_for_leadership, name="leader-election", daemon=True).start()
@@ -0,0 +1,226 @@
+"""로깅 설정: 큐 기반 비동기 기록, 파일 회전, JSON 줄 형식, 모듈별 레벨.
+
+요청 스레드는 QueueHandler로 레코드를 큐에 넣기만 하고, 파일·stderr 기록은 프로세스마다
+백그라운드 QueueListener 스레드 하나가 처리합니다.
+
+- 회전: LOG_ROTATE=size(LOG_MAX_BYTES 넘으면) | time(LOG_ROTATE_WHEN 주기), 백업 LOG_BACKUP_COUNT개.
+  gunicorn 워커 여럿이 같은 파일에 쓰므로 회전은 잠금 파일로 직렬화하고, 다른 프로세스가 이미
+  회전했으면(inode 변경) 다시 회전하지 않고 새 파일을 엶
+- 형식: LOG_FORMAT=text(기본) | json (한 줄에 JSON 객체 하나. 요청 중 기록이면 request_id, request_ms 포함)
+- 레벨: LOG_LEVEL(루트), LOG_LEVELS="cache=DEBUG,crawler=WARNING" (모듈 로거별)
+- 접근 로그: LOG_ACCESS=true면 요청마다 access 로거로 메서드·경로·상태·처리 시간 기록
+"""
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 회전 잠금 없음
+    fcntl = None
+
+LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_ROTATE = os.getenv("LOG_ROTATE", "size").lower()
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", "midnight")
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+LOG_ACCESS = os.getenv("LOG_ACCESS", "false").lower() == "true"
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+access_logger = logging.getLogger("access")
+
+# 현재 요청 (요청 ID, 시작 시각 perf_counter). 요청 밖이면 None
+_request: contextvars.ContextVar[tuple[str, float] | None] = contextvars.ContextVar("log_request", default=None)
+_listener: logging.handlers.QueueListener | None = None
+
+
+def start_request(request_id: str) -> contextvars.Token:
+    """이후 현재 컨텍스트의 로그 레코드에 request_id·request_ms를 붙임. 토큰은 end_request()에 넘김."""
+    return _request.set((request_id, time.perf_counter()))
+
+
+def end_request(token: contextvars.Token) -> None:
+    _request.reset(token)
+
+
+class _RequestFilter(logging.Filter):
+    # QueueHandler에 붙여 기록한 스레드에서 실행 (리스너 스레드에서는 요청 컨텍스트를 알 수 없음)
+    def filter(self, record: logging.LogRecord) -> bool:
+        current = _request.get()
+        if current is not None and not hasattr(record, "request_id"):
+            record.request_id = current[0]
+            record.request_ms = round((time.perf_counter() - current[1]) * 1000, 1)
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """기본 QueueHandler는 예외 트레이스백을 메시지에 합치므로, exc_text로 따로 넘겨 JSON에서 필드로 남김."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄 JSON. extra로 넘긴 값(요청 ID, 처리 시간 등)도 필드로 포함."""
+
+    _RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+        }
+        for key, value in vars(record).items():
+            if key not in self._RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _SharedRotationMixin:
+    """여러 프로세스가 같은 파일을 회전할 때: 잠금 파일로 직렬화하고, 다른 프로세스가 이미 회전했으면
+    (경로의 inode가 열린 파일과 다르면) 회전 대신 새 파일을 다시 엶."""
+
+    def _lock_file(self):
+        if fcntl is None:
+            return None
+        lock = getattr(self, "_lock_fd", None)
+        if lock is None:
+            lock = self._lock_fd = open(self.baseFilename + ".lock", "a")
+        return lock
+
+    def _reopen_if_rotated(self) -> bool:
+        if self.stream is None:
+            return False
+        try:
+            path_stat = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            path_stat = None
+        open_stat = os.fstat(self.stream.fileno())
+        if path_stat is not None and (path_stat.st_dev, path_stat.st_ino) == (open_stat.st_dev, open_stat.st_ino):
+            return False
+        self.stream.close()
+        self.stream = self._open()
+        return True
+
+    def _after_external_rotation(self) -> None:
+        pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        lock = self._lock_file()
+        if lock is None:
+            super().emit(record)
+            return
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if self._reopen_if_rotated():
+                self._after_external_rotation()
+            super().emit(record)
+        except Exception:
+            self.handleError(record)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class SharedRotatingFileHandler(_SharedRotationMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class SharedTimedRotatingFileHandler(_SharedRotationMixin, logging.handlers.TimedRotatingFileHandler):
+    def _after_external_rotation(self) -> None:
+        self.rolloverAt = self.computeRollover(int(time.time()))
+
+
+def _file_handler(path: Path, problems: list[str]) -> logging.Handler:
+    """설정 오류는 problems에 모아 두었다가 로거 설정 후 경고로 기록."""
+    if LOG_ROTATE == "time":
+        try:
+            return SharedTimedRotatingFileHandler(
+                path, when=LOG_ROTATE_WHEN, backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+            )
+        except ValueError:
+            problems.append(f"알 수 없는 LOG_ROTATE_WHEN '{LOG_ROTATE_WHEN}' — midnight 사용")
+            return SharedTimedRotatingFileHandler(
+                path, when="midnight", backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+            )
+    if LOG_ROTATE != "size":
+        problems.append(f"알 수 없는 LOG_ROTATE '{LOG_ROTATE}' — size 사용")
+    return SharedRotatingFileHandler(
+        path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+    )
+
+
+def _parse_levels(raw: str) -> dict[str, str]:
+    levels = {}
+    for part in raw.split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure(filename: str = "app.log") -> None:
+    """루트 로거를 큐 + 백그라운드 리스너(파일 회전 + stderr)로 설정. 프로세스당 한 번만 적용."""
+    global _listener
+    if _listener is not None:
+        return
+
+    # 잘못된 설정값은 시작을 막지 않고 기본값으로 대신한 뒤 경고
+    problems: list[str] = []
+    if LOG_FORMAT not in ("text", "json"):
+        problems.append(f"알 수 없는 LOG_FORMAT '{LOG_FORMAT}' — text 사용")
+    formatter = JSONFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    handlers = [_file_handler(LOG_DIR / filename, problems), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(_RequestFilter())
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    try:
+        root.setLevel(LOG_LEVEL)
+    except ValueError:
+        root.setLevel(logging.INFO)
+        problems.append(f"알 수 없는 LOG_LEVEL '{LOG_LEVEL}' — INFO 사용")
+    for name, level in _parse_levels(LOG_LEVELS).items():
+        try:
+            logging.getLogger(name).setLevel(level)
+        except ValueError:
+            problems.append(f"알 수 없는 로그 레벨 무시: {name}={level}")
+    for problem in problems:
+        root.warning(problem)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # 종료 시 큐에 남은 레코드를 마저 기록
+    atexit.register(_listener.stop)
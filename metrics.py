@@ -0,0 +1,311 @@
+"""Prometheus 텍스트 형식 지표와 요청별 프로파일링.
+
+외부 라이브러리 없이 카운터·히스토그램을 프로세스 안에 모으고, 워커가 여럿(gunicorn)이어도
+합친 값을 보여 주도록 프로세스마다 METRICS_DIR/<pid>.json 스냅숏을 주기적으로 씁니다.
+/metrics 응답은 모든 스냅숏을 합친 값입니다 (카운터·히스토그램은 종료된 프로세스 것도 합산,
+게이지는 살아 있는 프로세스만).
+
+프로파일링: 요청마다 profile()로 켜면 그 요청에서 timed() 구간의 시간이 모여
+Server-Timing 헤더로 돌아갑니다 (app.py의 PROFILE_TOKEN 참고).
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable
+
+# 프로세스별 스냅숏 디렉터리. 비우면 현재 프로세스 값만 보여 줌
+_METRICS_DIR = os.getenv("METRICS_DIR", "cache/metrics")
+METRICS_DIR = Path(_METRICS_DIR) if _METRICS_DIR else None
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "10"))
+# 종료된 프로세스의 스냅숏 보관 기간(초). 지나면 삭제 (카운터가 줄어든 것은 Prometheus가 리셋으로 처리)
+METRICS_RETENTION = int(os.getenv("METRICS_RETENTION", "86400"))
+
+PREFIX = "wjmenu_"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_metrics: dict[str, "_Metric"] = {}
+_collectors: list[Callable[[], Iterable[tuple[str, str, str, dict, float]]]] = []
+_flusher_pid: int | None = None
+
+
+def _label_key(labels: dict) -> str:
+    return json.dumps(sorted(labels.items()), ensure_ascii=False)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str):
+        self.name = PREFIX + name
+        self.help = help
+        self._values: dict[str, object] = {}
+        with _lock:
+            _metrics[self.name] = self
+
+    def _reset(self) -> None:
+        self._values = {}
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        _ensure_flusher()
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램. 값: [버킷별 개수..., +Inf 개수, 합계]"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with _lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[len(self.buckets)] += 1
+            counts[-1] += value
+        _ensure_flusher()
+
+
+def add_collector(fn: Callable[[], Iterable[tuple[str, str, str, dict, float]]]) -> None:
+    """스냅숏 시점에 값을 읽어 오는 지표 등록 (메모리 캐시 통계 등).
+
+    fn()은 (이름, 설명, 'counter' | 'gauge', 라벨, 값)을 내놓음.
+    """
+    _collectors.append(fn)
+
+
+# 요청별 프로파일: 켜진 요청에서만 [(구간 이름, 초)] 목록이 있음
+_profile: contextvars.ContextVar[list | None] = contextvars.ContextVar("profile", default=None)
+
+
+def profile() -> contextvars.Token:
+    """현재 컨텍스트(요청)의 프로파일링 시작. 반환한 토큰을 end_profile()에 넘김."""
+    return _profile.set([])
+
+
+def end_profile(token: contextvars.Token) -> list[tuple[str, float]]:
+    spans = _profile.get() or []
+    _profile.reset(token)
+    return spans
+
+
+@contextmanager
+def timed(span: str, histogram: Histogram | None = None, **labels):
+    """구간 시간을 히스토그램에 기록하고, 프로파일링 중이면 span 이름으로 남김."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if histogram is not None:
+            histogram.observe(elapsed, **labels)
+        spans = _profile.get()
+        if spans is not None:
+            spans.append((span, elapsed))
+
+
+def server_timing(spans: list[tuple[str, float]], total: float) -> str:
+    """Server-Timing 헤더 값. 같은 이름의 구간은 합치고 횟수를 desc로 표시."""
+    merged: dict[str, list] = {}
+    for name, elapsed in spans:
+        item = merged.setdefault(name, [0.0, 0])
+        item[0] += elapsed
+        item[1] += 1
+    parts = [
+        f'{name};dur={elapsed * 1000:.1f}' + (f';desc="x{count}"' if count > 1 else "")
+        for name, (elapsed, count) in merged.items()
+    ]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _snapshot() -> dict:
+    metrics = {}
+    with _lock:
+        for metric in _metrics.values():
+            entry = {"type": metric.type, "help": metric.help, "values": dict(metric._values)}
+            if isinstance(metric, Histogram):
+                entry["buckets"] = list(metric.buckets)
+                entry["values"] = {k: list(v) for k, v in metric._values.items()}
+            metrics[metric.name] = entry
+    for collect in _collectors:
+        try:
+            samples = list(collect())
+        except Exception as e:
+            logger.warning(f"지표 수집 실패: {e}")
+            continue
+        for name, help, kind, labels, value in samples:
+            entry = metrics.setdefault(PREFIX + name, {"type": kind, "help": help, "values": {}})
+            entry["values"][_label_key(labels)] = value
+    return {"pid": os.getpid(), "updated_at": time.time(), "metrics": metrics}
+
+
+def flush() -> None:
+    """현재 프로세스의 스냅숏을 METRICS_DIR에 씀."""
+    if METRICS_DIR is None:
+        return
+    data = json.dumps(_snapshot(), ensure_ascii=False).encode("utf-8")
+    path = METRICS_DIR / f"{os.getpid()}.json"
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        METRICS_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"지표 스냅숏 저장 실패: {e}")
+
+
+def _flush_loop() -> None:
+    while True:
+        time.sleep(METRICS_FLUSH_INTERVAL)
+        flush()
+
+
+def _ensure_flusher() -> None:
+    """처음 기록하는 시점에 프로세스별 스냅숏 스레드 시작 (종료 시에도 한 번 씀 — 백필 등 짧은 프로세스)."""
+    global _flusher_pid
+    if METRICS_DIR is None or _flusher_pid == os.getpid():
+        return
+    with _lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+    threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True).start()
+    atexit.register(flush)
+
+
+def _reset_after_fork() -> None:
+    # fork 전 부모의 값을 자식이 다시 보고하지 않도록 초기화
+    global _flusher_pid
+    _flusher_pid = None
+    for metric in _metrics.values():
+        metric._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _load_snapshots() -> list[dict]:
+    """모든 프로세스의 스냅숏 (현재 프로세스는 방금 찍은 값). 오래된 종료 프로세스 파일은 정리."""
+    current = _snapshot()
+    snapshots = [current]
+    if METRICS_DIR is None or not METRICS_DIR.exists():
+        return snapshots
+    now = time.time()
+    for path in METRICS_DIR.glob("*.json"):
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        pid = data.get("pid")
+        if pid == current["pid"]:
+            continue
+        data["alive"] = _pid_alive(pid)
+        if not data["alive"] and now - data.get("updated_at", 0) > METRICS_RETENTION:
+            path.unlink(missing_ok=True)
+            continue
+        snapshots.append(data)
+    return snapshots
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: list) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def render() -> str:
+    """모든 프로세스를 합친 Prometheus 텍스트 형식."""
+    merged: dict[str, dict] = {}
+    for snap in _load_snapshots():
+        for name, entry in snap["metrics"].items():
+            if entry["type"] == "gauge" and not snap.get("alive", True):
+                continue
+            target = merged.setdefault(
+                name, {"type": entry["type"], "help": entry["help"], "buckets": entry.get("buckets"), "values": {}}
+            )
+            for key, value in entry["values"].items():
+                if entry["type"] == "histogram":
+                    if target["buckets"] != entry.get("buckets"):
+                        continue
+                    old = target["values"].get(key)
+                    target["values"][key] = value if old is None else [a + b for a, b in zip(old, value)]
+                else:
+                    target["values"][key] = target["values"].get(key, 0) + value
+
+    lines = []
+    for name in sorted(merged):
+        entry = merged[name]
+        lines.append(f"# HELP {name} {entry['help']}")
+        lines.append(f"# TYPE {name} {entry['type']}")
+        for key in sorted(entry["values"]):
+            labels = json.loads(key)
+            value = entry["values"][key]
+            if entry["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            for bound, count in zip(list(entry["buckets"]) + [math.inf], value[:-1]):
+                lines.append(f"{name}_bucket{_format_labels(labels + [['le', _format_value(bound)]])} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {value[-2]}")
+    return "\n".join(lines) + "\n"
+
+
+# 공통 지표 (각 모듈이 기록)
+HTTP_REQUEST_DURATION = Histogram("http_request_duration_seconds", "라우트별 요청 처리 시간")
+CRAWL_DURATION = Histogram(
+    "crawl_duration_seconds", "크롤링 단계별 시간 (list_fetch: 목록 페이지, post_fetch: 상세 페이지, parse: HTML 파싱)"
+)
+CRAWL_FETCHES = Counter("crawl_fetches_total", "페이지 요청 결과 (changed | not_modified | error)")
+CRAWL_RETRIES = Counter("crawl_retries_total", "업스트림 요청 재시도 횟수")
+OG_RENDER_DURATION = Histogram("og_render_duration_seconds", "OG 이미지 단계별 시간 (draw: 그리기, encode: PNG 인코딩)")
+CACHE_LOOKUPS = Counter("cache_lookups_total", "캐시 조회 결과 (memory: 메모리 계층 적중, store: 저장소 적중, miss)")
+SCHEDULER_JOBS = Counter("scheduler_jobs_total", "예약 작업 실행 결과 (ok | error | missed)")
+POLLER_POLLS = Counter("poller_polls_total", "게시물 폴러 확인 결과")
@@ -1,10 +1,18 @@
+import functools
+import hashlib
+import json
 import logging
+import os
+import threading
 from datetime import date
 from io import BytesIO
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
+import metrics
+from metrics import OG_RENDER_DURATION
+
 logger = logging.getLogger(__name__)
 
 IMG_WIDTH = 1200
@@ -13,6 +21,10 @@ IMG_HEIGHT = 630
 FONT_PATH = Path("static/fonts/NanumGothic.ttf")
 FONT_PATH_BOLD = Path("static/fonts/NanumGothicBold.ttf")
 
+# 시스템 폰트 탐색 결과 저장 위치. 비우면 저장하지 않음 (프로세스마다 1회 탐색)
+_FONT_INDEX = os.getenv("FONT_INDEX_PATH", "cache/font_index.json")
+FONT_INDEX_PATH = Path(_FONT_INDEX) if _FONT_INDEX else None
+
 FALLBACK_FONT_DIRS = [
     Path("/usr/share/fonts"),
     Path("/Library/Fonts"),
@@ -30,43 +42,154 @@ WHITE = (255, 255, 255)
 
 WEEKDAY_KO = ["월", "화", "수", "목", "금", "토", "일"]
 
+# 헤더에 넣는 식당 이름 (식당별 이미지는 title 인자로 지정)
+DEFAULT_TITLE = "운정교내식당"
 
-def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    """폰트 로드 (fallback 포함)."""
-    paths_to_try = []
-
-    if bold and FONT_PATH_BOLD.exists():
-        paths_to_try.append(FONT_PATH_BOLD)
-    if FONT_PATH.exists():
-        paths_to_try.append(FONT_PATH)
 
-    # 시스템 폰트 fallback
+def _scan_system_fonts() -> list[str]:
+    """시스템 폰트 디렉터리에서 한글 폰트 후보 탐색 (재귀 glob — 느림)."""
+    found = []
     for font_dir in FALLBACK_FONT_DIRS:
         if font_dir.exists():
             for suffix in ["*.ttf", "**/*.ttf", "*.otf", "**/*.otf"]:
                 for p in font_dir.glob(suffix):
                     name = p.name.lower()
                     if "nanum" in name or "gothic" in name or "malgun" in name:
-                        paths_to_try.append(p)
+                        found.append(str(p))
+    return found
+
+
+def _font_dirs_signature() -> dict[str, int]:
+    """탐색하는 모든 디렉터리(하위 포함)의 mtime. 하위 디렉터리에 폰트를 설치·삭제해도 인덱스를 다시 만들도록.
+
+    디렉터리만 훑으므로 폰트 파일 glob보다 훨씬 빠름.
+    """
+    sig = {}
+    for font_dir in FALLBACK_FONT_DIRS:
+        for root, _dirs, _files in os.walk(font_dir):
+            try:
+                sig[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                pass
+    return sig
+
+
+_system_fonts: list[str] | None = None
+_font_lock = threading.Lock()
+
+
+def _system_font_index() -> list[str]:
+    """시스템 폰트 후보 목록. 프로세스당 1회 생성하고 FONT_INDEX_PATH에 저장해 재사용."""
+    global _system_fonts
+    if _system_fonts is not None:
+        return _system_fonts
+
+    with _font_lock:
+        if _system_fonts is not None:
+            return _system_fonts
+
+        signature = _font_dirs_signature()
+        if FONT_INDEX_PATH:
+            try:
+                saved = json.loads(FONT_INDEX_PATH.read_text(encoding="utf-8"))
+                # 디렉터리 구성이 같고 저장된 폰트가 모두 남아 있을 때만 재사용
+                if saved.get("dirs") == signature and all(os.path.exists(p) for p in saved["fonts"]):
+                    _system_fonts = saved["fonts"]
+                    return _system_fonts
+            except (OSError, ValueError, KeyError):
+                pass
+
+        _system_fonts = _scan_system_fonts()
+        if FONT_INDEX_PATH:
+            try:
+                FONT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+                FONT_INDEX_PATH.write_text(json.dumps({"dirs": signature, "fonts": _system_fonts}), encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"폰트 인덱스 저장 실패: {e}")
+        return _system_fonts
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path(bold: bool) -> str | None:
+    """실제로 로드 가능한 첫 번째 한글 폰트 경로 (굵기별로 1회만 결정)."""
+    paths_to_try = []
+
+    if bold and FONT_PATH_BOLD.exists():
+        paths_to_try.append(str(FONT_PATH_BOLD))
+    if FONT_PATH.exists():
+        paths_to_try.append(str(FONT_PATH))
+
+    # 시스템 폰트 fallback
+    paths_to_try.extend(_system_font_index())
 
     for path in paths_to_try:
         try:
-            return ImageFont.truetype(str(path), size)
+            ImageFont.truetype(path, 12)
+            return path
         except Exception:
             continue
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size)
+
+
+def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """폰트 로드 (fallback 포함). (경로, 크기)별로 메모이즈되어 렌더링 중 파일 탐색 없음."""
+    path = _resolve_font_path(bold)
+    if path is None:
+        return _default_font()
+    return _truetype(path, size)
+
 
+@functools.lru_cache(maxsize=1)
+def _default_font() -> ImageFont.ImageFont:
     logger.warning("한글 폰트를 찾을 수 없습니다. 기본 폰트 사용.")
     return ImageFont.load_default()
 
 
-def _draw_gradient_background(draw: ImageDraw.Draw, width: int, height: int):
-    """세로 그라데이션 배경 그리기."""
+def check_fonts() -> dict[str, str | None]:
+    """시작 시 폰트 확인: 결정된 한글 폰트를 로그로 남기고 반환 (렌더링 전 인덱스 준비)."""
+    resolved = {"regular": _resolve_font_path(False), "bold": _resolve_font_path(True)}
+    for weight, path in resolved.items():
+        if path:
+            logger.info(f"OG 이미지 폰트 ({weight}): {path}")
+        else:
+            logger.warning(f"OG 이미지 폰트 ({weight}): 한글 폰트 없음 — 기본 폰트 사용 (글자 깨짐)")
+    return resolved
+
+
+def _gradient_background(width: int, height: int) -> Image.Image:
+    """세로 그라데이션 배경. 1px 폭 컬럼을 만든 뒤 가로로 늘림 (행마다 draw.line 호출 없음)."""
+    colors = []
     for y in range(height):
         t = y / height
         r = int(BG_COLOR_TOP[0] * (1 - t) + BG_COLOR_BOTTOM[0] * t)
         g = int(BG_COLOR_TOP[1] * (1 - t) + BG_COLOR_BOTTOM[1] * t)
         b = int(BG_COLOR_TOP[2] * (1 - t) + BG_COLOR_BOTTOM[2] * t)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+        colors.append((r, g, b))
+    column = Image.new("RGB", (1, height))
+    column.putdata(colors)
+    return column.resize((width, height), Image.Resampling.NEAREST)
+
+
+@functools.lru_cache(maxsize=16)
+def _base_canvas(title: str) -> Image.Image:
+    """식당별 OG 이미지에 공통인 배경(그라데이션, 헤더 바·텍스트, 구분선). 식당당 1회 생성."""
+    img = _gradient_background(IMG_WIDTH, IMG_HEIGHT)
+    draw = ImageDraw.Draw(img)
+
+    # 상단 헤더 바
+    draw.rectangle([(0, 0), (IMG_WIDTH, 80)], fill=ACCENT_COLOR)
+
+    # 헤더 텍스트
+    draw.text((50, 22), f"🍱 {title}", font=_load_font(32), fill=WHITE)
+
+    # 구분선
+    draw.rectangle([(50, 185), (IMG_WIDTH - 50, 188)], fill=ACCENT_COLOR)
+    return img
 
 
 def _format_date(d: date) -> str:
@@ -74,41 +197,69 @@ def _format_date(d: date) -> str:
     return f"{d.year}년 {d.month}월 {d.day}일 {weekday}요일"
 
 
-def _image_to_bytes(img: Image.Image) -> bytes:
+# 그림 내용이 바뀌는 디자인 수정 시 올림 (이전 렌더링 블롭이 재사용되지 않도록)
+RENDER_VERSION = 1
+MAX_MENU_ITEMS = 8
+
+
+def render_key(target_date: date, menu_items: list[str] | None = None, title: str = DEFAULT_TITLE) -> str:
+    """OG 이미지 블롭 key: 그림에 실제로 들어가는 입력(식당 이름 포함)의 해시. menu_items가 None이면 휴무 이미지.
+
+    PNG 인코딩 프로필은 포함하지 않음 (같은 그림이면 어느 프로필로 인코딩했든 재사용).
+    """
+    if menu_items is None:
+        inputs = ["rest", _format_date(target_date)]
+    else:
+        inputs = ["menu", _format_date(target_date), menu_items[:MAX_MENU_ITEMS], len(menu_items)]
+    raw = json.dumps([RENDER_VERSION, title, inputs], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# PNG 인코딩 프로필
+# - fast: 팔레트 변환 없이 최저 압축 (CPU 최소, 용량 큼)
+# - balanced: 256색 팔레트 + 기본 압축 (단색 위주 디자인이라 화질 차이 거의 없음)
+# - small: 팔레트 + 최대 압축 + optimize (가장 느림 — 백그라운드 사전 렌더링용)
+PNG_PROFILES = {
+    "fast": {"quantize": False, "compress_level": 1, "optimize": False},
+    "balanced": {"quantize": True, "compress_level": 6, "optimize": False},
+    "small": {"quantize": True, "compress_level": 9, "optimize": True},
+}
+PNG_PROFILE = os.getenv("OG_PNG_PROFILE", "balanced")
+
+
+def _image_to_bytes(img: Image.Image, profile: str | None = None) -> bytes:
+    options = PNG_PROFILES.get(profile or PNG_PROFILE, PNG_PROFILES["balanced"])
+    if options["quantize"]:
+        img = img.quantize(colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
     buf = BytesIO()
-    img.save(buf, format="PNG", optimize=True)
+    img.save(buf, format="PNG", compress_level=options["compress_level"], optimize=options["optimize"])
     return buf.getvalue()
 
 
-def generate_menu_image(target_date: date, menu_items: list[str]) -> bytes:
-    """날짜와 메뉴 목록을 담은 OG 이미지 생성."""
-    img = Image.new("RGB", (IMG_WIDTH, IMG_HEIGHT))
-    draw = ImageDraw.Draw(img)
+def generate_menu_image(
+    target_date: date, menu_items: list[str], profile: str | None = None, title: str = DEFAULT_TITLE
+) -> bytes:
+    """날짜와 메뉴 목록을 담은 OG 이미지 생성. profile은 PNG 인코딩 프로필 (기본 OG_PNG_PROFILE)."""
+    with metrics.timed("og_draw", OG_RENDER_DURATION, stage="draw", kind="menu"):
+        img = _draw_menu(target_date, menu_items, title)
+    with metrics.timed("og_encode", OG_RENDER_DURATION, stage="encode", kind="menu"):
+        return _image_to_bytes(img, profile)
 
-    _draw_gradient_background(draw, IMG_WIDTH, IMG_HEIGHT)
 
-    # 상단 헤더 바
-    draw.rectangle([(0, 0), (IMG_WIDTH, 80)], fill=ACCENT_COLOR)
+def _draw_menu(target_date: date, menu_items: list[str], title: str) -> Image.Image:
+    img = _base_canvas(title).copy()
+    draw = ImageDraw.Draw(img)
 
-    font_header = _load_font(32)
     font_date = _load_font(52, bold=True)
-    font_menu = _load_font(40)
     font_item = _load_font(36)
 
-    # 헤더 텍스트
-    header_text = "🍱 운정교내식당"
-    draw.text((50, 22), header_text, font=font_header, fill=WHITE)
-
     # 날짜
     date_text = _format_date(target_date)
     draw.text((50, 110), date_text, font=font_date, fill=TEXT_DARK)
 
-    # 구분선
-    draw.rectangle([(50, 185), (IMG_WIDTH - 50, 188)], fill=ACCENT_COLOR)
-
     # 메뉴 목록
     y = 210
-    max_items = 8
+    max_items = MAX_MENU_ITEMS
     line_height = 50
 
     for item in menu_items[:max_items]:
@@ -120,34 +271,29 @@ def generate_menu_image(target_date: date, menu_items: list[str]) -> bytes:
     if len(menu_items) > max_items:
         draw.text((70, y), f"  외 {len(menu_items) - max_items}가지", font=font_item, fill=TEXT_LIGHT)
 
-    return _image_to_bytes(img)
+    return img
 
 
-def generate_rest_image(target_date: date) -> bytes:
-    """휴무일 OG 이미지 생성."""
-    img = Image.new("RGB", (IMG_WIDTH, IMG_HEIGHT))
-    draw = ImageDraw.Draw(img)
+def generate_rest_image(target_date: date, profile: str | None = None, title: str = DEFAULT_TITLE) -> bytes:
+    """휴무일 OG 이미지 생성. profile은 PNG 인코딩 프로필 (기본 OG_PNG_PROFILE)."""
+    with metrics.timed("og_draw", OG_RENDER_DURATION, stage="draw", kind="rest"):
+        img = _draw_rest(target_date, title)
+    with metrics.timed("og_encode", OG_RENDER_DURATION, stage="encode", kind="rest"):
+        return _image_to_bytes(img, profile)
 
-    _draw_gradient_background(draw, IMG_WIDTH, IMG_HEIGHT)
 
-    # 상단 헤더 바
-    draw.rectangle([(0, 0), (IMG_WIDTH, 80)], fill=ACCENT_COLOR)
+def _draw_rest(target_date: date, title: str) -> Image.Image:
+    img = _base_canvas(title).copy()
+    draw = ImageDraw.Draw(img)
 
-    font_header = _load_font(32)
     font_date = _load_font(48, bold=True)
     font_msg = _load_font(64, bold=True)
     font_sub = _load_font(36)
 
-    # 헤더
-    draw.text((50, 22), "🍱 운정교내식당", font=font_header, fill=WHITE)
-
     # 날짜
     date_text = _format_date(target_date)
     draw.text((50, 110), date_text, font=font_date, fill=TEXT_DARK)
 
-    # 구분선
-    draw.rectangle([(50, 185), (IMG_WIDTH - 50, 188)], fill=ACCENT_COLOR)
-
     # 중앙 메시지
     msg = "오늘은 쉽니다 🍽️"
     bbox = draw.textbbox((0, 0), msg, font=font_msg)
@@ -159,4 +305,4 @@ def generate_rest_image(target_date: date) -> bytes:
     sub_w = bbox2[2] - bbox2[0]
     draw.text(((IMG_WIDTH - sub_w) // 2, 400), sub, font=font_sub, fill=TEXT_LIGHT)
 
-    return _image_to_bytes(img)
+    return img
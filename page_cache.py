@@ -0,0 +1,129 @@
+"""렌더링된 HTML 페이지 캐시.
+
+index/weekly 페이지는 (날짜, 메뉴, 휴무 여부, base_url)로 출력이 결정되고 주에 몇 번만 바뀌므로
+렌더링 결과와 미리 압축한 gzip/brotli 변형을 메모리에 보관합니다.
+
+무효화:
+- 같은 프로세스의 메뉴 저장은 cache의 저장 리스너로 즉시 반영 (날짜별 세대 번호)
+- 다른 프로세스의 저장은 MEMORY_CACHE_TTL 경과 후 메뉴 내용 해시 비교로 감지
+  (내용이 같은 재크롤링은 신선도만 갱신하므로 저장소 버전이 바뀌어도 페이지를 유지)
+"""
+
+import gzip
+import os
+import threading
+from dataclasses import dataclass, field
+
+import cache
+import metrics
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PAGE_CACHE_MAX_ITEMS = int(os.getenv("PAGE_CACHE_MAX_ITEMS", "256"))
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+# 미리 만들어 둘 압축 변형 (선호 순서). br은 brotli 패키지가 있을 때만
+PAGE_CACHE_ENCODINGS = [
+    enc
+    for enc in (e.strip() for e in os.getenv("PAGE_CACHE_ENCODINGS", "br,gzip").split(","))
+    if enc == "gzip" or (enc == "br" and brotli is not None)
+]
+
+IDENTITY = "identity"
+
+
+@dataclass(frozen=True)
+class Page:
+    """렌더링된 페이지와 응답 메타데이터. bodies는 {인코딩: 바이트} (identity 항상 포함)."""
+
+    bodies: dict[str, bytes]
+    etag: str
+    last_modified: float | None
+    max_age: int
+    # 렌더링에 쓴 메뉴 캐시 항목 {날짜: 항목} — 적중 시 stale 재검증에 사용
+    entries: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return sum(len(b) for b in self.bodies.values())
+
+    def negotiate(self, accept_encodings) -> str:
+        """Accept-Encoding에 맞는 변형 선택 (werkzeug Accept 객체)."""
+        for enc in PAGE_CACHE_ENCODINGS:
+            if enc in self.bodies and accept_encodings.quality(enc) > 0:
+                return enc
+        return IDENTITY
+
+
+def build(html: str, etag: str, last_modified: float | None, max_age: int,
+          entries: dict[str, dict] | None = None, compress: bool = True) -> Page:
+    body = html.encode("utf-8")
+    bodies = {IDENTITY: body}
+    if compress:
+        for enc in PAGE_CACHE_ENCODINGS:
+            with metrics.timed(f"compress_{enc}"):
+                if enc == "gzip":
+                    bodies[enc] = gzip.compress(body, compresslevel=9, mtime=0)
+                elif enc == "br":
+                    bodies[enc] = brotli.compress(body, mode=brotli.MODE_TEXT)
+    return Page(bodies, etag, last_modified, max_age, entries or {})
+
+
+_pages = cache.MemoryTier("page", PAGE_CACHE_MAX_ITEMS, PAGE_CACHE_MAX_BYTES)
+metrics.add_collector(_pages.samples)
+# 날짜별 메뉴 저장 세대 번호 (같은 프로세스 내 즉시 무효화용)
+_generations: dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+@cache.add_menu_write_listener
+def _on_menu_write(date_str: str) -> None:
+    with _generations_lock:
+        _generations[date_str] = _generations.get(date_str, 0) + 1
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """렌더링 전에 잡아 둔 의존 날짜들의 상태. 렌더링 중 저장된 메뉴를 놓치지 않기 위함."""
+
+    generations: tuple[int, ...]
+    hashes: tuple
+
+
+def _generations_of(deps: list[str]) -> tuple[int, ...]:
+    with _generations_lock:
+        return tuple(_generations.get(d, 0) for d in deps)
+
+
+def _hashes_of(deps: list[str]) -> tuple:
+    return tuple((cache.get_menu_cache_entry(d) or {}).get("hash") for d in deps)
+
+
+def snapshot(deps: list[str]) -> Snapshot:
+    """deps: 페이지가 의존하는 메뉴 캐시 날짜(isoformat) 목록."""
+    return Snapshot(_generations_of(deps), _hashes_of(deps))
+
+
+def get(key: str, deps: list[str]) -> Page | None:
+    entry = _pages.get(key, lambda: _hashes_of(deps))
+    if entry is None:
+        return None
+    page, generations = entry
+    if generations != _generations_of(deps):
+        _pages.invalidate(key)
+        return None
+    return page
+
+
+def put(key: str, page: Page, snap: Snapshot) -> None:
+    _pages.put(key, (page, snap.generations), snap.hashes, size=page.size)
+
+
+def clear() -> None:
+    _pages.clear()
+
+
+def stats() -> dict:
+    return _pages.stats()
@@ -0,0 +1,200 @@
+"""주간 게시물 적응형 폴러.
+
+고정 시각(10:50) 1회 크롤링 대신, 이번 주 게시물이 올라올 때까지 게시 시간대(평일 POLL_WINDOW_START ~
+POLL_WINDOW_END)에 백오프하며 조건부 요청으로 확인합니다.
+
+- 미게시: POLL_MIN_INTERVAL부터 미스마다 2배, POLL_MAX_INTERVAL에서 멈춤 (날마다 초기화)
+- 게시 확인: 한 번의 크롤링으로 주간 전체를 저장하고 그 주에는 폴링 중단,
+  POLL_RECHECK_INTERVAL마다 수정 여부만 재확인
+- 휴무일(business_calendar: 주말·공휴일·학교 휴무일·방학)에는 폴링하지 않음
+- 학습: 게시를 실제로 목격한 시각(요일·분)을 기록해, 같은 요일 표본이 충분하면
+  가장 이른 게시 시각 - POLL_LEARN_MARGIN 전에는 폴링하지 않음
+
+식당이 여럿이면 목록 1회 크롤링으로 모든 식당을 함께 확인하며, 어느 한 식당이라도 이번 주 게시물이
+올라오면 수집으로 봄 (같은 날 함께 게시되므로 늦은 식당은 재확인에서 수집).
+
+크롤링은 crawler의 조건부 GET(ETag/Last-Modified)을 쓰므로 변경이 없으면 요청 1~2회, 파싱 0회입니다.
+상태는 cache의 크롤러 상태 저장소에 남겨 재시작·리더 교체 후에도 이어집니다.
+"""
+
+import logging
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable
+
+import business_calendar
+import cache
+from metrics import POLLER_POLLS
+
+KST = timezone(timedelta(hours=9))
+
+POLL_WINDOW_START = time.fromisoformat(os.getenv("POLL_WINDOW_START", "08:00"))
+POLL_WINDOW_END = time.fromisoformat(os.getenv("POLL_WINDOW_END", "18:00"))
+POLL_MIN_INTERVAL = int(os.getenv("POLL_MIN_INTERVAL", "120"))
+POLL_MAX_INTERVAL = int(os.getenv("POLL_MAX_INTERVAL", "1800"))
+POLL_RECHECK_INTERVAL = int(os.getenv("POLL_RECHECK_INTERVAL", "10800"))
+# 게시 시각 학습: 같은 요일 표본 수 하한, 가장 이른 게시 시각보다 얼마나 먼저 시작할지(초), 보관 주 수
+POLL_LEARN_MIN_SAMPLES = int(os.getenv("POLL_LEARN_MIN_SAMPLES", "3"))
+POLL_LEARN_MARGIN = int(os.getenv("POLL_LEARN_MARGIN", "1800"))
+POLL_HISTORY_WEEKS = 8
+
+STATE_KEY = "poller"
+JOB_ID = "menu_poller"
+
+logger = logging.getLogger(__name__)
+
+_scheduler = None
+_crawl_week: Callable[[date], dict[str, dict | None] | None] | None = None
+
+
+def _week_monday(d: date) -> date:
+    return d - timedelta(days=d.weekday())
+
+
+def _load_state(monday: date) -> dict:
+    """이번 주 폴링 상태. 주가 바뀌면 게시 이력만 남기고 초기화."""
+    state = cache.get_crawl_state(STATE_KEY) or {}
+    if state.get("week") != monday.isoformat():
+        state = {
+            "week": monday.isoformat(),
+            "ingested_at": None,
+            "checked_at": None,
+            "polls": 0,
+            "misses": 0,
+            "misses_day": None,
+            "history": state.get("history", []),
+        }
+    return state
+
+
+def _window(day: date, state: dict) -> tuple[datetime, datetime] | None:
+    """그날의 폴링 시간대 (KST). 휴무일이면 None."""
+    if business_calendar.is_closed(day):
+        return None
+    start = datetime.combine(day, POLL_WINDOW_START, tzinfo=KST)
+    end = datetime.combine(day, POLL_WINDOW_END, tzinfo=KST)
+
+    observed = [h["minute"] for h in state.get("history", []) if h["weekday"] == day.weekday()]
+    if len(observed) >= POLL_LEARN_MIN_SAMPLES and not state.get("ingested_at"):
+        midnight = datetime.combine(day, time(), tzinfo=KST)
+        learned = midnight + timedelta(minutes=min(observed), seconds=-POLL_LEARN_MARGIN)
+        start = min(max(start, learned), end)
+    return start, end
+
+
+def _next_window_time(candidate: datetime, state: dict) -> datetime:
+    """candidate가 시간대 밖이면 다음 시간대 시작 시각으로 옮김."""
+    day = candidate.date()
+    for _ in range(14):
+        window = _window(day, state)
+        if window is not None:
+            start, end = window
+            if candidate <= end:
+                return max(candidate, start)
+        day += timedelta(days=1)
+        candidate = datetime.combine(day, time(), tzinfo=KST)
+    return candidate
+
+
+def plan_next(now: datetime, state: dict) -> datetime:
+    """다음 폴링 시각."""
+    if state.get("ingested_at"):
+        interval = POLL_RECHECK_INTERVAL
+    else:
+        misses = state["misses"] if state.get("misses_day") == now.date().isoformat() else 0
+        interval = min(POLL_MIN_INTERVAL * 2 ** misses, POLL_MAX_INTERVAL)
+    candidate = now + timedelta(seconds=interval)
+    # 다음 주로 넘어가면 새 게시물 폴링이 바로 시작되도록 주 경계에서 상태를 다시 계산
+    next_monday = datetime.combine(_week_monday(now.date()) + timedelta(days=7), time(), tzinfo=KST)
+    if candidate >= next_monday:
+        return _next_window_time(next_monday, _load_state(next_monday.date()))
+    return _next_window_time(candidate, state)
+
+
+def _covers_week(weekly: dict | None, monday: date) -> bool:
+    return bool(weekly) and any(
+        menu and _week_monday(d) == monday for d, menu in weekly.items()
+    )
+
+
+def _covered_cafeterias(results: dict[str, dict | None] | None, monday: date) -> list[str]:
+    return [slug for slug, weekly in (results or {}).items() if _covers_week(weekly, monday)]
+
+
+def poll_once(now: datetime) -> dict:
+    """한 번 폴링하고 갱신된 상태 반환. 시간대 밖이면 아무것도 하지 않음."""
+    today = now.date()
+    monday = _week_monday(today)
+    state = _load_state(monday)
+
+    window = _window(today, state)
+    if window is None or not (window[0] <= now <= window[1]):
+        return state
+
+    results = _crawl_week(today)
+    previous_check = state.get("checked_at")
+    state["checked_at"] = now.timestamp()
+
+    if state.get("ingested_at"):
+        POLLER_POLLS.inc(result="recheck")
+        logger.info(f"[폴러] {monday} 주 게시물 재확인 완료")
+        return state
+
+    state["polls"] += 1
+    covered = _covered_cafeterias(results, monday)
+    if covered:
+        POLLER_POLLS.inc(result="ingested")
+        state["ingested_at"] = now.timestamp()
+        # 게시되기 전부터 확인하고 있었던 경우만 기록 (재시작 직후 발견은 제외).
+        # 게시 시각은 (직전 확인, 지금] 사이이므로 같은 날이면 이른 쪽인 직전 확인 시각을 씀
+        if state["polls"] > 1:
+            posted = now
+            if previous_check is not None:
+                last = datetime.fromtimestamp(previous_check, KST)
+                if last.date() == today:
+                    posted = last
+            state["history"] = (state["history"] + [
+                {"week": monday.isoformat(), "weekday": today.weekday(), "minute": posted.hour * 60 + posted.minute}
+            ])[-POLL_HISTORY_WEEKS:]
+        logger.info(
+            f"[폴러] {monday} 주 게시물 수집 (식당 {len(covered)}/{len(results)}곳, 폴링 {state['polls']}회) "
+            "— 이번 주 폴링 종료"
+        )
+        return state
+
+    if state.get("misses_day") != today.isoformat():
+        state["misses_day"] = today.isoformat()
+        state["misses"] = 0
+    state["misses"] += 1
+    reason = "크롤링 오류" if results is None else "게시물 없음"
+    POLLER_POLLS.inc(result="error" if results is None else "not_posted")
+    logger.info(f"[폴러] {monday} 주 {reason} (오늘 {state['misses']}회째)")
+    return state
+
+
+def _tick() -> None:
+    now = datetime.now(KST)
+    try:
+        state = poll_once(now)
+        cache.save_crawl_state(STATE_KEY, state)
+    except Exception as e:
+        logger.warning(f"[폴러] 오류: {e}")
+        state = _load_state(_week_monday(now.date()))
+    next_run = plan_next(datetime.now(KST), state)
+    _add_job(next_run)
+    logger.info(f"[폴러] 다음 확인: {next_run:%m-%d %H:%M}")
+
+
+def start(scheduler, crawl_week: Callable[[date], dict[str, dict | None] | None]) -> None:
+    """스케줄러에 폴러 등록. 즉시 한 번 확인한 뒤 스스로 다음 실행을 예약."""
+    global _scheduler, _crawl_week
+    _scheduler = scheduler
+    _crawl_week = crawl_week
+    _add_job(datetime.now(KST))
+
+
+def _add_job(run_date: datetime) -> None:
+    # 스스로 다시 예약하는 작업이므로 늦게 실행되더라도 건너뛰면 안 됨 (misfire 허용)
+    _scheduler.add_job(
+        _tick, trigger="date", run_date=run_date, id=JOB_ID, replace_existing=True, misfire_grace_time=None
+    )
@@ -0,0 +1,127 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date
+
+import cache
+import og_image
+
+logger = logging.getLogger(__name__)
+
+
+def _default_workers() -> int:
+    # gunicorn 워커마다 풀이 따로 생기므로 코어 수를 워커 수(gunicorn.conf.py가 GUNICORN_WORKERS로 전달)로 나눔
+    server_workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+    return max(1, (os.cpu_count() or 1) // max(1, server_workers))
+
+
+# 프로세스(서버 워커)당 사전 렌더링 프로세스 수 (0이면 CPU 코어 수 ÷ gunicorn 워커 수, 최소 1)
+PRERENDER_WORKERS = int(os.getenv("PRERENDER_WORKERS", "0")) or _default_workers()
+# 백그라운드 작업이므로 느리지만 가장 작은 인코딩 사용
+PRERENDER_PNG_PROFILE = os.getenv("PRERENDER_PNG_PROFILE", "small")
+
+_process_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+# 요청 스레드를 막지 않도록 렌더링 배치 제출·수집은 별도 스레드 1개에서 처리
+_dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prerender")
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        with _pool_lock:
+            if _process_pool is None:
+                # 스레드가 도는 서버 프로세스에서 fork하지 않도록 spawn 사용
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=PRERENDER_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _process_pool
+
+
+def _render(date_str: str, menu: list[str] | None, profile: str, title: str) -> tuple[str, bytes, float]:
+    """워커 프로세스에서 실행. menu가 None이면 휴무 이미지."""
+    start = time.perf_counter()
+    target_date = date.fromisoformat(date_str)
+    if menu is None:
+        png_bytes = og_image.generate_rest_image(target_date, profile=profile, title=title)
+    else:
+        png_bytes = og_image.generate_menu_image(target_date, menu, profile=profile, title=title)
+    return date_str, png_bytes, time.perf_counter() - start
+
+
+def prerender(
+    jobs: dict[date, list[str] | None], cafeteria: str | None = None, title: str = og_image.DEFAULT_TITLE
+) -> dict[str, float]:
+    """OG 이미지를 프로세스 풀에서 병렬 렌더링하고 캐시에 저장. 날짜별 렌더링 시간(초) 반환.
+
+    jobs: {날짜: 메뉴 목록 또는 None(휴무 이미지)}
+    cafeteria: 캐시 키 접두사 (cache.menu_key), title: 이미지 헤더의 식당 이름
+    """
+    if not jobs:
+        return {}
+
+    started = time.perf_counter()
+    keys = {d.isoformat(): og_image.render_key(d, menu, title) for d, menu in jobs.items()}
+    # 같은 렌더링 입력의 블롭이 이미 있으면 인덱스만 연결 (렌더링 생략)
+    pending = {
+        d: menu for d, menu in jobs.items()
+        if cache.link_og_cache(cache.menu_key(d.isoformat(), cafeteria), keys[d.isoformat()]) is None
+    }
+
+    pool = _get_process_pool() if pending else None
+    futures = [
+        pool.submit(_render, d.isoformat(), menu, PRERENDER_PNG_PROFILE, title)
+        for d, menu in sorted(pending.items())
+    ]
+
+    timings = {}
+    for future in as_completed(futures):
+        try:
+            date_str, png_bytes, elapsed = future.result()
+        except Exception as e:
+            logger.warning(f"[사전 렌더링] 실패: {e}")
+            continue
+        cache.save_og_cache(cache.menu_key(date_str, cafeteria), keys[date_str], png_bytes)
+        timings[date_str] = elapsed
+        logger.debug(f"[사전 렌더링] {title} {date_str} {elapsed * 1000:.0f}ms ({len(png_bytes) // 1024}KB)")
+
+    logger.info(
+        f"[사전 렌더링] {len(timings)}/{len(pending)}장 완료, 재사용 {len(jobs) - len(pending)}장 "
+        f"({(time.perf_counter() - started) * 1000:.0f}ms, 워커 {PRERENDER_WORKERS})"
+    )
+    return timings
+
+
+def schedule(
+    jobs: dict[date, list[str] | None], cafeteria: str | None = None, title: str = og_image.DEFAULT_TITLE
+) -> Future | None:
+    """사전 렌더링을 백그라운드에서 시작 (호출 스레드는 기다리지 않음)."""
+    if not jobs:
+        return None
+    return _dispatcher.submit(_prerender_logged, jobs, cafeteria, title)
+
+
+def _prerender_logged(jobs: dict[date, list[str] | None], cafeteria: str | None, title: str) -> dict[str, float]:
+    try:
+        return prerender(jobs, cafeteria, title)
+    except Exception as e:
+        logger.warning(f"[사전 렌더링] 오류: {e}")
+        return {}
+
+
+def shutdown() -> None:
+    """대기 중인 사전 렌더링을 마치고 렌더링 프로세스 풀을 종료. 이후에는 schedule()을 쓸 수 없음.
+
+    작업 디렉터리를 떠나기 전(벤치마크의 임시 디렉터리 등)에 호출해, spawn된 워커가 사라진 경로에서
+    시작하지 않도록 함.
+    """
+    global _process_pool
+    _dispatcher.shutdown(wait=True)
+    with _pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
@@ -0,0 +1,58 @@
+"""게시판의 지난 주간식단 게시물을 모두 찾아 메뉴 캐시에 채웁니다 (backfill.py 참고).
+
+중단(Ctrl+C, 요청 실패)되어도 다시 실행하면 체크포인트부터 이어서 진행합니다.
+로컬 스텁 서버에 대고 실행하려면 --target-url에 bench/stub_site.py가 출력한 URL을 넘기세요.
+
+    uv run python scripts/backfill.py [--since 2025-03-01] [--max-pages N] [--concurrency 4] [--rate 2]
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import backfill  # noqa: E402
+import crawler  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="이 날짜 이전 주는 가져오지 않음")
+    parser.add_argument("--max-pages", type=int, default=None, help="이번 실행에서 가져올 목록 페이지 수 상한")
+    parser.add_argument("--concurrency", type=int, default=backfill.BACKFILL_CONCURRENCY, help="상세 페이지 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=backfill.BACKFILL_RATE, help="초당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--target-url", default=None, help="게시판 목록 URL (기본: TARGET_URL)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    if args.target_url:
+        crawler.TARGET_URL = args.target_url
+
+    try:
+        summary = backfill.run(
+            since=args.since,
+            max_pages=args.max_pages,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            restart=args.restart,
+        )
+    except crawler.CrawlError as e:
+        print(f"중단: {e} — 다시 실행하면 이어서 진행합니다.")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("중단됨 — 다시 실행하면 이어서 진행합니다.")
+        sys.exit(130)
+
+    state = "완료" if summary["complete"] else "일부 완료 (다시 실행하면 이어서 진행)"
+    print(f"백필 {state}: 목록 {summary['pages']}페이지, 게시물 {summary['posts']}건, {summary['days']}일 저장, 실패 {summary['failed']}건")
+
+
+if __name__ == "__main__":
+    main()
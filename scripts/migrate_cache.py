@@ -0,0 +1,25 @@
+"""기존 파일 캐시(cache/menu, cache/og, cache/negative)를 SQLite DB로 일괄 이전합니다.
+
+이전 후 .env에 CACHE_BACKEND=sqlite 를 설정하면 SQLite 백엔드를 사용합니다.
+기존 파일은 삭제하지 않으므로 CACHE_BACKEND=file 로 언제든 되돌릴 수 있습니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+import cache  # noqa: E402
+
+
+def main():
+    counts = cache.migrate_file_cache_to_sqlite()
+    print(f"마이그레이션 완료: {cache.CACHE_DB_PATH}")
+    print(f"  메뉴 {counts['menu']}건, OG 이미지 {counts['og']}건, 크롤링 메타 {counts['meta']}건")
+
+
+if __name__ == "__main__":
+    main()
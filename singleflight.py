@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 단위만 동작
+    fcntl = None
+
+LOCK_DIR = Path("cache/locks")
+LOCK_BUCKETS = 256
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+_calls: dict[str, _Call] = {}
+_calls_lock = threading.Lock()
+
+
+def do(key: str, fn: Callable[[], T], recheck: Callable[[], T | None] | None = None) -> T:
+    """같은 key의 동시 호출을 1회 실행으로 합침.
+
+    - 같은 프로세스: 첫 호출(리더)만 fn 실행, 나머지 스레드는 대기 후 결과 공유
+    - 여러 프로세스: cache/ 볼륨의 파일 잠금으로 직렬화. 다른 프로세스가 작업 중이었으면
+      잠금 획득 후 recheck()로 그 결과(캐시)를 먼저 확인하고, 있으면 fn을 건너뜀
+    """
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _calls[key] = _Call()
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = _run_locked(key, fn, recheck)
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _calls_lock:
+            _calls.pop(key, None)
+        call.done.set()
+
+
+def _lock_path(key: str) -> Path:
+    # key마다 파일을 만들면 무한히 늘어나므로 고정 개수 버킷으로 분산
+    bucket = int(hashlib.sha1(key.encode("utf-8")).hexdigest(), 16) % LOCK_BUCKETS
+    return LOCK_DIR / f"{bucket:02x}.lock"
+
+
+def _run_locked(key: str, fn: Callable[[], T], recheck: Callable[[], T | None] | None) -> T:
+    if fcntl is None:
+        return fn()
+
+    try:
+        LOCK_DIR.mkdir(parents=True, exist_ok=True)
+        f = open(_lock_path(key), "a+")
+    except OSError as e:
+        logger.warning(f"잠금 파일 열기 실패 ({key}): {e}")
+        return fn()
+
+    with f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info(f"다른 프로세스 작업 대기: {key}")
+            fcntl.flock(f, fcntl.LOCK_EX)
+            if recheck is not None:
+                result = recheck()
+                if result is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+                    return result
+        try:
+            return fn()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
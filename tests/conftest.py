@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+# 모듈 설정은 import 시점에 환경 변수에서 읽으므로 앱을 불러오기 전에 지정 (예약 작업·지표 파일 끔)
+os.environ.update(SCHEDULER_ENABLED="false", METRICS_DIR="", TARGET_URL="http://127.0.0.1:9/unused")
+
+
+@pytest.fixture
+def app_module(monkeypatch, tmp_path):
+    """빈 캐시 디렉터리에서 쓰는 app 모듈 (logs/, cache/는 tmp_path 아래)."""
+    monkeypatch.chdir(tmp_path)
+    import app
+    import cache
+    import page_cache
+
+    monkeypatch.setattr(cache, "_store", None)
+    cache._menu_memory.clear()
+    cache._og_memory.clear()
+    page_cache.clear()
+    return app
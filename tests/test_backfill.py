@@ -0,0 +1,58 @@
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+import backfill
+import cache
+import crawler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bench"))
+import stub_site  # noqa: E402
+
+# 2025-11-10 주부터 2026-01-12 주까지 10주 (2025-12-29 주가 연도 경계에 걸침)
+LATEST = date(2026, 1, 12)
+WEEKS = 10
+CAFETERIAS = {"unjeong": "운정교내식당", "sujeong": "수정캠퍼스 학생식당"}
+
+
+@pytest.fixture
+def board(monkeypatch, tmp_path):
+    """빈 캐시에서 스텁 게시판을 대상으로 하는 크롤러 설정. 스텁 서버의 요청 집계(Faults) 반환."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache, "_store", None)
+    cache._menu_memory.clear()
+    server, url = stub_site.serve(weeks=WEEKS, latest=LATEST)
+    monkeypatch.setattr(crawler, "TARGET_URL", url)
+    monkeypatch.setattr(crawler, "CAFETERIAS", CAFETERIAS)
+    monkeypatch.setattr(crawler, "DEFAULT_CAFETERIA", "unjeong")
+    yield server.faults
+    server.shutdown()
+    cache._menu_memory.clear()
+
+
+def _weekdays() -> set[date]:
+    first = LATEST - timedelta(weeks=WEEKS - 1)
+    return {first + timedelta(weeks=w, days=i) for w in range(WEEKS) for i in range(5)}
+
+
+def test_backfill_across_year_boundary(board):
+    summary = backfill.run(rate=0)
+    assert summary["complete"] == 1
+    assert summary["posts"] == WEEKS * len(CAFETERIAS)
+    assert summary["failed"] == 0
+
+    start, end = LATEST - timedelta(weeks=WEEKS), LATEST + timedelta(days=7)
+    expected = _weekdays()
+    assert {date(2025, 12, 31), date(2026, 1, 2)} <= expected
+    for slug in CAFETERIAS:
+        stored = cache.get_menu_cache_range(start, end, crawler.cache_namespace(slug))
+        assert set(stored) == expected, slug
+
+    # 다시 실행하면 체크포인트를 이어 받아 1페이지만 확인하고 게시물은 다시 가져오지 않음
+    board.reset()
+    summary = backfill.run(rate=0)
+    assert summary["complete"] == 1
+    assert (summary["pages"], summary["posts"]) == (1, 0)
+    assert board.hits["post"] == 0
@@ -0,0 +1,38 @@
+from datetime import date
+
+import pytest
+
+import business_calendar
+
+
+@pytest.fixture(autouse=True)
+def calendar(monkeypatch, tmp_path):
+    # 저장소의 closures.json과 이전 테스트에서 만든 연도 달력을 쓰지 않도록
+    monkeypatch.setattr(business_calendar, "CLOSURES_FILE", tmp_path / "closures.json")
+    monkeypatch.setattr(business_calendar, "_closures", None)
+    business_calendar._year.cache_clear()
+    yield
+    business_calendar._year.cache_clear()
+
+
+@pytest.mark.parametrize("year", [1, 9999])
+def test_edge_years(year):
+    # 9999년: 마지막 주말 다음 주로 넘어가며 date.max를 넘지 않아야 함 (OverflowError)
+    days = business_calendar._build_year(year, {})
+    first, last = date(year, 1, 1), date(year, 12, 31)
+    weekends = {d for d in days if days[d] == business_calendar.WEEKEND}
+    assert weekends and all(first <= d <= last and d.weekday() >= 5 for d in weekends)
+    assert len(weekends) in (104, 105, 106)
+
+
+def test_last_day():
+    assert business_calendar.is_closed(date(9999, 12, 31)) is False  # 금요일
+    assert business_calendar.closure_reason(date(9999, 12, 25)) == business_calendar.WEEKEND
+
+
+def test_year_cache_is_bounded():
+    # 임의의 날짜 조회로 연도 달력이 무한히 쌓이지 않아야 함
+    for year in range(2000, 2100):
+        business_calendar.is_closed(date(year, 6, 1))
+    assert business_calendar._year.cache_info().currsize == business_calendar.CALENDAR_CACHE_YEARS
+    assert business_calendar.closure_reason(date(2026, 1, 3)) == business_calendar.WEEKEND  # 토요일
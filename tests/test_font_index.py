@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import og_image
+
+
+@pytest.fixture
+def fonts(monkeypatch, tmp_path):
+    """빈 시스템 폰트 디렉터리(하위 디렉터리 포함)와 인덱스 파일."""
+    root = tmp_path / "fonts"
+    (root / "truetype" / "nanum").mkdir(parents=True)
+    monkeypatch.setattr(og_image, "FALLBACK_FONT_DIRS", [root])
+    monkeypatch.setattr(og_image, "FONT_INDEX_PATH", tmp_path / "font_index.json")
+    monkeypatch.setattr(og_image, "_system_fonts", None)
+    return root / "truetype" / "nanum"
+
+
+def _reload() -> list[str]:
+    # 새 프로세스처럼 메모리의 목록을 버리고 인덱스 파일부터 다시 읽음
+    og_image._system_fonts = None
+    return og_image._system_font_index()
+
+
+def _touch(path, mtime_ns: int) -> None:
+    path.write_bytes(b"")
+    os.utime(path.parent, ns=(mtime_ns, mtime_ns))
+
+
+def test_font_added_in_subdirectory_rebuilds_index(fonts):
+    first = fonts / "NanumGothic.ttf"
+    _touch(first, 1_000_000_000)
+    assert _reload() == [str(first)]
+
+    # 최상위 디렉터리의 mtime은 그대로, 하위 디렉터리에만 폰트 추가
+    second = fonts / "NanumGothicBold.ttf"
+    _touch(second, 2_000_000_000)
+    assert sorted(_reload()) == sorted([str(first), str(second)])
+
+
+def test_removed_font_rebuilds_index(fonts):
+    font = fonts / "NanumGothic.ttf"
+    _touch(font, 1_000_000_000)
+    assert _reload() == [str(font)]
+
+    font.unlink()
+    os.utime(fonts, ns=(1_000_000_000, 1_000_000_000))  # 디렉터리 mtime이 그대로여도 없는 경로는 버림
+    assert _reload() == []
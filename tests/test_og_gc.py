@@ -0,0 +1,50 @@
+import time
+from datetime import date
+
+import pytest
+
+import cache
+
+KEEP_FROM = date(2026, 10, 12)
+DAYS = ["2026-09-01", "2026-09-02", "2026-09-03"]
+
+
+@pytest.fixture(autouse=True, params=["file", "sqlite"])
+def store(request, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache, "CACHE_BACKEND", request.param)
+    monkeypatch.setattr(cache, "_store", None)
+    monkeypatch.setattr(cache, "OG_TOUCH_INTERVAL", 0)
+    monkeypatch.setattr(cache, "_og_touched", {})
+    cache._og_memory.clear()
+    yield
+    cache._og_memory.clear()
+
+
+def test_gc_evicts_least_recently_used(monkeypatch):
+    for i, day in enumerate(DAYS):
+        cache.save_og_cache(day, f"blob{i}", bytes([i]) * 100)
+        time.sleep(0.01)
+    # 가장 지난 날짜를 다시 조회하면 두 번째 날짜가 가장 오래 안 쓰인 항목
+    cache._og_memory.clear()
+    assert cache.get_og_cache(DAYS[0], "blob0") is not None
+
+    monkeypatch.setattr(cache, "OG_CACHE_MAX_BYTES", 250)
+    assert cache.gc_og_cache(KEEP_FROM)["evicted"] == 1
+    assert cache.has_og_cache(DAYS[0], "blob0")
+    assert not cache.has_og_cache(DAYS[1], "blob1")
+    assert cache.has_og_cache(DAYS[2], "blob2")
+
+
+def test_gc_keeps_current_week(monkeypatch):
+    cache.save_og_cache(KEEP_FROM.isoformat(), "current", b"c" * 100)
+    cache.save_og_cache(DAYS[0], "past", b"p" * 100)
+    time.sleep(0.01)
+    cache._og_memory.clear()
+    assert cache.get_og_cache(DAYS[0], "past") is not None
+
+    # 최근에 쓰인 지난 날짜라도 이번 주 항목 대신 축출
+    monkeypatch.setattr(cache, "OG_CACHE_MAX_BYTES", 150)
+    assert cache.gc_og_cache(KEEP_FROM)["evicted"] == 1
+    assert cache.has_og_cache(KEEP_FROM.isoformat(), "current")
+    assert not cache.has_og_cache(DAYS[0], "past")
@@ -0,0 +1,34 @@
+import og_image
+
+
+def _fail_render(*args, **kwargs):
+    raise AssertionError("렌더링하면 안 됨")
+
+
+def test_matching_etag_skips_render(app_module, monkeypatch):
+    day = app_module.today_kst()
+    menu = ["흑미밥", "된장찌개", "제육볶음"]
+    monkeypatch.setattr(app_module, "_get_menu", lambda d, cafeteria: menu)
+    monkeypatch.setattr(og_image, "generate_menu_image", _fail_render)
+    monkeypatch.setattr(app_module.cache, "get_og_cache_entry", _fail_render)
+
+    etag = og_image.render_key(day, menu, app_module.crawler.CAFETERIAS[app_module.crawler.DEFAULT_CAFETERIA])[:20]
+    resp = app_module.app.test_client().get(f"/og-image/{day.isoformat()}.png", headers={"If-None-Match": f'W/"{etag}"'})
+
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == f'W/"{etag}"'
+
+
+def test_stale_etag_renders(app_module, monkeypatch):
+    day = app_module.today_kst()
+    menu = ["흑미밥", "된장찌개", "제육볶음"]
+    calls = []
+    render = og_image.generate_menu_image
+    monkeypatch.setattr(app_module, "_get_menu", lambda d, cafeteria: menu)
+    monkeypatch.setattr(og_image, "generate_menu_image", lambda *a, **kw: calls.append(a) or render(*a, **kw))
+
+    resp = app_module.app.test_client().get(f"/og-image/{day.isoformat()}.png", headers={"If-None-Match": '"old"'})
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "image/png" and resp.data.startswith(b"\x89PNG")
+    assert len(calls) == 1
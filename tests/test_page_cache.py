@@ -0,0 +1,69 @@
+import time
+from datetime import date
+
+import pytest
+
+import cache
+import page_cache
+
+DAY = date(2026, 10, 12)
+KEY = DAY.isoformat()
+
+
+@pytest.fixture(autouse=True, params=["file", "sqlite"])
+def store(request, monkeypatch, tmp_path):
+    # 빈 캐시, 메모리 계층은 매번 저장소와 재검증 (다른 프로세스의 쓰기와 같은 조건)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache, "CACHE_BACKEND", request.param)
+    monkeypatch.setattr(cache, "_store", None)
+    monkeypatch.setattr(cache, "MEMORY_CACHE_TTL", 0)
+    _clear_memory()
+    yield
+    _clear_memory()
+
+
+def _clear_memory() -> None:
+    cache._menu_memory.clear()
+    cache._og_memory.clear()
+    page_cache.clear()
+
+
+def _cache_page(menu: list[str]) -> None:
+    snap = page_cache.snapshot([KEY])
+    page_cache.put("index", page_cache.build(", ".join(menu), "etag", None, 60, compress=False), snap)
+
+
+def test_unchanged_recrawl_keeps_page():
+    menu = ["흑미밥", "된장찌개"]
+    cache.save_weekly_menu_cache({DAY: menu})
+    _cache_page(menu)
+    assert page_cache.get("index", [KEY]) is not None
+
+    time.sleep(0.01)  # 저장소 버전(파일 mtime_ns, SQLite updated_at)이 바뀌도록
+    assert cache.save_weekly_menu_cache({DAY: menu}) == {}
+    assert page_cache.get("index", [KEY]) is not None
+    assert not cache.is_menu_cache_stale(cache.get_menu_cache_entry(KEY))
+
+
+def test_changed_recrawl_drops_page():
+    cache.save_weekly_menu_cache({DAY: ["흑미밥", "된장찌개"]})
+    _cache_page(["흑미밥", "된장찌개"])
+
+    time.sleep(0.01)
+    assert DAY in cache.save_weekly_menu_cache({DAY: ["흑미밥", "김치찌개"]})
+    assert page_cache.get("index", [KEY]) is None
+
+
+def test_emptied_day_drops_menu_and_page():
+    menu = ["흑미밥", "된장찌개"]
+    cache.save_weekly_menu_cache({DAY: menu})
+    old_hash = cache.get_menu_cache_entry(KEY)["hash"]
+    _cache_page(menu)
+
+    time.sleep(0.01)
+    # 정정 게시물에서 메뉴가 빠진 날짜: 저장된 메뉴를 지우고 바뀐 날짜로 보고
+    assert cache.save_weekly_menu_cache({DAY: []}) == {DAY: old_hash}
+    assert cache.get_menu_cache_entry(KEY) is None
+    assert page_cache.get("index", [KEY]) is None
+    # 처음부터 비어 있던 날짜는 바뀐 것이 아님
+    assert cache.save_weekly_menu_cache({DAY: []}) == {}
@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+import crawler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bench"))
+import bench_parse  # noqa: E402
+
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def parser(request, monkeypatch):
+    """crawler가 쓸 HTML 파서. lxml은 설치되어 있을 때만 (pyproject의 lxml extra)."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(crawler, "HTML_PARSER", request.param)
+    # 기준 구현은 상대 링크를 BASE_DOMAIN에 붙이므로 실제 게시판 주소 기준으로 비교
+    monkeypatch.setattr(crawler, "TARGET_URL", crawler.BASE_DOMAIN + "/main_kor/11095/subview.do")
+    return request.param
+
+
+def _fixture(name: str) -> str:
+    return (bench_parse.FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_post_urls_match_reference(parser):
+    html = _fixture("list.html")
+    expected = bench_parse.reference_post_urls(html)
+    assert expected
+    assert crawler.find_post_urls(html) == expected
+
+
+def test_weekly_table_matches_reference(parser):
+    html = _fixture("post.html")
+    expected = bench_parse.reference_weekly(html, bench_parse.REF_YEAR)
+    assert expected
+    assert crawler.parse_weekly_html(html, bench_parse.REF_YEAR) == expected